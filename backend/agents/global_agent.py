@@ -1,21 +1,38 @@
-from typing import List, Dict, Optional
+import asyncio
+import os
+from typing import List, Dict, Optional, Union
 from agents.regional_agent import RegionalAgent
 from beckn_models import ComputeJob, BecknCatalog, BecknItem, OrderState, BecknOrder
-from beckn_client import BecknClient
+from beckn_client import get_beckn_client
+from discovery_service import get_discovery_service
+from job_queue import JobQueue
+from placement_solver import placement_costs, solve_placement
 from datetime import datetime
-from llm_client import LLMClient
+from llm_client import get_llm_client, run_async
+
+DEFAULT_PLACEMENT_CONCURRENCY = 32
+DEFAULT_SOLVER_MAX_BATCH = 512
 
 class GlobalAgent:
     def __init__(self):
         self.regional_agents: List[RegionalAgent] = []
-        self.task_queue: List[ComputeJob] = []
+        self.task_queue = JobQueue()  # Ordered by priority, then deadline, then arrival
         self.all_jobs: Dict[str, ComputeJob] = {} # Track all jobs centrally
         self.logs = []
-        self.beckn_client = BecknClient()
-        self.llm_client = LLMClient()
+        self.beckn_client = get_beckn_client()
+        self.llm_client = get_llm_client()
         self.job_history = [] # Track recent assignments for LLM context
         self.cached_discovery_result = None
         self.last_discovery_time = None
+        # Run queued jobs' Beckn lifecycles concurrently instead of one at a time
+        self.async_placement = os.environ.get("BECKN_ASYNC_PLACEMENT", "true").lower() == "true"
+        self.placement_concurrency = int(os.environ.get("PLACEMENT_CONCURRENCY", DEFAULT_PLACEMENT_CONCURRENCY))
+        # Group jobs bound for the same provider into one multi-item Beckn order
+        self.batch_orders = os.environ.get("BECKN_BATCH_ORDERS", "false").lower() == "true"
+        # Place a backlog with one min-cost assignment over all local agents instead of greedy per-job passes
+        self.solver_placement = os.environ.get("PLACEMENT_SOLVER", "true").lower() == "true"
+        # Each cycle solves at most this many of the most urgent jobs (the solve is O(jobs^2 * agents))
+        self.solver_max_batch = int(os.environ.get("PLACEMENT_SOLVER_MAX_BATCH", DEFAULT_SOLVER_MAX_BATCH))
 
     def register_regional_agent(self, agent: RegionalAgent):
         self.regional_agents.append(agent)
@@ -27,7 +44,7 @@ class GlobalAgent:
         else:
             job = task
             
-        self.task_queue.append(job)
+        self.task_queue.push(job)
         self.all_jobs[job.job_id] = job
         self.log_event(f"Job {job.job_id} added to global queue.")
 
@@ -48,12 +65,10 @@ class GlobalAgent:
         
         print(f"\n[GLOBAL] Processing {len(self.task_queue)} jobs in queue")
 
-        jobs_to_requeue = []
-
         # STEP 1: DISCOVER - Find available grid windows across all locations
         self.log_event("Starting Beckn discovery for available grid windows...")
         try:
-            discovery_result = self.beckn_client.discover()
+            discovery_result = get_discovery_service(self.beckn_client).discover()
             
             # Distribute discovery results to all regions
             for region in self.regional_agents:
@@ -70,90 +85,257 @@ class GlobalAgent:
             # If discovery fails, we can't proceed with job assignment
             return
 
-        # Process each job in queue - SORT BY PRIORITY AND DEADLINE
+        # Process each job in queue - BY PRIORITY AND DEADLINE
         # Higher priority (5 > 1) and sooner deadlines first
-        self.task_queue.sort(key=lambda j: (
-            -j.priority,  # Negative for descending (higher priority first)
-            j.must_start_by if j.must_start_by else datetime.max  # Earlier deadlines first
-        ))
-
-        while self.task_queue:
-            job = self.task_queue.pop(0)
-            assigned = False
+        if self.batch_orders and len(self.task_queue) > 1:
+            jobs = self.task_queue.drain()
+            outcomes = self._place_jobs_batched(jobs)
+        elif self.solver_placement:
+            # Only as many jobs as can be placed this cycle leave the queue
+            jobs = self.task_queue.pop_n(self._solver_batch_size())
+            outcomes = self._place_jobs_solved(jobs)
+        else:
+            jobs = self.task_queue.drain()
+            if self.async_placement and len(jobs) > 1:
+                outcomes = run_async(self._place_jobs_async(jobs))
+            else:
+                outcomes = [self._place_job(job) for job in jobs]
+        
+        jobs_to_requeue = [job for job, outcome in zip(jobs, outcomes) if outcome == "requeue"]
+
+        # Re-queue jobs that couldn't be assigned
+        for job in jobs_to_requeue:
+            self.task_queue.push(job)
+        
+        if jobs_to_requeue:
+            self.log_event(f"Re-queued {len(jobs_to_requeue)} jobs for next cycle.")
+
+    def _place_job(self, job: ComputeJob) -> str:
+        """
+        Places one job: deadline check, region selection and regional assignment.
+        
+        Returns:
+            "assigned", "failed" (deadline missed) or "requeue"
+        """
+        region = self._begin_placement(job)
+        if isinstance(region, str):
+            return region
+        
+        try:
+            success = region.assign_job(job)
+        except Exception as e:
+            self.log_event(f"Error assigning job {job.job_id[:8]} to region: {e}")
+            return "requeue"
+        return self._finish_placement(job, region, success)
+
+    async def _place_job_async(self, job: ComputeJob, limit: asyncio.Semaphore) -> str:
+        """
+        Async variant of _place_job(); at most placement_concurrency jobs are in flight.
+        """
+        async with limit:
+            region = self._begin_placement(job)
+            if isinstance(region, str):
+                return region
             
-            # Check if deadline has passed
-            now = datetime.now()
-            if job.must_start_by and now > job.must_start_by:
-                self.log_event(
-                    f"⚠ Job {job.job_id[:8]} (Priority {job.priority}) MISSED DEADLINE - "
-                    f"was due {job.must_start_by.strftime('%H:%M:%S')}, now {now.strftime('%H:%M:%S')}"
-                )
-                job.status = "FAILED"
+            try:
+                success = await region.assign_job_async(job)
+            except Exception as e:
+                self.log_event(f"Error assigning job {job.job_id[:8]} to region: {e!r}")
+                return "requeue"
+            return self._finish_placement(job, region, success)
+
+    async def _place_jobs_async(self, jobs: List[ComputeJob]) -> List[str]:
+        """
+        Runs placements concurrently. Jobs start in queue order, so higher-priority
+        jobs still pick (and reserve) capacity first.
+        """
+        limit = asyncio.Semaphore(self.placement_concurrency)
+        return await asyncio.gather(*(self._place_job_async(job, limit) for job in jobs))
+
+    def _place_jobs_batched(self, jobs: List[ComputeJob]) -> List[str]:
+        """
+        Selects a region per job, then hands each region its jobs in one call so
+        jobs landing on the same provider share a single Beckn order.
+        
+        Returns:
+            Per-job outcome, in queue order
+        """
+        outcomes: List[Optional[str]] = [None] * len(jobs)
+        by_region: Dict[int, List[int]] = {}
+        regions: Dict[int, RegionalAgent] = {}
+        
+        for i, job in enumerate(jobs):
+            region = self._begin_placement(job)
+            if isinstance(region, str):
+                outcomes[i] = region
                 continue
+            regions[id(region)] = region
+            by_region.setdefault(id(region), []).append(i)
+        
+        for key, indices in by_region.items():
+            region = regions[key]
+            region_jobs = [jobs[i] for i in indices]
+            try:
+                results = region.assign_jobs_batch(region_jobs)
+            except Exception as e:
+                self.log_event(f"Error assigning batch of {len(region_jobs)} jobs to region {region.region}: {e}")
+                results = [False] * len(region_jobs)
+            for i, success in zip(indices, results):
+                outcomes[i] = self._finish_placement(jobs[i], region, success)
+        
+        return outcomes
+
+    def _place_jobs_solved(self, jobs: List[ComputeJob]) -> List[str]:
+        """
+        Places a batch of jobs with one capacity-constrained min-cost assignment
+        across every local agent (see placement_solver), then places each job on
+        its chosen agent through its region's regular path, so hedging, fallbacks
+        and cost-threshold deferral apply as for any other placement. Lifecycles
+        run concurrently. Jobs the solver leaves unplaced, or whose placement
+        fails, are re-queued for the next cycle.
+        
+        Returns:
+            Per-job outcome, in queue order
+        """
+        outcomes: List[Optional[str]] = [None] * len(jobs)
+        pending = []
+        for i, job in enumerate(jobs):
+            if self._check_deadline(job):
+                pending.append(i)
+            else:
+                outcomes[i] = "failed"
+        
+        sites = [(region, agent) for region in self.regional_agents for agent in region.local_agents]
+        costs, capacities, defer_costs = placement_costs(
+            [jobs[i] for i in pending], [(agent, region.cost_threshold) for region, agent in sites]
+        )
+        assignment = solve_placement(costs, capacities, defer_costs)
+        
+        placements = []
+        for i, site in zip(pending, assignment):
+            if site < 0:
+                self.log_event(f"Job {jobs[i].job_id[:8]} deferred - no site under the cost threshold with capacity.")
+                outcomes[i] = "requeue"
+            else:
+                placements.append((i, *sites[site]))
+        placed_cost = sum(costs[k, site] for k, site in enumerate(assignment) if site >= 0)
+        self.log_event(
+            f"Placement solver: {len(placements)} of {len(pending)} jobs placed across {len(sites)} sites "
+            f"(total cost {placed_cost:.1f})"
+        )
+        
+        async def run_placements():
+            limit = asyncio.Semaphore(self.placement_concurrency)
             
-            # Calculate time remaining until deadline
-            time_remaining_str = ""
-            if job.must_start_by:
-                time_remaining = (job.must_start_by - now).total_seconds() / 3600  # hours
-                time_remaining_str = f", {time_remaining:.1f}h until deadline"
-            
+            async def place(job: ComputeJob, region: RegionalAgent, agent):
+                async with limit:
+                    return await region.assign_job_async(job, preferred=agent)
+            return await asyncio.gather(
+                *(place(jobs[i], region, agent) for i, region, agent in placements), return_exceptions=True
+            )
+        
+        results = run_async(run_placements()) if placements else []
+        for (i, region, agent), success in zip(placements, results):
+            if isinstance(success, Exception):
+                self.log_event(f"Error assigning job {jobs[i].job_id[:8]} to {agent.name}: {success!r}")
+                success = False
+            outcomes[i] = self._finish_placement(jobs[i], region, success)
+        
+        return outcomes
+
+    def _solver_batch_size(self) -> int:
+        """
+        How many queued jobs the solver takes this cycle: one per free slot
+        across all local agents, at most solver_max_batch.
+        """
+        free_slots = sum(
+            max(0, agent.available_capacity) for region in self.regional_agents for agent in region.local_agents
+        )
+        batch_size = min(free_slots, self.solver_max_batch)
+        if len(self.task_queue) > batch_size:
             self.log_event(
-                f"Processing job {job.job_id[:8]} (Priority {job.priority}{time_remaining_str}, runtime: {job.estimated_runtime_hrs}h)"
+                f"Placement solver: {len(self.task_queue) - batch_size} less urgent jobs wait in the queue "
+                f"({free_slots} free slots)"
             )
-            
-            
-            # STEP 2: SELECT REGION BY SCORE
-            # Find region with lowest average score
-            region_scores = []
-            for region in self.regional_agents:
-                report = region.get_report()
-                avg_score = report.get('average_score', float('inf'))
-                region_scores.append({
-                    'region': region,
-                    'average_score': avg_score
-                })
-            
-            # Sort by average score (lowest is best)
-            region_scores.sort(key=lambda x: x['average_score'])
-            
-            if not region_scores:
-                jobs_to_requeue.append(job)
-                self.log_event(f"Job {job.job_id[:8]} deferred - No regions available.")
-                continue
-            
-            best_region = region_scores[0]['region']
-            
+        return batch_size
+
+    def _check_deadline(self, job: ComputeJob) -> bool:
+        """
+        Fails a job whose must_start_by has passed and logs the job being processed.
+        
+        Returns:
+            True if the job can still be placed
+        """
+        # Check if deadline has passed
+        now = datetime.now()
+        if job.must_start_by and now > job.must_start_by:
             self.log_event(
-                f"Assigning job {job.job_id[:8]} (Priority {job.priority}) to region {best_region.region} "
-                f"(avg score: {region_scores[0]['average_score']:.1f})"
+                f"⚠ Job {job.job_id[:8]} (Priority {job.priority}) MISSED DEADLINE - "
+                f"was due {job.must_start_by.strftime('%H:%M:%S')}, now {now.strftime('%H:%M:%S')}"
             )
-            
-            # STEP 3: ASSIGN TO REGIONAL AGENT
-            try:
-                success = best_region.assign_job(job)
-                
-                if success:
-                    self.log_event(
-                        f"✓ Job {job.job_id[:8]} (Priority {job.priority}) successfully assigned to region {best_region.region}"
-                    )
-                    job.status = "ASSIGNED"
-                    assigned = True
-                else:
-                    self.log_event(
-                        f"✗ Job {job.job_id[:8]} (Priority {job.priority}) failed to assign to region {best_region.region}"
-                    )
-            except Exception as e:
-                self.log_event(f"Error assigning job {job.job_id[:8]} to region: {e}")
-            
-            
-            if not assigned:
-                jobs_to_requeue.append(job)
+            job.status = "FAILED"
+            return False
+        
+        # Calculate time remaining until deadline
+        time_remaining_str = ""
+        if job.must_start_by:
+            time_remaining = (job.must_start_by - now).total_seconds() / 3600  # hours
+            time_remaining_str = f", {time_remaining:.1f}h until deadline"
+        
+        self.log_event(
+            f"Processing job {job.job_id[:8]} (Priority {job.priority}{time_remaining_str}, runtime: {job.estimated_runtime_hrs}h)"
+        )
+        return True
 
-        # Re-queue jobs that couldn't be assigned
-        self.task_queue.extend(jobs_to_requeue)
+    def _begin_placement(self, job: ComputeJob) -> Union[RegionalAgent, str]:
+        """
+        Checks the job's deadline and selects the best region.
         
-        if jobs_to_requeue:
-            self.log_event(f"Re-queued {len(jobs_to_requeue)} jobs for next cycle.")
+        Returns:
+            The region to assign to, or an outcome string if the job can't be placed now
+        """
+        if not self._check_deadline(job):
+            return "failed"
+        
+        # STEP 2: SELECT REGION BY SCORE
+        # Find region with lowest average score
+        region_scores = []
+        for region in self.regional_agents:
+            report = region.get_report()
+            avg_score = report.get('average_score', float('inf'))
+            region_scores.append({
+                'region': region,
+                'average_score': avg_score
+            })
+        
+        # Sort by average score (lowest is best)
+        region_scores.sort(key=lambda x: x['average_score'])
+        
+        if not region_scores:
+            self.log_event(f"Job {job.job_id[:8]} deferred - No regions available.")
+            return "requeue"
+        
+        best_region = region_scores[0]['region']
+        
+        self.log_event(
+            f"Assigning job {job.job_id[:8]} (Priority {job.priority}) to region {best_region.region} "
+            f"(avg score: {region_scores[0]['average_score']:.1f})"
+        )
+        return best_region
+
+    def _finish_placement(self, job: ComputeJob, region: RegionalAgent, success: bool) -> str:
+        # STEP 3: RECORD THE REGIONAL ASSIGNMENT RESULT
+        if success:
+            self.log_event(
+                f"✓ Job {job.job_id[:8]} (Priority {job.priority}) successfully assigned to region {region.region}"
+            )
+            job.status = "ASSIGNED"
+            return "assigned"
+        
+        self.log_event(
+            f"✗ Job {job.job_id[:8]} (Priority {job.priority}) failed to assign to region {region.region}"
+        )
+        return "requeue"
 
     def get_system_status(self):
         """
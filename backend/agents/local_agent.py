@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import random
+import time
 import uuid
 
 from simulation.data_generator import DataGenerator
@@ -11,10 +12,19 @@ from beckn_models import (
     BecknComputeEnergyWindow, BecknGridParameters, BecknTimeWindow,
     BecknOffer, BecknOrderItem
 )
-from beckn_client import BecknClient
-from llm_client import LLMClient
+from beckn_client import get_beckn_client
+from discovery_index import DiscoveryIndex
+from discovery_service import get_discovery_service
+from hedging import HedgeClaim, get_latency_tracker
+from llm_client import get_llm_client
+from quote_cache import Quote, QuoteCache
+from summary_cache import SummaryCache
+from template_summarizer import TemplateSummary
 
 class LocalAgent:
+    # Order states that count as a successful confirmation (sandbox might return PENDING)
+    ACCEPTED_ORDER_STATES = ("CONFIRMED", "ACCEPTED", "PENDING")
+
     # Define location assignments for each agent (agent name -> Beckn API location)
     # All 9 UK cities available in the Beckn API
     LOCATION_ASSIGNMENTS = {
@@ -65,8 +75,10 @@ class LocalAgent:
         self.lat = lat
         self.lon = lon
         
-        self.beckn_client = BecknClient()
-        self.llm_client = LLMClient()  # Each agent gets its own LLM instance
+        self.beckn_client = get_beckn_client()  # Shared keep-alive Beckn session
+        self.llm_client = get_llm_client()  # Shared, pooled LLM client
+        self.summary_cache = SummaryCache()  # Reuse summaries while agent state is unchanged
+        self.quote_cache = QuoteCache()  # Recent select/init quotes, so repeat placements only confirm
         self.active_external_orders = {} # Map job_id -> external_order_id
         
         # Discovery tracking
@@ -97,10 +109,12 @@ class LocalAgent:
         self.energy_data = {}
         self.orders: Dict[str, BecknOrder] = {}
         self.synthesized_summary = None  # Store latest LLM-synthesized summary
+        self.summary_updated_at: Optional[datetime] = None  # When the summary was last confirmed current
         
         # Capacity tracking - will be set from location_data
         self.total_capacity = 0  # Will be set from location_data.available_capacity
         self.available_capacity = 0  # Dynamic: decreases with active jobs
+        self.reserved_capacity = 0  # Slots held by async lifecycles still in flight
 
     def update_state(self, timestamp: datetime):
         """
@@ -134,7 +148,7 @@ class LocalAgent:
         
         # Update available capacity based on active jobs
         if self.total_capacity > 0:
-            self.available_capacity = self.total_capacity - len(self.current_jobs)
+            self.available_capacity = self.total_capacity - len(self.current_jobs) - self.reserved_capacity
         
         # Simulate tasks finishing
         finished_job_ids = []
@@ -174,24 +188,26 @@ class LocalAgent:
         query = "Grid flexibility windows"
         
         try:
-            result = self.beckn_client.discover(query=query)
+            # Shared single-flight discovery: agents on the same client reuse one request per TTL window
+            result, index = get_discovery_service(self.beckn_client).discover_indexed(query=query)
             
-            # Extract locations from Beckn response
-            locations = self._extract_locations_from_discovery(result)
+            # Locations are parsed once per discovery result and shared across agents
+            locations = index.locations
             if locations:
                 self.discovered_locations = locations
                 
-                # Filter to find this agent's assigned location
-                assigned_loc = next(
-                    (loc for loc in locations if loc["locality"] == self.assigned_location),
-                    None
-                )
+                # Look up this agent's assigned location
+                assigned_loc = index.location(self.assigned_location)
                 
                 if assigned_loc:
-                    self.location_data = assigned_loc
+                    # Copy: the indexed record is shared with other agents
+                    self.location_data = dict(assigned_loc)
                     
                     # Try to get price from Beckn offers
-                    beckn_price = self._extract_price_from_offers(result, assigned_loc.get("item_id"))
+                    beckn_price = index.price(assigned_loc.get("item_id"))
+                    
+                    # Quotes for our slot are stale once the listing's price or capacity moves
+                    self.observe_listing(index)
                     
                     # If no Beckn price, estimate using DataGenerator
                     if beckn_price is not None:
@@ -235,80 +251,17 @@ class LocalAgent:
             print(f"Discovery failed for {self.name}: {e}")
             return {"error": str(e)}
     
-    def _extract_locations_from_discovery(self, result: Dict) -> list:
+    def observe_listing(self, index: DiscoveryIndex):
         """
-        Extract location data from Beckn discovery response.
-        Returns list of location dictionaries with grid parameters.
+        Records this agent's listing price and capacity from a discovery result
+        with the quote cache, dropping our quotes if either moved.
         """
-        locations = []
-        
-        try:
-            catalogs = result.get("message", {}).get("catalogs", [])
-            
-            for catalog in catalogs:
-                items = catalog.get("beckn:items", [])
-                
-                for item in items:
-                    # Extract location from beckn:availableAt
-                    available_at = item.get("beckn:availableAt", [])
-                    if available_at and len(available_at) > 0:
-                        location_data = available_at[0]
-                        address = location_data.get("address", {})
-                        
-                        # Extract grid parameters
-                        item_attrs = item.get("beckn:itemAttributes", {})
-                        grid_params = item_attrs.get("beckn:gridParameters", {})
-                        
-                        location_info = {
-                            "item_id": item.get("beckn:id", ""),
-                            "name": item.get("beckn:descriptor", {}).get("schema:name", ""),
-                            "locality": address.get("addressLocality", "Unknown"),
-                            "region": address.get("addressRegion", "Unknown"),
-                            "country": address.get("addressCountry", "GB"),
-                            "grid_area": grid_params.get("gridArea", ""),
-                            "grid_zone": grid_params.get("gridZone", ""),
-                            "renewable_mix": grid_params.get("renewableMix", 0),
-                            "carbon_intensity": grid_params.get("carbonIntensity", 0),
-                            "available_capacity": item_attrs.get("beckn:capacityParameters", {}).get("availableCapacity", 0)
-                        }
-                        
-                        locations.append(location_info)
-            
-            return locations
-            
-        except Exception as e:
-            print(f"Error extracting locations: {e}")
-            return []
-    
-    def _extract_price_from_offers(self, result: Dict, item_id: str) -> Optional[float]:
-        """
-        Extract price from Beckn offers for a specific item ID.
-        
-        Args:
-            result: Beckn discovery result
-            item_id: Item ID to find price for
-            
-        Returns:
-            Price in GBP/kWh or None if not found
-        """
-        try:
-            catalogs = result.get("message", {}).get("catalogs", [])
-            
-            for catalog in catalogs:
-                offers = catalog.get("beckn:offers", [])
-                
-                for offer in offers:
-                    offer_items = offer.get("beckn:items", [])
-                    if item_id in offer_items:
-                        price_obj = offer.get("beckn:price", {})
-                        if price_obj and "value" in price_obj:
-                            return float(price_obj["value"])
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error extracting price from offers: {e}")
-            return None
+        assigned_loc = index.location(self.assigned_location)
+        if assigned_loc:
+            self.quote_cache.observe_listing(
+                self.name, f"slot_{self.node.node_id}",
+                index.price(assigned_loc.get("item_id")), assigned_loc.get("available_capacity")
+            )
 
     def get_beckn_catalog(self) -> BecknCatalog:
         """
@@ -366,12 +319,14 @@ class LocalAgent:
             providers=[provider]
         )
 
-    def assign_job(self, job: ComputeJob) -> bool:
+    def assign_job(self, job: ComputeJob, claim: Optional[HedgeClaim] = None) -> bool:
         """
         Assigns a job to this local agent and executes Beckn lifecycle.
         
         Args:
             job: ComputeJob object to assign
+            claim: For hedged placements, called once our order is confirmed; if it
+                returns False another agent took the job and our order is cancelled
             
         Returns:
             bool: True if assignment successful, False otherwise
@@ -387,17 +342,87 @@ class LocalAgent:
         item_id = f"slot_{self.node.node_id}"
         provider_id = self.name
         
-        success = self.execute_order_lifecycle(item_id, provider_id, job)
+        success = self.execute_order_lifecycle(item_id, provider_id, job, claim)
         
         if not success:
             print(f"[{self.name}] Beckn lifecycle failed for job {job.job_id[:8]}")
             return False
+        if claim is not None and claim.winner is not self:
+            return False
+        
+        self._start_job(job)
+        return True
+
+    async def assign_job_async(self, job: ComputeJob, claim: Optional[HedgeClaim] = None) -> bool:
+        """
+        Async variant of assign_job() so many jobs' Beckn transactions can run concurrently.
+        A capacity slot is reserved before the first await, so concurrent placements
+        cannot overbook this agent; it is released if the lifecycle fails.
+        
+        Args:
+            job: ComputeJob object to assign
+            claim: Hedged placement claim, as for assign_job()
+            
+        Returns:
+            bool: True if assignment successful, False otherwise
+        """
+        print(f"[{self.name}] Local agent received job {job.job_id[:8]} (Priority {job.priority})")
+        
+        if self.available_capacity <= 0:
+            print(f"[{self.name}] No capacity available for job {job.job_id[:8]}")
+            return False
+        
+        self.reserved_capacity += 1
+        self.available_capacity -= 1
+        try:
+            success = await self.execute_order_lifecycle_async(f"slot_{self.node.node_id}", self.name, job, claim)
+        finally:
+            self.reserved_capacity -= 1
+            self.available_capacity += 1
+        
+        if not success:
+            print(f"[{self.name}] Beckn lifecycle failed for job {job.job_id[:8]}")
+            return False
+        if claim is not None and claim.winner is not self:
+            return False
+        
+        self._start_job(job)
+        return True
+
+    def assign_jobs_batch(self, jobs: List[ComputeJob]) -> List[ComputeJob]:
+        """
+        Assigns several jobs to this agent with a single multi-item Beckn order.
+        Jobs beyond the available capacity are not placed.
+        
+        Args:
+            jobs: ComputeJob objects bound for this agent
+            
+        Returns:
+            The jobs that were assigned
+        """
+        jobs = jobs[:max(self.available_capacity, 0)]
+        if not jobs:
+            print(f"[{self.name}] No capacity available for batched order")
+            return []
+        
+        print(f"[{self.name}] Local agent placing batched order for {len(jobs)} jobs")
+        confirmed = self.execute_batch_order_lifecycle(f"slot_{self.node.node_id}", self.name, jobs)
         
+        for job in confirmed:
+            self._start_job(job)
+        if len(confirmed) < len(jobs):
+            print(f"[{self.name}] Batched order confirmed {len(confirmed)} of {len(jobs)} jobs")
+        return confirmed
+
+    def _start_job(self, job: ComputeJob):
+        """
+        Records a job whose order was confirmed as running on this agent.
+        """
         # Add to current jobs
         self.current_jobs[job.job_id] = job
         
         # Update capacity
-        self.available_capacity = self.total_capacity - len(self.current_jobs)
+        self.available_capacity = self.total_capacity - len(self.current_jobs) - self.reserved_capacity
         
         # Create job schedule entry
         start_time = datetime.now()
@@ -421,21 +446,38 @@ class LocalAgent:
             f"[{self.name}] Job {job.job_id[:8]} is now RUNNING "
             f"(capacity: {self.available_capacity}/{self.total_capacity})"
         )
-        
-        return True
 
     # --- Beckn Order Lifecycle ---
 
-    def execute_order_lifecycle(self, item_id: str, provider_id: str, job: ComputeJob) -> bool:
+    def execute_order_lifecycle(self, item_id: str, provider_id: str, job: ComputeJob,
+                                claim: Optional[HedgeClaim] = None) -> bool:
         """
         Executes the full Beckn order lifecycle (Select -> Init -> Confirm) against the sandbox.
+        With a fresh negotiated quote for this item and job shape, only Confirm is
+        sent, and the quote is used up. Confirmed orders are never cached for reuse.
+        With a hedged placement claim, the claim is told once only Confirm remains,
+        and an accepted order that loses the claim is cancelled instead of recorded
+        (still returns True: the BPP honoured it).
         """
         try:
             transaction_id = str(uuid.uuid4())
             bpp_id = provider_id # Assuming provider_id is the BPP ID
             bpp_uri = f"https://{provider_id}/bpp" # Placeholder URI
             
+            quote = self.quote_cache.get(provider_id, item_id, job)
+            if quote is not None:
+                if claim is not None:
+                    claim.negotiated(self)
+                confirm_res = self.beckn_client.confirm(
+                    quote.transaction_id, bpp_id, bpp_uri, self._order_from_quote(quote, job)
+                )
+                if self._record_confirmation(job, confirm_res, claim):
+                    return True
+                # The BPP no longer honours the quote; negotiate a new one
+                self.quote_cache.invalidate(provider_id, item_id)
+            
             # 1. Select
+            negotiation_started = time.monotonic()
             select_res = self.beckn_client.select(transaction_id, bpp_id, bpp_uri, item_id, provider_id)
             if 'error' in select_res:
                 return False
@@ -443,67 +485,357 @@ class LocalAgent:
             # 2. Init - Pass job for Compute-Energy enrichment
             order_details = select_res.get('message', {}).get('order', {})
             init_res = self.beckn_client.init(transaction_id, bpp_id, bpp_uri, order_details, job=job)
-            
-            # Enrich location data with actual agent coordinates
-            if 'message' in init_res and 'order' in init_res['message']:
-                order = init_res['message']['order']
-                if 'beckn:fulfillment' in order:
-                    fulfillment = order['beckn:fulfillment']
-                    if 'beckn:deliveryAttributes' in fulfillment:
-                        delivery = fulfillment['beckn:deliveryAttributes']
-                        if 'beckn:location' in delivery:
-                            # Update with actual agent location
-                            delivery['beckn:location']['geo']['coordinates'] = [self.lon, self.lat]
-                            delivery['beckn:location']['address']['addressLocality'] = self.assigned_location
-                            delivery['beckn:location']['address']['addressRegion'] = self.region
+            self._localize_fulfillment(init_res)
+            get_latency_tracker(self.beckn_client).record(bpp_id, time.monotonic() - negotiation_started)
             
             if 'error' in init_res:
                 return False
 
             # 3. Confirm
+            if claim is not None:
+                claim.negotiated(self)
             order_details = init_res.get('message', {}).get('order', {})
             confirm_res = self.beckn_client.confirm(transaction_id, bpp_id, bpp_uri, order_details)
+            return self._record_confirmation(job, confirm_res, claim)
             
-            if 'message' in confirm_res and 'order' in confirm_res['message']:
-                confirmed_order = confirm_res['message']['order']
-                state = confirmed_order.get('beckn:orderStatus')
-                
-                if state in ["CONFIRMED", "ACCEPTED", "PENDING"]: # Sandbox might return PENDING
-                    # Success - record job assignment
-                    self.current_jobs[job.job_id] = job
-                    job.status = "ASSIGNED"
-                    self.active_external_orders[job.job_id] = confirmed_order.get('beckn:id')
-                    
-                    # Record job schedule for timeline visualization
-                    # Use actual current time as start time (job starts now when assigned)
-                    start_time = datetime.now()
-                    end_time = start_time + timedelta(hours=job.estimated_runtime_hrs)
-                    
-                    self.job_schedule[job.job_id] = {
-                        "job_id": job.job_id,
-                        "start_time": start_time.isoformat(),
-                        "duration_hrs": job.estimated_runtime_hrs,
-                        "end_time": end_time.isoformat(),
-                        "priority": job.priority,
-                        "status": "SCHEDULED",
-                        "submitted_at": job.submitted_at.isoformat() if job.submitted_at else None,
-                        "must_start_by": job.must_start_by.isoformat() if job.must_start_by else None
-                    }
-                    
+        except Exception as e:
+            print(f"Order lifecycle failed: {e}")
+            return False
+
+    async def execute_order_lifecycle_async(self, item_id: str, provider_id: str, job: ComputeJob,
+                                            claim: Optional[HedgeClaim] = None) -> bool:
+        """
+        Async variant of execute_order_lifecycle() using the asyncio Beckn transport.
+        """
+        try:
+            transaction_id = str(uuid.uuid4())
+            bpp_id = provider_id # Assuming provider_id is the BPP ID
+            bpp_uri = f"https://{provider_id}/bpp" # Placeholder URI
+            
+            quote = self.quote_cache.get(provider_id, item_id, job)
+            if quote is not None:
+                if claim is not None:
+                    claim.negotiated(self)
+                confirm_res = await self.beckn_client.aconfirm(
+                    quote.transaction_id, bpp_id, bpp_uri, self._order_from_quote(quote, job)
+                )
+                if await self._record_confirmation_async(job, confirm_res, claim):
                     return True
+                self.quote_cache.invalidate(provider_id, item_id)
             
+            order_details = await self._negotiate_async(transaction_id, bpp_id, bpp_uri, item_id, provider_id, job)
+            if order_details is None:
+                return False
+            
+            if claim is not None:
+                claim.negotiated(self)
+            confirm_res = await self.beckn_client.aconfirm(transaction_id, bpp_id, bpp_uri, order_details)
+            return await self._record_confirmation_async(job, confirm_res, claim)
+            
+        except Exception as e:
+            print(f"Order lifecycle failed: {e!r}")
             return False
+
+    async def _negotiate_async(self, transaction_id: str, bpp_id: str, bpp_uri: str,
+                               item_id: str, provider_id: str, job: ComputeJob) -> Optional[Dict]:
+        """
+        Select -> Init for one job. Returns the initialized order, or None if either step failed.
+        """
+        started = time.monotonic()
+        select_res = await self.beckn_client.aselect(transaction_id, bpp_id, bpp_uri, item_id, provider_id)
+        if 'error' in select_res:
+            return None
+        
+        order_details = select_res.get('message', {}).get('order', {})
+        init_res = await self.beckn_client.ainit(transaction_id, bpp_id, bpp_uri, order_details, job=job)
+        self._localize_fulfillment(init_res)
+        get_latency_tracker(self.beckn_client).record(bpp_id, time.monotonic() - started)
+        
+        if 'error' in init_res:
+            return None
+        return init_res.get('message', {}).get('order', {})
+
+    async def prefetch_quote_async(self, job: ComputeJob) -> bool:
+        """
+        Negotiates a quote (Select -> Init, no Confirm) for this agent's slot ahead
+        of demand, so the next placement of the same job shape only needs Confirm.
+        
+        Args:
+            job: Representative job; only its shape matters for reuse
+            
+        Returns:
+            bool: True if a quote was cached
+        """
+        item_id = f"slot_{self.node.node_id}"
+        provider_id = self.name
+        try:
+            transaction_id = str(uuid.uuid4())
+            bpp_id = provider_id # Assuming provider_id is the BPP ID
+            bpp_uri = f"https://{provider_id}/bpp" # Placeholder URI
+            
+            order_details = await self._negotiate_async(transaction_id, bpp_id, bpp_uri, item_id, provider_id, job)
+            if order_details is None:
+                return False
+            self.quote_cache.put(provider_id, item_id, job, transaction_id, order_details)
+            return True
             
         except Exception as e:
-            print(f"Order lifecycle failed: {e}")
+            print(f"[{self.name}] Quote prefetch failed: {e!r}")
             return False
 
+    def _order_from_quote(self, quote: Quote, job: ComputeJob) -> Dict:
+        """
+        Order to confirm from a cached quote: the quoted order, with this job's own
+        localized fulfillment.
+        """
+        order = dict(quote.order)
+        if 'beckn:fulfillment' in order:
+            order['beckn:fulfillment'] = self.beckn_client.compute_fulfillment(job)
+            self._localize_fulfillment({'message': {'order': order}})
+        return order
+
+    def _localize_fulfillment(self, init_res: Dict):
+        """
+        Enrich location data in an init response with actual agent coordinates,
+        on the order's fulfillment and on any per-item fulfillments of a batched order.
+        """
+        if 'message' in init_res and 'order' in init_res['message']:
+            order = init_res['message']['order']
+            fulfillments = [order.get('beckn:fulfillment')] + [
+                item.get('beckn:fulfillment') for item in order.get('beckn:orderItems', [])
+            ]
+            for fulfillment in fulfillments:
+                if fulfillment and 'beckn:deliveryAttributes' in fulfillment:
+                    delivery = fulfillment['beckn:deliveryAttributes']
+                    if 'beckn:location' in delivery:
+                        # Update with actual agent location
+                        delivery['beckn:location']['geo']['coordinates'] = [self.lon, self.lat]
+                        delivery['beckn:location']['address']['addressLocality'] = self.assigned_location
+                        delivery['beckn:location']['address']['addressRegion'] = self.region
+
+    def _record_confirmation(self, job: ComputeJob, confirm_res: Dict,
+                             claim: Optional[HedgeClaim] = None) -> bool:
+        """
+        Records the job assignment if a confirm response shows the order was accepted.
+        If a hedged placement elsewhere claimed the job first, the order is cancelled instead.
+        """
+        accepted, duplicate_id = self._claim_confirmation(job, confirm_res, claim)
+        if duplicate_id is not None:
+            self.cancel_order(duplicate_id, reason="hedged_duplicate")
+        return accepted
+
+    async def _record_confirmation_async(self, job: ComputeJob, confirm_res: Dict,
+                                         claim: Optional[HedgeClaim] = None) -> bool:
+        """
+        Async variant of _record_confirmation(); a duplicate order is cancelled without blocking the loop.
+        """
+        accepted, duplicate_id = self._claim_confirmation(job, confirm_res, claim)
+        if duplicate_id is not None:
+            await self.cancel_order_async(duplicate_id, reason="hedged_duplicate")
+        return accepted
+
+    def _claim_confirmation(self, job: ComputeJob, confirm_res: Dict,
+                            claim: Optional[HedgeClaim]) -> Tuple[bool, Optional[str]]:
+        """
+        Records an accepted order unless a hedged placement elsewhere claimed the job first.
+        
+        Returns:
+            (whether the order was accepted, id of an accepted order that lost the claim and must be cancelled)
+        """
+        if 'message' in confirm_res and 'order' in confirm_res['message']:
+            confirmed_order = confirm_res['message']['order']
+            state = confirmed_order.get('beckn:orderStatus')
+            
+            if state in self.ACCEPTED_ORDER_STATES:
+                if claim is None or claim(self):
+                    self._record_confirmed_job(job, confirmed_order.get('beckn:id'))
+                    return True, None
+                print(f"[{self.name}] Job {job.job_id[:8]} was placed elsewhere first; cancelling our order")
+                return True, confirmed_order.get('beckn:id')
+        
+        return False, None
+
+    def cancel_order(self, external_order_id: Optional[str], reason: str) -> bool:
+        """
+        Cancels a confirmed Beckn order through Update. Local job state is not touched.
+        """
+        if not external_order_id:
+            return False
+        
+        response = self.beckn_client.update(**self._cancel_update(external_order_id, reason))
+        return 'error' not in response
+
+    async def cancel_order_async(self, external_order_id: Optional[str], reason: str) -> bool:
+        """
+        Async variant of cancel_order() using the asyncio Beckn transport.
+        """
+        if not external_order_id:
+            return False
+        
+        response = await self.beckn_client.aupdate(**self._cancel_update(external_order_id, reason))
+        return 'error' not in response
+
+    def _cancel_update(self, external_order_id: str, reason: str) -> Dict:
+        update_details = {
+            "beckn:flexibilityAction": {
+                "actionType": "cancel",
+                "actionReason": reason,
+                "actionTimestamp": datetime.now().isoformat()
+            }
+        }
+        return dict(
+            transaction_id=str(uuid.uuid4()),
+            bpp_id=self.name,
+            bpp_uri=f"https://{self.name}/bpp",
+            order_id=external_order_id,
+            update_type="cancellation",
+            update_details=update_details,
+            order_status="CANCELLED"
+        )
+
+    def _record_confirmed_job(self, job: ComputeJob, external_order_id: Optional[str]):
+        # Success - record job assignment
+        self.current_jobs[job.job_id] = job
+        job.status = "ASSIGNED"
+        self.active_external_orders[job.job_id] = external_order_id
+        
+        # Record job schedule for timeline visualization
+        # Use actual current time as start time (job starts now when assigned)
+        start_time = datetime.now()
+        end_time = start_time + timedelta(hours=job.estimated_runtime_hrs)
+        
+        self.job_schedule[job.job_id] = {
+            "job_id": job.job_id,
+            "start_time": start_time.isoformat(),
+            "duration_hrs": job.estimated_runtime_hrs,
+            "end_time": end_time.isoformat(),
+            "priority": job.priority,
+            "status": "SCHEDULED",
+            "submitted_at": job.submitted_at.isoformat() if job.submitted_at else None,
+            "must_start_by": job.must_start_by.isoformat() if job.must_start_by else None
+        }
+
+    def execute_batch_order_lifecycle(self, item_id: str, provider_id: str, jobs: List[ComputeJob]) -> List[ComputeJob]:
+        """
+        Places several jobs as one Beckn order (Select -> Init -> Confirm) with an
+        order item per job, then splits the confirmation back into per-job state.
+        
+        Returns:
+            The jobs whose order items were confirmed
+        """
+        try:
+            transaction_id = str(uuid.uuid4())
+            bpp_id = provider_id # Assuming provider_id is the BPP ID
+            bpp_uri = f"https://{provider_id}/bpp" # Placeholder URI
+            
+            select_res = self.beckn_client.select_batch(transaction_id, bpp_id, bpp_uri, item_id, provider_id, jobs)
+            if 'error' in select_res:
+                return []
+            
+            order_details = select_res.get('message', {}).get('order', {})
+            init_res = self.beckn_client.init_batch(transaction_id, bpp_id, bpp_uri, order_details, jobs)
+            self._localize_fulfillment(init_res)
+            
+            if 'error' in init_res:
+                return []
+            
+            order_details = init_res.get('message', {}).get('order', {})
+            confirm_res = self.beckn_client.confirm(transaction_id, bpp_id, bpp_uri, order_details)
+            return self._record_batch_confirmation(jobs, confirm_res)
+            
+        except Exception as e:
+            print(f"Batch order lifecycle failed: {e}")
+            return []
+
+    def _record_batch_confirmation(self, jobs: List[ComputeJob], confirm_res: Dict) -> List[ComputeJob]:
+        """
+        Records each job whose order item is present in an accepted confirmation.
+        A BPP may confirm a subset of lines; jobs whose lines were dropped are not recorded.
+        """
+        confirmed_order = confirm_res.get('message', {}).get('order')
+        if not confirmed_order or confirmed_order.get('beckn:orderStatus') not in self.ACCEPTED_ORDER_STATES:
+            return []
+        
+        order_items = confirmed_order.get('beckn:orderItems')
+        confirmed_lines = None
+        if order_items is not None:
+            confirmed_lines = {item.get('beckn:lineId') for item in order_items}
+        
+        confirmed = []
+        for job in jobs:
+            if confirmed_lines is None or self.beckn_client.line_id_for(job) in confirmed_lines:
+                self._record_confirmed_job(job, confirmed_order.get('beckn:id'))
+                confirmed.append(job)
+        return confirmed
+
     def synthesize_report(self) -> Optional[str]:
         """
         Uses the LLM to synthesize agent data into a natural language summary.
         This summary is ready for the regional agent to consume.
         """
-        agent_data = {
+        agent_data = self.get_summary_input()
+        
+        # Skip the LLM round trip if this quantized state was already summarized
+        cache_key = self.summary_cache.state_key(agent_data)
+        cached = self.summary_cache.get(cache_key)
+        if cached:
+            self._set_summary(cached)
+            return cached
+        
+        summary = self.llm_client.synthesize_agent_report(agent_data)
+        if summary:
+            self._set_summary(summary)
+            # Template fallbacks are not cached so the LLM summary replaces them once available
+            if not isinstance(summary, TemplateSummary):
+                self.summary_cache.put(cache_key, summary)
+        return summary
+
+    async def synthesize_report_async(self) -> Optional[str]:
+        """
+        Async variant of synthesize_report() so a regional agent can
+        synthesize all of its local agents concurrently.
+        """
+        agent_data = self.get_summary_input()
+        
+        cache_key = self.summary_cache.state_key(agent_data)
+        cached = self.summary_cache.get(cache_key)
+        if cached:
+            self._set_summary(cached)
+            return cached
+        
+        summary = await self.llm_client.asynthesize_agent_report(agent_data)
+        if summary:
+            self._set_summary(summary)
+            # Template fallbacks are not cached so the LLM summary replaces them once available
+            if not isinstance(summary, TemplateSummary):
+                self.summary_cache.put(cache_key, summary)
+        return summary
+
+    def get_cached_summary(self, record: bool = False) -> Optional[str]:
+        """
+        Returns the cached summary for the current agent state, or None on a miss.
+        Lookups are only counted towards the cache hit rate when record is set.
+        """
+        return self.summary_cache.get(self.summary_cache.state_key(self.get_summary_input()), record=record)
+
+    def store_summary(self, summary: str):
+        """
+        Stores a summary produced elsewhere (e.g. a batched regional synthesis)
+        against the current agent state.
+        """
+        self._set_summary(summary)
+        if not isinstance(summary, TemplateSummary):
+            self.summary_cache.put(self.summary_cache.state_key(self.get_summary_input()), summary)
+
+    def _set_summary(self, summary: str):
+        self.synthesized_summary = summary
+        self.summary_updated_at = datetime.now()
+
+    def get_summary_input(self) -> Dict:
+        """
+        Agent state passed to the LLM for synthesis.
+        """
+        return {
             "name": self.name,
             "region": self.region,
             "location_data": self.location_data or {},
@@ -511,20 +843,31 @@ class LocalAgent:
             "active_tasks_count": len(self.current_jobs),
             "available_capacity": 1 if self.node.is_available else 0
         }
-        
-        summary = self.llm_client.synthesize_agent_report(agent_data)
-        if summary:
-            self.synthesized_summary = summary
-        return summary
     
+    def get_metrics(self) -> Dict:
+        """
+        Returns a lightweight numeric report for scheduling decisions.
+        Unlike get_report(), this never triggers LLM synthesis or catalog generation.
+        """
+        return {
+            "name": self.name,
+            "region": self.region,
+            "cost_score": getattr(self, 'cost_score', None),
+            "available_capacity": self.available_capacity,
+            "total_capacity": self.total_capacity,
+            "active_tasks_count": len(self.current_jobs),
+            "energy_data": self.energy_data,
+            "is_available": self.node.is_available,
+        }
+
     def get_report(self):
         """
         Returns a report for the regional agent.
         Includes both raw data and LLM-synthesized summary.
+        Used for dashboard views; scheduling paths should use get_metrics().
+        Never blocks on the LLM: the summary is the latest one completed by the
+        regional refresh (see RegionalAgent.refresh_summaries).
         """
-        # Generate fresh synthesis
-        synthesis = self.synthesize_report()
-        
         return {
             "name": self.name,
             "region": self.region,
@@ -533,7 +876,8 @@ class LocalAgent:
             "energy_data": self.energy_data,
             "active_tasks_count": len(self.current_jobs),
             "catalog": self.get_beckn_catalog().dict(),
-            "synthesized_summary": synthesis,  # LLM-generated summary
+            "synthesized_summary": self.synthesized_summary,  # Latest LLM-generated summary
+            "summary_updated_at": self.summary_updated_at.isoformat() if self.summary_updated_at else None,
             "location_data": self.location_data,  # Include location data for context
             "cost_score": getattr(self, 'cost_score', None),  # Expose computed cost score
         }
@@ -1,3 +1,8 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from agents.local_agent import LocalAgent
 from beckn_models import (
@@ -5,7 +10,14 @@ from beckn_models import (
     BecknItem, BecknPrice, BecknComputeEnergyWindow, BecknGridParameters,
     BecknTimeWindow
 )
-from llm_client import LLMClient
+from hedging import HedgeClaim, get_latency_tracker
+from job_queue import JobQueue
+from llm_client import get_llm_client, run_async
+from order_status import get_order_status_checker
+from template_summarizer import TemplateSummary
+
+# Runs sync placements that may be hedged, so a slow one can be waited on with a cutoff
+_placement_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedged-placement")
 
 class RegionalAgent:
     def __init__(self, name: str, region: str):
@@ -14,10 +26,20 @@ class RegionalAgent:
         self.local_agents: List[LocalAgent] = []
         self.aggregated_catalog: Optional[BecknCatalog] = None
         self.aggregated_data = {}
-        self.llm_client = LLMClient()
-        self.regional_ranking = None
+        self.llm_client = get_llm_client()
+        self.regional_ranking = None  # LLM narrative for the ranking
+        self.narrated_order: List[str] = []  # Ranking order the current narrative describes
         self.deferred_jobs: List[ComputeJob] = []  # Queue for deferred jobs
         self.cost_threshold = 70.0  # Maximum acceptable cost score for immediate execution
+        self.llm_concurrency = 8  # Max concurrent LLM synthesis calls per region
+        self.batch_synthesis = True  # One completion per region instead of N+1
+        self.background_synthesis = False  # Set by SummaryRefresher; skips inline LLM work
+        self.summaries_refreshed_at: Optional[datetime] = None
+        # Start the next-best agent in parallel when the chosen one's select/init runs past its p95
+        self.hedge_placements = os.environ.get("BECKN_HEDGE", "true").lower() == "true"
+        self.hedges_started = 0
+        self.hedges_won = 0
+        self._hedge_tasks = set()  # Keeps losing async placements alive until they clean up
 
     def register_local_agent(self, agent: LocalAgent):
         """
@@ -43,19 +65,25 @@ class RegionalAgent:
     def aggregate_data(self):
         """
         Aggregates reports and catalogs from local agents.
-        Includes synthesized summaries from each agent's LLM.
+        Includes the latest synthesized summaries from each agent's LLM.
         """
         all_providers = []
         total_capacity_available = 0
         agent_summaries = []  # Collect LLM-synthesized summaries
         
+        # Refresh summaries inline unless a background SummaryRefresher owns them
+        if not self.background_synthesis:
+            self.refresh_summaries()
+        
+        reports = {}
         for agent in self.local_agents:
             # Get local catalog
             catalog = agent.get_beckn_catalog()
             all_providers.extend(catalog.providers)
             
-            # Get report (this triggers synthesis)
+            # Get report (carries the latest completed summary)
             report = agent.get_report()
+            reports[agent.name] = report
             
             # Collect synthesized summary from the report
             if report.get("synthesized_summary"):
@@ -84,30 +112,11 @@ class RegionalAgent:
         # Combine local and external providers
         combined_providers = all_providers + (self.aggregated_catalog.providers if self.aggregated_catalog else [])
         
-        lowest_cost_options = []
-        for agent in self.local_agents:
-            # Get energy data and location data from each agent
-            report = agent.get_report()
-            energy_data = report.get('energy_data', {})
-            
-            # Extract energy price, carbon intensity, and cost score
-            energy_price = energy_data.get('price', 0.0)
-            carbon = energy_data.get('carbon_intensity', 0.0)
-            cost_score = report.get('cost_score', 0.0)
-            
-            lowest_cost_options.append({
-                "agent_name": agent.name,
-                "energy_price": energy_price,  # Energy price in GBP/kWh
-                "carbon": carbon,
-                "cost_score": cost_score,  # Include the computed score
-                "available": 1 if agent.node.is_available else 0
-            })
-        
-        # Sort by cost_score (lower is better)
-        lowest_cost_options.sort(key=lambda x: x.get('cost_score', 999))
+        # Authoritative ranking, computed from numeric data (no LLM)
+        lowest_cost_options = self.compute_ranking()
         
         # Calculate average score across all local agents
-        total_score = sum(opt.get('cost_score', 0) for opt in lowest_cost_options)
+        total_score = sum(opt.get('cost_score') or 0 for opt in lowest_cost_options)
         average_score = total_score / len(lowest_cost_options) if lowest_cost_options else 0.0
 
         self.aggregated_data = {
@@ -116,19 +125,171 @@ class RegionalAgent:
             "total_capacity": total_capacity,
             "total_used": total_used,
             "lowest_cost_options": lowest_cost_options[:50],
-            "local_agents": [agent.get_report() for agent in self.local_agents],
+            "ranking": [opt["agent_name"] for opt in lowest_cost_options],
+            "local_agents": [reports[agent.name] for agent in self.local_agents],
             "catalog": self.aggregated_catalog.dict(),
             "agent_summaries": agent_summaries,  # Include LLM-synthesized summaries
-            "average_score": average_score  # Include average score
+            "average_score": average_score,  # Include average score
+            "summaries_refreshed_at": self.summaries_refreshed_at.isoformat() if self.summaries_refreshed_at else None
         }
         
-        # Synthesize regional ranking
-        # We only do this if we have summaries to rank
-        if agent_summaries:
-            ranking = self.llm_client.synthesize_regional_ranking(self.aggregated_data)
-            if ranking:
-                self.regional_ranking = ranking
-                self.aggregated_data["regional_ranking"] = ranking
+        if self.regional_ranking:
+            self.aggregated_data["regional_ranking"] = self.regional_ranking
+
+    def compute_ranking(self) -> List[Dict]:
+        """
+        Ranks local agents best to worst by cost_score (lower is better).
+        This ordering is authoritative; the LLM only narrates it.
+        """
+        options = []
+        for agent in self.local_agents:
+            # Get energy data and cost score from each agent (numeric only)
+            metrics = agent.get_metrics()
+            energy_data = metrics.get('energy_data', {})
+            
+            options.append({
+                "agent_name": agent.name,
+                "energy_price": energy_data.get('price', 0.0),  # Energy price in GBP/kWh
+                "carbon": energy_data.get('carbon_intensity', 0.0),
+                "cost_score": metrics.get('cost_score'),  # Include the computed score
+                "available": 1 if agent.node.is_available else 0
+            })
+        
+        # Sort by cost_score (lower is better), agents without a score last
+        options.sort(key=lambda x: x['cost_score'] if x['cost_score'] is not None else 999)
+        return options
+
+    def refresh_summaries(self):
+        """
+        Runs all LLM work for the region: local summaries and the ranking narrative.
+        Called inline from aggregate_data, or from a background SummaryRefresher so
+        simulation ticks and API reads never wait on the LLM.
+        The ranking itself is numeric; it is only re-narrated when its order changes.
+        """
+        ranking = self.compute_ranking()
+        order = [opt["agent_name"] for opt in ranking]
+        needs_narration = order != self.narrated_order or not self.regional_ranking
+        pending = [agent for agent in self.local_agents if agent.get_cached_summary() is None]
+        
+        batched = False
+        if pending and self.batch_synthesis:
+            batched = self.synthesize_region_batch(ranking if needs_narration else None)
+            needs_narration = needs_narration and order != self.narrated_order
+
+        if batched:
+            # The per-agent path counts its own lookups; count the batch's here
+            for agent in self.local_agents:
+                agent.summary_cache.record_lookup(agent not in pending)
+        
+        if not batched:
+            self.synthesize_local_summaries()
+        
+        # Narrate the ranking if the order changed and the batch did not cover it
+        agent_summaries = self._collect_agent_summaries()
+        if needs_narration and agent_summaries:
+            narrative = self.llm_client.synthesize_regional_ranking({
+                "region": self.region,
+                "agent_summaries": agent_summaries,
+                "ranking": ranking,
+                "agents": [agent.get_summary_input() for agent in self.local_agents]
+            })
+            self._set_ranking_narrative(narrative, order)
+        
+        self.summaries_refreshed_at = datetime.now()
+        
+        # Publish to the current report without waiting for the next aggregation
+        if self.aggregated_data:
+            self.aggregated_data["agent_summaries"] = self._collect_agent_summaries()
+            self.aggregated_data["summaries_refreshed_at"] = self.summaries_refreshed_at.isoformat()
+            if self.regional_ranking:
+                self.aggregated_data["regional_ranking"] = self.regional_ranking
+
+    def _set_ranking_narrative(self, narrative: Optional[str], order: List[str]):
+        if not narrative:
+            return
+        self.regional_ranking = narrative
+        # Template fallbacks don't count as narrated, so the LLM retries on the next refresh
+        if not isinstance(narrative, TemplateSummary):
+            self.narrated_order = order
+
+    def needs_summary_refresh(self, max_staleness_seconds: float) -> bool:
+        """
+        True if summaries are older than the staleness budget or any agent's
+        current state has no cached summary.
+        """
+        if self.summaries_refreshed_at is None:
+            return True
+        age = (datetime.now() - self.summaries_refreshed_at).total_seconds()
+        if age > max_staleness_seconds:
+            return True
+        return any(agent.get_cached_summary() is None for agent in self.local_agents)
+
+    def _collect_agent_summaries(self) -> List[Dict]:
+        return [
+            {
+                "agent_name": agent.name,
+                "location": agent.assigned_location,
+                "summary": agent.synthesized_summary
+            }
+            for agent in self.local_agents
+            if agent.synthesized_summary
+        ]
+
+    def synthesize_region_batch(self, ranking: Optional[List[Dict]] = None) -> bool:
+        """
+        Synthesizes all local summaries, and optionally the ranking narrative, in one LLM completion.
+        
+        Args:
+            ranking: Numeric ranking from compute_ranking() to narrate, or None to skip narration
+        
+        Returns:
+            bool: True if summaries are up to date, False if the caller should fall back
+        """
+        if not self.local_agents:
+            return False
+        
+        agents_data = [agent.get_summary_input() for agent in self.local_agents]
+        result = self.llm_client.synthesize_region_batch(self.region, agents_data, ranking=ranking)
+        if not result:
+            return False
+        
+        summaries = result["summaries"]
+        for agent in self.local_agents:
+            summary = summaries.get(agent.name)
+            if summary:
+                agent.store_summary(summary)
+        
+        if ranking is not None:
+            self._set_ranking_narrative(result.get("ranking"), [opt["agent_name"] for opt in ranking])
+        
+        # Agents the model skipped fall back to individual (concurrent) synthesis
+        if len(summaries) < len(self.local_agents):
+            self.synthesize_local_summaries()
+        return True
+
+    def synthesize_local_summaries(self):
+        """
+        Runs LLM synthesis for all local agents concurrently, bounded by llm_concurrency.
+        Aggregation latency is then close to one LLM round trip instead of one per agent.
+        """
+        if not self.local_agents:
+            return
+        run_async(self._synthesize_local_summaries_async())
+
+    async def _synthesize_local_summaries_async(self):
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+
+        async def synthesize(agent: LocalAgent):
+            async with semaphore:
+                return await agent.synthesize_report_async()
+
+        results = await asyncio.gather(
+            *(synthesize(agent) for agent in self.local_agents),
+            return_exceptions=True
+        )
+        for agent, result in zip(self.local_agents, results):
+            if isinstance(result, Exception):
+                print(f"[{self.region}] Summary synthesis failed for {agent.name}: {result}")
 
     def get_report(self):
         return self.aggregated_data
@@ -147,34 +308,11 @@ class RegionalAgent:
         """
         print(f"[{self.region}] Regional agent received job {job.job_id[:8]} (Priority {job.priority})")
         
-        # Get scores from all local agents
-        agent_scores = []
-        excluded_agents = []
-        for agent in self.local_agents:
-            report = agent.get_report()
-            score = report.get('cost_score', float('inf'))
-            available = report.get('available_capacity', 0)
-            
-            # Only consider agents with available capacity
-            if available > 0:
-                agent_scores.append({
-                    'agent': agent,
-                    'score': score,
-                    'available': available
-                })
-            else:
-                excluded_agents.append(f"{agent.name} (full)")
-        
-        if excluded_agents:
-            print(f"[{self.region}] Excluded {len(excluded_agents)} full agents: {', '.join(excluded_agents)}")
-        
+        agent_scores = self._score_available_agents()
         if not agent_scores:
             print(f"[{self.region}] No available agents for job {job.job_id[:8]}")
             return False
         
-        # Sort by score (lowest is best)
-        agent_scores.sort(key=lambda x: x['score'])
-        
         # Check if the best available agent's score is above threshold
         best_score = agent_scores[0]['score']
         if best_score > self.cost_threshold:
@@ -186,9 +324,12 @@ class RegionalAgent:
             return False
         
         # Try to assign to agents in order of best score
+        hedged = set()  # Agents already tried as a hedge
         for i, agent_info in enumerate(agent_scores):
             agent = agent_info['agent']
             score = agent_info['score']
+            if agent in hedged:
+                continue
             
             # Stop trying if we've exceeded the threshold
             if score > self.cost_threshold:
@@ -210,8 +351,12 @@ class RegionalAgent:
                     f"(score: {score:.1f}, capacity: {agent_info['available']})"
                 )
             
-            # Try to assign to this agent
-            success = agent.assign_job(job)
+            # Try to assign to this agent, hedging on the next-best one if it is slow
+            backup = self._hedge_candidate(agent_scores, i, hedged)
+            if backup is not None:
+                success = self._assign_job_hedged(job, agent, backup, hedged)
+            else:
+                success = agent.assign_job(job)
             
             if success:
                 if i > 0:
@@ -225,6 +370,238 @@ class RegionalAgent:
         print(f"[{self.region}] Failed to assign job {job.job_id[:8]} to any agent")
         return False
 
+    async def assign_job_async(self, job: ComputeJob, preferred: Optional[LocalAgent] = None) -> bool:
+        """
+        Async variant of assign_job(). Agents are scored before the first await and
+        the chosen agent reserves its slot synchronously, so concurrent placements
+        see each other's reservations.
+        
+        Args:
+            job: ComputeJob object to assign
+            preferred: Agent to try first (e.g. chosen by the placement solver) if it
+                still has room; the rest follow in score order as hedges and fallbacks
+            
+        Returns:
+            bool: True if assignment successful, False otherwise
+        """
+        print(f"[{self.region}] Regional agent received job {job.job_id[:8]} (Priority {job.priority})")
+        
+        agent_scores = self._score_available_agents()
+        if not agent_scores:
+            print(f"[{self.region}] No available agents for job {job.job_id[:8]}")
+            return False
+        if preferred is not None:
+            # Stable sort: the preferred agent first, the others keep their order
+            agent_scores.sort(key=lambda agent_info: agent_info['agent'] is not preferred)
+        
+        hedged = set()
+        for i, agent_info in enumerate(agent_scores):
+            agent = agent_info['agent']
+            if agent in hedged:
+                continue
+            if agent_info['score'] > self.cost_threshold:
+                print(
+                    f"[{self.region}] Remaining agents exceed cost threshold ({self.cost_threshold:.1f}). "
+                    f"Deferring job {job.job_id[:8]} to a later time."
+                )
+                self.deferred_jobs.append(job)
+                return False
+            
+            backup = self._hedge_candidate(agent_scores, i, hedged)
+            if backup is not None:
+                if await self._assign_job_hedged_async(job, agent, backup, hedged):
+                    return True
+            elif await agent.assign_job_async(job):
+                return True
+            print(f"[{self.region}] Assignment to {agent.name} failed, trying next agent...")
+        
+        print(f"[{self.region}] Failed to assign job {job.job_id[:8]} to any agent")
+        return False
+
+    def _hedge_candidate(self, agent_scores: List[Dict], index: int, hedged: set) -> Optional[LocalAgent]:
+        """
+        The next-best agent under the cost threshold after agent_scores[index],
+        or None if hedging is off or there is none left to try.
+        """
+        if not self.hedge_placements:
+            return None
+        for agent_info in agent_scores[index + 1:]:
+            if agent_info['score'] > self.cost_threshold:
+                return None
+            if agent_info['agent'] not in hedged:
+                return agent_info['agent']
+        return None
+
+    def _assign_job_hedged(self, job: ComputeJob, primary: LocalAgent, backup: LocalAgent, hedged: set) -> bool:
+        """
+        Assigns a job to `primary`; if its select/init hasn't finished within the
+        BPP's p95 select/init latency, also starts `backup`. Confirm is not part of
+        the race: once the primary has negotiated, it is waited on to the end. The
+        first confirmed order wins and the other is cancelled through Beckn Update.
+        
+        Returns:
+            bool: True if either agent took the job
+        """
+        negotiated = threading.Event()  # Set once the primary only has Confirm left, or is done
+        
+        def on_negotiated(agent):
+            if agent is primary:
+                negotiated.set()
+        
+        claim = HedgeClaim(on_negotiated)
+        first = _placement_executor.submit(primary.assign_job, job, claim)
+        first.add_done_callback(lambda _: negotiated.set())
+        cutoff = get_latency_tracker(primary.beckn_client).cutoff(primary.name)
+        if negotiated.wait(cutoff):
+            wait([first])
+            return self._hedge_result(first)
+        
+        print(f"[{self.region}] {primary.name} hasn't negotiated job {job.job_id[:8]} within {cutoff:.2f}s; hedging on {backup.name}")
+        hedged.add(backup)
+        self.hedges_started += 1
+        second = _placement_executor.submit(backup.assign_job, job, claim)
+        
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self._hedge_result(future):
+                    if future is second:
+                        self.hedges_won += 1
+                    return True
+        return False
+
+    async def _assign_job_hedged_async(self, job: ComputeJob, primary: LocalAgent, backup: LocalAgent, hedged: set) -> bool:
+        """
+        Async variant of _assign_job_hedged().
+        """
+        negotiated = asyncio.Event()  # Set once the primary only has Confirm left, or is done
+        
+        def on_negotiated(agent):
+            if agent is primary:
+                negotiated.set()
+        
+        claim = HedgeClaim(on_negotiated)
+        first = asyncio.ensure_future(primary.assign_job_async(job, claim))
+        first.add_done_callback(lambda _: negotiated.set())
+        cutoff = get_latency_tracker(primary.beckn_client).cutoff(primary.name)
+        try:
+            await asyncio.wait_for(negotiated.wait(), timeout=cutoff)
+        except asyncio.TimeoutError:
+            pass
+        if negotiated.is_set():
+            await asyncio.wait([first])
+            return self._hedge_result(first)
+        
+        print(f"[{self.region}] {primary.name} hasn't negotiated job {job.job_id[:8]} within {cutoff:.2f}s; hedging on {backup.name}")
+        hedged.add(backup)
+        self.hedges_started += 1
+        second = asyncio.ensure_future(backup.assign_job_async(job, claim))
+        
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if self._hedge_result(task):
+                    if task is second:
+                        self.hedges_won += 1
+                    # The loser runs on and cancels its order if it is confirmed
+                    for loser in pending:
+                        self._hedge_tasks.add(loser)
+                        loser.add_done_callback(self._hedge_tasks.discard)
+                    return True
+        return False
+
+    def _hedge_result(self, future) -> bool:
+        try:
+            return bool(future.result())
+        except Exception as e:
+            print(f"[{self.region}] Hedged placement failed: {e!r}")
+            return False
+
+    def assign_jobs_batch(self, jobs: List[ComputeJob]) -> List[bool]:
+        """
+        Assigns several jobs at once. Each job goes to the best-scored agent that
+        still has room, then each agent places its share as one multi-item order.
+        Jobs with no agent under the cost threshold are deferred.
+        
+        Args:
+            jobs: ComputeJob objects in placement order
+        
+        Returns:
+            List[bool]: Per-job assignment result, in the order given
+        """
+        print(f"[{self.region}] Regional agent received batch of {len(jobs)} jobs")
+        
+        agent_scores = self._score_available_agents()
+        remaining = {id(info['agent']): info['available'] for info in agent_scores}
+        groups: Dict[int, Tuple[LocalAgent, List[ComputeJob]]] = {}
+        
+        for job in jobs:
+            chosen = None
+            for agent_info in agent_scores:
+                if agent_info['score'] > self.cost_threshold:
+                    break
+                if remaining[id(agent_info['agent'])] > 0:
+                    chosen = agent_info['agent']
+                    break
+            
+            if chosen is None:
+                if agent_scores and agent_scores[0]['score'] > self.cost_threshold:
+                    print(
+                        f"[{self.region}] Remaining agents exceed cost threshold ({self.cost_threshold:.1f}). "
+                        f"Deferring job {job.job_id[:8]} to a later time."
+                    )
+                    self.deferred_jobs.append(job)
+                else:
+                    print(f"[{self.region}] No available agents for job {job.job_id[:8]}")
+                continue
+            
+            remaining[id(chosen)] -= 1
+            groups.setdefault(id(chosen), (chosen, []))[1].append(job)
+        
+        assigned = set()
+        for agent, agent_jobs in groups.values():
+            try:
+                confirmed = agent.assign_jobs_batch(agent_jobs)
+            except Exception as e:
+                print(f"[{self.region}] Batched order on {agent.name} failed: {e}")
+                continue
+            assigned.update(job.job_id for job in confirmed)
+        
+        return [job.job_id in assigned for job in jobs]
+
+    def _score_available_agents(self) -> List[Dict]:
+        """
+        Local agents with free capacity, sorted by cost score (lowest is best).
+        """
+        # Get scores from all local agents (numeric metrics, no LLM synthesis)
+        agent_scores = []
+        excluded_agents = []
+        for agent in self.local_agents:
+            metrics = agent.get_metrics()
+            score = metrics.get('cost_score')
+            if score is None:
+                score = float('inf')
+            available = metrics.get('available_capacity', 0)
+            
+            # Only consider agents with available capacity
+            if available > 0:
+                agent_scores.append({
+                    'agent': agent,
+                    'score': score,
+                    'available': available
+                })
+            else:
+                excluded_agents.append(f"{agent.name} (full)")
+        
+        if excluded_agents:
+            print(f"[{self.region}] Excluded {len(excluded_agents)} full agents: {', '.join(excluded_agents)}")
+        
+        # Sort by score (lowest is best)
+        agent_scores.sort(key=lambda x: x['score'])
+        return agent_scores
+
     # --- Beckn Protocol Routing ---
 
     def process_discovery_result(self, discovery_data: Dict):
@@ -381,28 +758,28 @@ class RegionalAgent:
         
         print(f"[{self.region}] Retrying {len(self.deferred_jobs)} deferred jobs...")
         
-        # Create a copy to iterate safely while modifying
-        jobs_to_retry = self.deferred_jobs[:]
+        # Take the whole list, most urgent first; assign_job re-defers jobs that are still too expensive
+        jobs_to_retry = JobQueue(self.deferred_jobs).drain()
+        self.deferred_jobs = []
         
         for job in jobs_to_retry:
             # Try to assign the job
-            # Temporarily remove from deferred list to avoid re-deferring in the same call
-            self.deferred_jobs.remove(job)
-            
+            deferred_before = len(self.deferred_jobs)
             success = self.assign_job(job)
             
             if success:
                 print(f"[{self.region}] Successfully assigned previously deferred job {job.job_id[:8]}")
             else:
                 # If it fails but wasn't re-deferred (e.g., no capacity), add it back
-                if job not in self.deferred_jobs:
+                if len(self.deferred_jobs) == deferred_before:
                     print(f"[{self.region}] Job {job.job_id[:8]} remains deferred (no suitable agent available)")
                     self.deferred_jobs.append(job)
     
     def reassign_jobs_from_agent(self, source_agent: LocalAgent):
         """
         Reassigns all jobs from a source agent to the best available alternative.
-        Uses Beckn Status API to verify job status before moving.
+        Uses Beckn Status API to verify job status before moving; all orders are
+        checked concurrently and recently seen states are reused.
         """
         # Find best target agent (lowest score, available capacity, not source)
         candidates = [
@@ -424,23 +801,22 @@ class RegionalAgent:
         # Create a copy of items to iterate safely while modifying
         jobs_to_move = list(source_agent.current_jobs.values())
         
-        import uuid
+        # 0. Check Status via Beckn for every affected order at once
+        status_checker = get_order_status_checker(source_agent.beckn_client)
+        order_ids = [
+            source_agent.active_external_orders[job.job_id] for job in jobs_to_move
+            if job.job_id in source_agent.active_external_orders
+        ]
+        print(f"[{self.region}] Checking status for {len(order_ids)} orders on {source_agent.name}")
+        order_states = status_checker.check(order_ids, source_agent.name, f"https://{source_agent.name}/bpp")
         
         for job in jobs_to_move:
-            print(f"[{self.region}] Checking status for job {job.job_id[:8]} on {source_agent.name}")
-            
-            # 0. Check Status via Beckn
             can_move = True
             if job.job_id in source_agent.active_external_orders:
                 order_id = source_agent.active_external_orders[job.job_id]
-                transaction_id = str(uuid.uuid4())
-                bpp_id = source_agent.name
-                bpp_uri = f"https://{source_agent.name}/bpp"
-                
-                status_res = source_agent.beckn_client.status(transaction_id, bpp_id, bpp_uri, order_id)
+                status = order_states.get(order_id)
                 
-                if 'message' in status_res and 'order' in status_res['message']:
-                    status = status_res['message']['order'].get('beckn:orderStatus')
+                if status is not None:
                     print(f"[{self.region}] Job {job.job_id[:8]} status: {status}")
                     
                     # Only move if active/confirmed/in-progress
@@ -460,6 +836,9 @@ class RegionalAgent:
             if not shift_success:
                 print(f"[{self.region}] Failed to send workload shift update for job {job.job_id[:8]}")
                 continue
+            if job.job_id in source_agent.active_external_orders:
+                # The update changed the order's state on the BPP
+                status_checker.forget(source_agent.active_external_orders[job.job_id])
                 
             # 2. Assign to target agent (triggers Select/Init/Confirm)
             assign_success = target_agent.assign_job(job)
@@ -469,7 +848,9 @@ class RegionalAgent:
                 if job.job_id in source_agent.current_jobs:
                     del source_agent.current_jobs[job.job_id]
                     # Update source capacity
-                    source_agent.available_capacity = source_agent.total_capacity - len(source_agent.current_jobs)
+                    source_agent.available_capacity = (
+                        source_agent.total_capacity - len(source_agent.current_jobs) - source_agent.reserved_capacity
+                    )
                     
                 print(f"[{self.region}] Successfully reassigned job {job.job_id[:8]}")
             else:
@@ -0,0 +1,139 @@
+import re
+import threading
+from concurrent.futures import Future, InvalidStateError
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 30.0
+
+_DURATION_RE = re.compile(
+    r"^P(?:(?P<days>\d+(?:\.\d+)?)D)?"
+    r"(?:T(?:(?P<hours>\d+(?:\.\d+)?)H)?(?:(?P<minutes>\d+(?:\.\d+)?)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$"
+)
+
+
+def parse_ttl(ttl: Optional[str], default: float = DEFAULT_TTL_SECONDS) -> float:
+    """
+    Convert a Beckn context ttl (ISO 8601 duration, e.g. "PT30S") to seconds.
+
+    Args:
+        ttl: Duration string from the request context
+        default: Seconds used when the ttl is missing or malformed
+
+    Returns:
+        TTL in seconds
+    """
+    match = _DURATION_RE.match(ttl or "")
+    if not match or not any(match.groupdict().values()):
+        return default
+    parts = {name: float(value or 0) for name, value in match.groupdict().items()}
+    return parts["days"] * 86400 + parts["hours"] * 3600 + parts["minutes"] * 60 + parts["seconds"]
+
+
+class CallbackRegistry:
+    """
+    Correlates asynchronous Beckn callbacks (on_select, on_init, ...) with the
+    requests that caused them.
+
+    A request registers a Future under its (transaction_id, message_id) before it
+    is sent; the /bap/on_* endpoint resolves it when the BPP answers. Waiting is
+    done on the Future, so async callers hold no thread while a transaction is
+    open. Futures are thread-safe, so callbacks received on the API's event loop
+    can complete requests made from the placement loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], Tuple[str, Future]] = {}
+
+        # Simple counters for observability
+        self.resolved = 0
+        self.timed_out = 0
+        self.unmatched = 0
+
+    def expect(self, context: Dict) -> Future:
+        """
+        Register a request whose response will arrive as a callback.
+
+        Args:
+            context: Context of the outgoing request
+
+        Returns:
+            Future completed with the callback payload
+        """
+        future = Future()
+        key = (context["transaction_id"], context["message_id"])
+        with self._lock:
+            self._pending[key] = (f"on_{context['action']}", future)
+        return future
+
+    def discard(self, context: Dict, timed_out: bool = False):
+        """
+        Stop waiting for a request's callback (sent failed, answered inline or timed out).
+
+        Args:
+            context: Context of the outgoing request
+            timed_out: Count the request as timed out
+        """
+        with self._lock:
+            entry = self._pending.pop((context["transaction_id"], context["message_id"]), None)
+            if entry and timed_out:
+                self.timed_out += 1
+        if entry:
+            entry[1].cancel()
+
+    def resolve(self, payload: Dict) -> bool:
+        """
+        Complete the pending request a callback answers. The callback is matched
+        on its message_id, falling back to the oldest request of the same
+        transaction waiting for this action (some BPPs mint new message ids).
+
+        Args:
+            payload: Callback body as posted to /bap/on_*
+
+        Returns:
+            True if a pending request was found
+        """
+        context = payload.get("context", {})
+        transaction_id = context.get("transaction_id")
+        action = context.get("action")
+
+        with self._lock:
+            key = (transaction_id, context.get("message_id"))
+            entry = self._pending.get(key)
+            if entry is None or entry[0] != action:
+                key = next(
+                    (k for k, (expected, _) in self._pending.items() if k[0] == transaction_id and expected == action),
+                    None
+                )
+                entry = self._pending.get(key) if key else None
+            if entry is None:
+                self.unmatched += 1
+                return False
+            del self._pending[key]
+            self.resolved += 1
+
+        try:
+            entry[1].set_result(payload)
+        except InvalidStateError:
+            # The waiter gave up (ttl expired) just as the callback arrived
+            return False
+        return True
+
+    def pending(self) -> List[Tuple[str, str]]:
+        """(transaction_id, message_id) of every request still waiting."""
+        with self._lock:
+            return list(self._pending)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "resolved": self.resolved,
+            "timed_out": self.timed_out,
+            "unmatched": self.unmatched,
+        }
+
+
+# Global registry shared by all Beckn clients and the callback endpoints
+callback_registry = CallbackRegistry()
@@ -1,46 +1,275 @@
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import httpx
 import json
+import os
+import random
+import threading
+import time
 import uuid
+from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from beckn_callbacks import callback_registry, parse_ttl
+from beckn_payloads import (
+    ACCEPTED_OFFER_TEMPLATE, DELIVERY_TEMPLATE, FULFILLMENT_TEMPLATE, INVOICE, ORDER_ATTRIBUTES,
+    ORDER_ITEM_TEMPLATE, ORDER_TEMPLATE, UPDATE_ATTRIBUTES_TEMPLATE, context_template, dumps, utc_timestamp
+)
+
+DEFAULT_BASE_URL = "https://deg-hackathon-bap-sandbox.becknprotocol.io/api"
+DEFAULT_POOL_SIZE = 20
+DEFAULT_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_PER_BPP = 8
+
+# Retries per action. Discovery and reads are safe to repeat; confirm and update
+# change order state on the BPP, so they are never retried blindly.
+RETRY_POLICY = {
+    "discover": 2,
+    "select": 2,
+    "init": 1,
+    "confirm": 0,
+    "status": 2,
+    "update": 0,
+    "rating": 1,
+    "support": 2,
+}
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_MAX_SECONDS = 2.0
 
 class BecknClient:
-    def __init__(self, base_url: str = "https://deg-hackathon-bap-sandbox.becknprotocol.io/api"):
-        self.base_url = base_url
+    def __init__(self, base_url: Optional[str] = None, pool_size: Optional[int] = None,
+                 timeout: Optional[float] = None, retry_policy: Optional[Dict[str, int]] = None,
+                 max_per_bpp: Optional[int] = None):
+        """
+        Initialize the Beckn BAP client.
+        Agents should normally use get_beckn_client() to share one connection pool.
+        
+        Args:
+            base_url: BAP sandbox API root (defaults to BECKN_BASE_URL env var or the public sandbox)
+            pool_size: Keep-alive connections kept per host (defaults to BECKN_POOL_SIZE env var or 20)
+            timeout: Per-attempt request timeout in seconds (defaults to BECKN_TIMEOUT_S env var or 5)
+            retry_policy: Overrides for RETRY_POLICY (action -> retries after the first attempt)
+            max_per_bpp: Async requests in flight per BPP (defaults to BECKN_MAX_PER_BPP env var or 8)
+        """
+        self.base_url = base_url or os.environ.get("BECKN_BASE_URL", DEFAULT_BASE_URL)
         self.headers = {
             'Content-Type': 'application/json'
         }
+        self.pool_size = pool_size or int(os.environ.get("BECKN_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self.timeout = timeout or float(os.environ.get("BECKN_TIMEOUT_S", DEFAULT_TIMEOUT_SECONDS))
+        self.retry_policy = {**RETRY_POLICY, **(retry_policy or {})}
+        
+        # One keep-alive session so the order lifecycle reuses TCP+TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Async transport for concurrent lifecycles, created lazily per event loop
+        self.max_per_bpp = max_per_bpp or int(os.environ.get("BECKN_MAX_PER_BPP", DEFAULT_MAX_PER_BPP))
+        self._async_loop = None
+        self._async_session: Optional[httpx.AsyncClient] = None
+        self._bpp_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        # Asynchronous Beckn: the BPP ACKs select/init/confirm and posts the result
+        # to our /bap/on_* endpoints, which complete the matching pending request
+        self.callback_mode = os.environ.get("BECKN_CALLBACK_MODE", "false").lower() == "true"
+        self.callbacks = callback_registry
         # Default BAP details from sandbox example
         self.bap_id = "ev-charging.sandbox1.com"
-        self.bap_uri = "https://ev-charging.sandbox1.com.com/bap"
+        self.bap_uri = os.environ.get("BECKN_BAP_URI", "https://ev-charging.sandbox1.com.com/bap")
         self.domain = "beckn.one:DEG:compute-energy:1.0"
 
     def _create_context(self, action: str, transaction_id: str = None, message_id: str = None, bpp_id: str = None, bpp_uri: str = None) -> Dict:
+        # Static fields (version, domain, BAP identity, ttl, schema_context) come from a precompiled template
         context = {
-            "version": "2.0.0",
-            "action": action,
-            "domain": self.domain,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            **context_template(action, self.domain, self.bap_id, self.bap_uri),
+            "timestamp": utc_timestamp(),
             "message_id": message_id or str(uuid.uuid4()),
-            "transaction_id": transaction_id or str(uuid.uuid4()),
-            "bap_id": self.bap_id,
-            "bap_uri": self.bap_uri,
-            "ttl": "PT30S"
+            "transaction_id": transaction_id or str(uuid.uuid4())
         }
         # Only include bpp_id and bpp_uri if provided (not needed for discover)
         if bpp_id:
             context["bpp_id"] = bpp_id
         if bpp_uri:
             context["bpp_uri"] = bpp_uri
-        # Only include schema_context for actions that need it
-        if action in ["discover", "init", "confirm"]:
-            context["schema_context"] = [
-                "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/ComputeEnergy/v1/context.jsonld"
-            ]
         return context
 
+    def _post(self, action: str, payload: Dict, reject_errors: bool = True) -> Optional[Dict]:
+        """
+        POST a Beckn action through the pooled session, retrying transient failures
+        (connection errors, timeouts, 429/5xx) with exponential backoff and full jitter.
+        
+        Args:
+            action: Beckn action, also the URL path under base_url
+            payload: Request body
+            reject_errors: Treat a 200 response carrying an 'error' key as a failure
+            
+        Returns:
+            Parsed JSON response, or None so the caller can fall back to its mock response
+        """
+        url = f"{self.base_url}/{action}"
+        retries = self.retry_policy.get(action, 0)
+        body = dumps(payload)  # Serialized once, reused across retries
+        
+        for attempt in range(retries + 1):
+            retryable = False
+            try:
+                response = self.session.post(url, data=body, timeout=self.timeout)
+                if response.status_code == 200:
+                    data = response.json()
+                    if not (reject_errors and 'error' in data):
+                        return data
+                retryable = response.status_code in RETRYABLE_STATUS_CODES
+                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                retryable = True
+                print(f"BecknClient Exception: {e}")
+            except Exception as e:
+                print(f"BecknClient Exception: {e}")
+            
+            if not retryable or attempt == retries:
+                break
+            backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+            time.sleep(random.uniform(0, backoff))
+        
+        return None
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """
+        Returns the pooled async HTTP client for the running event loop.
+        httpx connections and asyncio semaphores are bound to the loop that created
+        them, so both are rebuilt if the client is driven from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_session = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            )
+            self._bpp_semaphores = {}
+        return self._async_session
+
+    def _bpp_semaphore(self, bpp_id: Optional[str]) -> asyncio.Semaphore:
+        key = bpp_id or "gateway"
+        semaphore = self._bpp_semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_per_bpp)
+            self._bpp_semaphores[key] = semaphore
+        return semaphore
+
+    async def _apost(self, action: str, payload: Dict, bpp_id: Optional[str] = None,
+                     reject_errors: bool = True) -> Optional[Dict]:
+        """
+        Async variant of _post(). At most max_per_bpp requests are in flight per BPP;
+        retries and backoff follow the same per-action policy.
+        
+        Args:
+            action: Beckn action, also the URL path under base_url
+            payload: Request body
+            bpp_id: BPP the request is addressed to, for the per-BPP concurrency limit
+            reject_errors: Treat a 200 response carrying an 'error' key as a failure
+            
+        Returns:
+            Parsed JSON response, or None so the caller can fall back to its mock response
+        """
+        session = self._get_async_session()
+        url = f"{self.base_url}/{action}"
+        retries = self.retry_policy.get(action, 0)
+        body = dumps(payload)  # Serialized once, reused across retries
+        
+        for attempt in range(retries + 1):
+            retryable = False
+            try:
+                async with self._bpp_semaphore(bpp_id):
+                    response = await session.post(url, content=body)
+                if response.status_code == 200:
+                    data = response.json()
+                    if not (reject_errors and 'error' in data):
+                        return data
+                retryable = response.status_code in RETRYABLE_STATUS_CODES
+                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
+            except httpx.TransportError as e:
+                retryable = True
+                print(f"BecknClient Exception: {e!r}")
+            except Exception as e:
+                print(f"BecknClient Exception: {e!r}")
+            
+            if not retryable or attempt == retries:
+                break
+            backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+            await asyncio.sleep(random.uniform(0, backoff))
+        
+        return None
+
+    @staticmethod
+    def _is_ack(response: Dict) -> bool:
+        return response.get("message", {}).get("ack", {}).get("status") == "ACK"
+
+    def _request(self, action: str, payload: Dict) -> Optional[Dict]:
+        """
+        Sends an order lifecycle action. In callback mode an ACK is followed by
+        waiting, up to the context ttl, for the matching on_<action> callback;
+        a response that already carries the result is returned as is.
+        
+        Returns:
+            Result payload, or None so the caller can fall back to its mock response
+        """
+        if not self.callback_mode:
+            return self._post(action, payload)
+        
+        context = payload["context"]
+        future = self.callbacks.expect(context)
+        response = self._post(action, payload)
+        if response is None or not self._is_ack(response):
+            self.callbacks.discard(context)
+            return response
+        
+        try:
+            return future.result(timeout=parse_ttl(context.get("ttl")))
+        except FutureTimeout:
+            self.callbacks.discard(context, timed_out=True)
+            print(f"BecknClient: no on_{action} within ttl for transaction {context['transaction_id']}")
+            return None
+
+    async def _arequest(self, action: str, payload: Dict, bpp_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        Async variant of _request(). The wait holds no thread, so any number of
+        transactions can be open at once.
+        """
+        if not self.callback_mode:
+            return await self._apost(action, payload, bpp_id=bpp_id)
+        
+        context = payload["context"]
+        future = self.callbacks.expect(context)
+        response = await self._apost(action, payload, bpp_id=bpp_id)
+        if response is None or not self._is_ack(response):
+            self.callbacks.discard(context)
+            return response
+        
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), parse_ttl(context.get("ttl")))
+        except asyncio.TimeoutError:
+            self.callbacks.discard(context, timed_out=True)
+            print(f"BecknClient: no on_{action} within ttl for transaction {context['transaction_id']}")
+            return None
+
+    @staticmethod
+    def is_fallback(response: Dict) -> bool:
+        """True if a response is the client's built-in mock rather than a network reply."""
+        return bool(response.get("fallback"))
+
     def discover(self, query: str = "Grid flexibility windows") -> Dict:
-        url = f"{self.base_url}/discover"
         payload = {
             "context": self._create_context("discover"),
             "message": {
@@ -51,18 +280,14 @@ class BecknClient:
                 }
             }
         }
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200 and 'error' not in response.json():
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        response = self._post("discover", payload)
+        if response is not None:
+            return response
             
         # Mock Response for Verification/Fallback
         print("BecknClient: Using Mock Discovery Response")
         return {
+            "fallback": True,  # Not from the network; see is_fallback()
             "context": self._create_context("on_discover"),
             "message": {
                 "catalog": {
@@ -91,44 +316,83 @@ class BecknClient:
         }
 
     def select(self, transaction_id: str, bpp_id: str, bpp_uri: str, item_id: str, provider_id: str) -> Dict:
-        # ... (keep existing payload construction)
-        url = f"{self.base_url}/select"
+        payload = self._select_payload(transaction_id, bpp_id, bpp_uri, item_id, provider_id)
+        response = self._request("select", payload)
+        if response is not None:
+            return response
+
+        # Mock Response
+        return {
+            "message": {
+                "order": payload["message"]["order"]
+            }
+        }
+
+    async def aselect(self, transaction_id: str, bpp_id: str, bpp_uri: str, item_id: str, provider_id: str) -> Dict:
+        """Async variant of select()."""
+        payload = self._select_payload(transaction_id, bpp_id, bpp_uri, item_id, provider_id)
+        response = await self._arequest("select", payload, bpp_id=bpp_id)
+        if response is not None:
+            return response
+
+        # Mock Response
+        return {
+            "message": {
+                "order": payload["message"]["order"]
+            }
+        }
+
+    def _select_payload(self, transaction_id: str, bpp_id: str, bpp_uri: str, item_id: str, provider_id: str,
+                        line_ids: Optional[List[str]] = None) -> Dict:
         payload = {
             "context": self._create_context("select", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
             "message": {
                 "order": {
-                    "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld",
-                    "@type": "beckn:Order",
+                    **ORDER_TEMPLATE,
                     "beckn:id": str(uuid.uuid4()),
                     "beckn:orderStatus": "QUOTE_REQUESTED",
                     "beckn:seller": bpp_id,
                     "beckn:buyer": self.bap_id,
                     "beckn:orderItems": [
-                        {
-                            "@type": "beckn:OrderItem",
-                            "beckn:lineId": str(uuid.uuid4()),
-                            "beckn:orderedItem": "consumer-resource-office-003", 
-                            "beckn:quantity": 1,
-                            "beckn:acceptedOffer": {
-                                "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld",
-                                "@type": "beckn:Offer",
-                                "beckn:id": f"offer-for-{item_id}",
-                                "beckn:items": [item_id],
-                                "beckn:provider": provider_id
-                            }
-                        }
+                        self._order_item(item_id, provider_id, line_id)
+                        for line_id in (line_ids or [str(uuid.uuid4())])
                     ]
                 }
             }
         }
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200 and 'error' not in response.json():
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        return payload
+
+    def _order_item(self, item_id: str, provider_id: str, line_id: str) -> Dict:
+        return {
+            **ORDER_ITEM_TEMPLATE,
+            "beckn:lineId": line_id,
+            "beckn:acceptedOffer": {
+                **ACCEPTED_OFFER_TEMPLATE,
+                "beckn:id": f"offer-for-{item_id}",
+                "beckn:items": [item_id],
+                "beckn:provider": provider_id
+            }
+        }
+
+    def select_batch(self, transaction_id: str, bpp_id: str, bpp_uri: str, item_id: str, provider_id: str,
+                     jobs: List[Any]) -> Dict:
+        """
+        Select one order with an order item per job. Each line id is
+        "line-<job_id>" so the confirmation can be split back per job.
+        
+        Args:
+            transaction_id: Beckn transaction ID
+            bpp_id: Provider platform ID
+            bpp_uri: Provider platform URI
+            item_id: Catalog item every line orders
+            provider_id: Provider offering the item
+            jobs: ComputeJob objects, one order item each
+        """
+        line_ids = [self.line_id_for(job) for job in jobs]
+        payload = self._select_payload(transaction_id, bpp_id, bpp_uri, item_id, provider_id, line_ids)
+        response = self._request("select", payload)
+        if response is not None:
+            return response
 
         # Mock Response
         return {
@@ -137,6 +401,10 @@ class BecknClient:
             }
         }
 
+    @staticmethod
+    def line_id_for(job: Any) -> str:
+        return f"line-{job.job_id}"
+
     def init(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict, job: Optional[Any] = None) -> Dict:
         """
         Initialize an order with full Compute-Energy specification compliance.
@@ -148,8 +416,42 @@ class BecknClient:
             order_details: Base order details from select response
             job: Optional ComputeJob object to enrich order with compute-energy fields
         """
-        url = f"{self.base_url}/init"
+        payload = self._init_payload(transaction_id, bpp_id, bpp_uri, order_details, job)
+        response = self._request("init", payload)
+        if response is not None:
+            return response
+
+        return payload
+
+    async def ainit(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict, job: Optional[Any] = None) -> Dict:
+        """Async variant of init()."""
+        payload = self._init_payload(transaction_id, bpp_id, bpp_uri, order_details, job)
+        response = await self._arequest("init", payload, bpp_id=bpp_id)
+        if response is not None:
+            return response
+
+        return payload
+
+    def init_batch(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict, jobs: List[Any]) -> Dict:
+        """
+        Initialize a multi-job order from select_batch(), attaching each job's
+        ComputeEnergyFulfillment to its order item.
         
+        Args:
+            transaction_id: Beckn transaction ID
+            bpp_id: Provider platform ID
+            bpp_uri: Provider platform URI
+            order_details: Base order details from select_batch response
+            jobs: ComputeJob objects in the order
+        """
+        payload = self._init_batch_payload(transaction_id, bpp_id, bpp_uri, order_details, jobs)
+        response = self._request("init", payload)
+        if response is not None:
+            return response
+
+        return payload
+
+    def _init_payload(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict, job: Optional[Any] = None) -> Dict:
         # Start with base order from select
         enriched_order = order_details.copy()
         enriched_order["beckn:orderStatus"] = "INITIALIZED"
@@ -157,71 +459,13 @@ class BecknClient:
         # If ComputeJob provided, enrich with Compute-Energy specific fields
         if job:
             # Add fulfillment details
-            enriched_order["beckn:fulfillment"] = {
-                "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld",
-                "@type": "beckn:Fulfillment",
-                "beckn:id": f"fulfillment-{job.job_id}",
-                "beckn:mode": "GRID-BASED",
-                "beckn:status": "PENDING",
-                "beckn:deliveryAttributes": {
-                    "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/ComputeEnergy/v1/context.jsonld",
-                    "@type": "beckn:ComputeEnergyFulfillment",
-                    "beckn:computeLoad": job.estimated_runtime_hrs * 1.2,  # Estimate MW based on runtime
-                    "beckn:computeLoadUnit": "MW",
-                    "beckn:location": {
-                        "@type": "beckn:Location",
-                        "geo": {
-                            "type": "Point",
-                            "coordinates": [0.0, 0.0]  # Will be set by local agent
-                        },
-                        "address": {
-                            "streetAddress": "Compute Data Centre",
-                            "addressLocality": "Unknown",
-                            "addressRegion": "UK",
-                            "postalCode": "00000",
-                            "addressCountry": "GB"
-                        }
-                    },
-                    "beckn:timeWindow": {
-                        "start": (job.start_time_earliest or datetime.utcnow()).isoformat() + "Z",
-                        "end": (job.deadline_latest or (datetime.utcnow() + timedelta(hours=job.estimated_runtime_hrs))).isoformat() + "Z"
-                    },
-                    "beckn:workloadMetadata": {
-                        "workloadType": "BATCH_COMPUTE",  # Could be AI_TRAINING, BATCH_PROCESSING, etc.
-                        "workloadId": job.job_id,
-                        "gpuHours": job.estimated_runtime_hrs * 8,  # Estimate GPU hours
-                        "carbonBudget": job.estimated_runtime_hrs * 100,  # Estimate carbon budget
-                        "carbonBudgetUnit": "kgCO2"
-                    }
-                }
-            }
+            enriched_order["beckn:fulfillment"] = self.compute_fulfillment(job)
             
             # Add order attributes
-            enriched_order["beckn:orderAttributes"] = {
-                "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/ComputeEnergy/v1/context.jsonld",
-                "@type": "beckn:ComputeEnergyOrder",
-                "beckn:requestType": "compute_slot_reservation",
-                "beckn:priority": "medium" if job.priority <= 3 else "high",
-                "beckn:flexibilityLevel": "high"  # Assume high flexibility for batch jobs
-            }
+            enriched_order["beckn:orderAttributes"] = self._order_attributes(job.priority)
             
             # Add invoice/customer information
-            enriched_order["beckn:invoice"] = {
-                "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld",
-                "@type": "schema:Invoice",
-                "schema:customer": {
-                    "email": "compute@deg-system.ai",
-                    "phone": "+44 0000 000000",
-                    "legalName": "Digital Energy Grid System",
-                    "address": {
-                        "streetAddress": "DEG Headquarters",
-                        "addressLocality": "London",
-                        "addressRegion": "Greater London",
-                        "postalCode": "SW1A 1AA",
-                        "addressCountry": "GB"
-                    }
-                }
-            }
+            enriched_order["beckn:invoice"] = self._invoice()
         
         payload = {
             "context": self._create_context("init", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
@@ -229,20 +473,102 @@ class BecknClient:
                 "order": enriched_order
             }
         }
-        
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200 and 'error' not in response.json():
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        return payload
 
+    def _init_batch_payload(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict,
+                            jobs: List[Any]) -> Dict:
+        # Start with base order from select
+        enriched_order = order_details.copy()
+        enriched_order["beckn:orderStatus"] = "INITIALIZED"
+        
+        # Each order item carries its own job's fulfillment, matched by line id
+        jobs_by_line = {self.line_id_for(job): job for job in jobs}
+        order_items = []
+        for order_item in enriched_order.get("beckn:orderItems", []):
+            order_item = order_item.copy()
+            job = jobs_by_line.get(order_item.get("beckn:lineId"))
+            if job:
+                order_item["beckn:fulfillment"] = self.compute_fulfillment(job)
+            order_items.append(order_item)
+        enriched_order["beckn:orderItems"] = order_items
+        
+        enriched_order["beckn:orderAttributes"] = self._order_attributes(max(job.priority for job in jobs))
+        enriched_order["beckn:invoice"] = self._invoice()
+        
+        payload = {
+            "context": self._create_context("init", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
+            "message": {
+                "order": enriched_order
+            }
+        }
         return payload
 
+    def compute_fulfillment(self, job: Any) -> Dict:
+        """
+        ComputeEnergyFulfillment for a job. The location is built fresh on every
+        call because local agents patch it with their own coordinates.
+        """
+        now = datetime.utcnow()
+        return {
+            **FULFILLMENT_TEMPLATE,
+            "beckn:id": f"fulfillment-{job.job_id}",
+            "beckn:deliveryAttributes": {
+                **DELIVERY_TEMPLATE,
+                "beckn:computeLoad": job.estimated_runtime_hrs * 1.2,  # Estimate MW based on runtime
+                "beckn:location": {
+                    "@type": "beckn:Location",
+                    "geo": {
+                        "type": "Point",
+                        "coordinates": [0.0, 0.0]  # Will be set by local agent
+                    },
+                    "address": {
+                        "streetAddress": "Compute Data Centre",
+                        "addressLocality": "Unknown",
+                        "addressRegion": "UK",
+                        "postalCode": "00000",
+                        "addressCountry": "GB"
+                    }
+                },
+                "beckn:timeWindow": {
+                    "start": (job.start_time_earliest or now).isoformat() + "Z",
+                    "end": (job.deadline_latest or (now + timedelta(hours=job.estimated_runtime_hrs))).isoformat() + "Z"
+                },
+                "beckn:workloadMetadata": {
+                    "workloadType": "BATCH_COMPUTE",  # Could be AI_TRAINING, BATCH_PROCESSING, etc.
+                    "workloadId": job.job_id,
+                    "gpuHours": job.estimated_runtime_hrs * 8,  # Estimate GPU hours
+                    "carbonBudget": job.estimated_runtime_hrs * 100,  # Estimate carbon budget
+                    "carbonBudgetUnit": "kgCO2"
+                }
+            }
+        }
+
+    def _order_attributes(self, priority: int) -> Dict:
+        # Shared precompiled fragment; treat as read-only
+        return ORDER_ATTRIBUTES["medium" if priority <= 3 else "high"]
+
+    def _invoice(self) -> Dict:
+        # Shared precompiled fragment; treat as read-only
+        return INVOICE
+
     def confirm(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict) -> Dict:
-        url = f"{self.base_url}/confirm"
+        payload = self._confirm_payload(transaction_id, bpp_id, bpp_uri, order_details)
+        response = self._request("confirm", payload)
+        if response is not None:
+            return response
+
+        return payload
+
+    async def aconfirm(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict) -> Dict:
+        """Async variant of confirm()."""
+        payload = self._confirm_payload(transaction_id, bpp_id, bpp_uri, order_details)
+        response = await self._arequest("confirm", payload, bpp_id=bpp_id)
+        if response is not None:
+            return response
+
+        return payload
+
+    def _confirm_payload(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_details: Dict) -> Dict:
         payload = {
             "context": self._create_context("confirm", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
             "message": {
@@ -250,20 +576,9 @@ class BecknClient:
             }
         }
         payload["message"]["order"]["beckn:orderStatus"] = "CONFIRMED" # Mock success directly
-        
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200 and 'error' not in response.json():
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
-
         return payload
 
     def status(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str) -> Dict:
-        url = f"{self.base_url}/status"
         payload = {
             "context": self._create_context("status", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
             "message": {
@@ -272,21 +587,34 @@ class BecknClient:
                 }
             }
         }
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        response = self._post("status", payload, reject_errors=False)
+        if response is not None:
+            return response
         
         return {"message": {"order": {"beckn:id": order_id, "beckn:orderStatus": "UNKNOWN"}}}
 
-    def update(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str, update_type: str, update_details: Dict) -> Dict:
-        """Update an order with flexibility actions or acknowledgements"""
-        url = f"{self.base_url}/update"
+    def update(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str, update_type: str, update_details: Dict,
+               order_status: str = "IN_PROGRESS") -> Dict:
+        """Update an order with flexibility actions or acknowledgements (or cancel it with order_status="CANCELLED")"""
+        payload = self._update_payload(transaction_id, bpp_id, bpp_uri, order_id, update_type, update_details, order_status)
+        response = self._post("update", payload, reject_errors=False)
+        if response is not None:
+            return response
+        
+        return payload
+
+    async def aupdate(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str, update_type: str,
+                      update_details: Dict, order_status: str = "IN_PROGRESS") -> Dict:
+        """Async variant of update()."""
+        payload = self._update_payload(transaction_id, bpp_id, bpp_uri, order_id, update_type, update_details, order_status)
+        response = await self._apost("update", payload, bpp_id=bpp_id, reject_errors=False)
+        if response is not None:
+            return response
         
+        return payload
+
+    def _update_payload(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str, update_type: str,
+                        update_details: Dict, order_status: str) -> Dict:
         # Construct fulfillment payload
         fulfillment_payload = update_details.get("fulfillment", {})
         
@@ -302,37 +630,24 @@ class BecknClient:
             "context": self._create_context("update", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
             "message": {
                 "order": {
-                    "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld",
-                    "@type": "beckn:Order",
+                    **ORDER_TEMPLATE,
                     "beckn:id": order_id,
-                    "beckn:orderStatus": "IN_PROGRESS",
+                    "beckn:orderStatus": order_status,
                     "beckn:seller": bpp_id,
                     "beckn:buyer": self.bap_id,
                     "beckn:fulfillment": fulfillment_payload,
                     "beckn:orderAttributes": {
-                        "@context": "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/ComputeEnergy/v1/context.jsonld",
-                        "@type": "beckn:ComputeEnergyOrder",
+                        **UPDATE_ATTRIBUTES_TEMPLATE,
                         "beckn:updateType": update_type,
-                        "beckn:updateTimestamp": datetime.utcnow().isoformat() + "Z"
+                        "beckn:updateTimestamp": utc_timestamp()
                     }
                 }
             }
         }
-        
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
-        
         return payload
 
     def rating(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str, rating_value: int, feedback: Dict = None) -> Dict:
         """Submit a rating for a completed order"""
-        url = f"{self.base_url}/rating"
         message = {
             "id": order_id,
             "value": rating_value,
@@ -348,20 +663,14 @@ class BecknClient:
             "message": message
         }
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        response = self._post("rating", payload, reject_errors=False)
+        if response is not None:
+            return response
         
         return {"message": {"ack": {"status": "ACK"}}}
 
     def support(self, transaction_id: str, bpp_id: str, bpp_uri: str, order_id: str) -> Dict:
         """Request support for an order"""
-        url = f"{self.base_url}/support"
         payload = {
             "context": self._create_context("support", transaction_id=transaction_id, bpp_id=bpp_id, bpp_uri=bpp_uri),
             "message": {
@@ -370,13 +679,32 @@ class BecknClient:
             }
         }
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"BecknClient Error: Status {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"BecknClient Exception: {e}")
+        response = self._post("support", payload, reject_errors=False)
+        if response is not None:
+            return response
         
         return {"message": {"support": {"email": "support@example.com", "phone": "+44 1234 567890"}}}
+
+
+_shared_clients: Dict[str, BecknClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_beckn_client(base_url: Optional[str] = None) -> BecknClient:
+    """
+    Returns the process-wide BecknClient for a BAP endpoint, creating it on first use.
+    Agents share its keep-alive connection pool instead of each opening their own.
+    
+    Args:
+        base_url: BAP sandbox API root (defaults to BECKN_BASE_URL env var or the public sandbox)
+        
+    Returns:
+        Shared BecknClient instance
+    """
+    base_url = base_url or os.environ.get("BECKN_BASE_URL", DEFAULT_BASE_URL)
+    with _shared_clients_lock:
+        client = _shared_clients.get(base_url)
+        if client is None:
+            client = BecknClient(base_url=base_url)
+            _shared_clients[base_url] = client
+        return client
@@ -0,0 +1,131 @@
+import json
+import time
+from functools import lru_cache
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library encoder
+    orjson = None
+
+CORE_CONTEXT = "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/core/v2/context.jsonld"
+COMPUTE_ENERGY_CONTEXT = "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/draft/schema/ComputeEnergy/v1/context.jsonld"
+
+# Actions whose context carries the ComputeEnergy schema
+SCHEMA_CONTEXT_ACTIONS = ("discover", "init", "confirm")
+SCHEMA_CONTEXT = [COMPUTE_ENERGY_CONTEXT]
+DEFAULT_TTL = "PT30S"
+
+# Precompiled fragments. These are shared between payloads and must not be
+# mutated; builders copy a template with {**template, ...} and patch only the
+# fields that vary per request.
+ORDER_TEMPLATE = {
+    "@context": CORE_CONTEXT,
+    "@type": "beckn:Order",
+}
+
+ACCEPTED_OFFER_TEMPLATE = {
+    "@context": CORE_CONTEXT,
+    "@type": "beckn:Offer",
+}
+
+ORDER_ITEM_TEMPLATE = {
+    "@type": "beckn:OrderItem",
+    "beckn:orderedItem": "consumer-resource-office-003",
+    "beckn:quantity": 1,
+}
+
+FULFILLMENT_TEMPLATE = {
+    "@context": CORE_CONTEXT,
+    "@type": "beckn:Fulfillment",
+    "beckn:mode": "GRID-BASED",
+    "beckn:status": "PENDING",
+}
+
+DELIVERY_TEMPLATE = {
+    "@context": COMPUTE_ENERGY_CONTEXT,
+    "@type": "beckn:ComputeEnergyFulfillment",
+    "beckn:computeLoadUnit": "MW",
+}
+
+ORDER_ATTRIBUTES = {
+    priority: {
+        "@context": COMPUTE_ENERGY_CONTEXT,
+        "@type": "beckn:ComputeEnergyOrder",
+        "beckn:requestType": "compute_slot_reservation",
+        "beckn:priority": priority,
+        "beckn:flexibilityLevel": "high"  # Assume high flexibility for batch jobs
+    }
+    for priority in ("medium", "high")
+}
+
+UPDATE_ATTRIBUTES_TEMPLATE = {
+    "@context": COMPUTE_ENERGY_CONTEXT,
+    "@type": "beckn:ComputeEnergyOrder",
+}
+
+INVOICE = {
+    "@context": CORE_CONTEXT,
+    "@type": "schema:Invoice",
+    "schema:customer": {
+        "email": "compute@deg-system.ai",
+        "phone": "+44 0000 000000",
+        "legalName": "Digital Energy Grid System",
+        "address": {
+            "streetAddress": "DEG Headquarters",
+            "addressLocality": "London",
+            "addressRegion": "Greater London",
+            "postalCode": "SW1A 1AA",
+            "addressCountry": "GB"
+        }
+    }
+}
+
+
+@lru_cache(maxsize=64)
+def context_template(action: str, domain: str, bap_id: str, bap_uri: str) -> Dict:
+    """
+    Static part of a request context, built once per action and BAP identity.
+    Callers copy it and add timestamp, ids and BPP details.
+    """
+    context = {
+        "version": "2.0.0",
+        "action": action,
+        "domain": domain,
+        "bap_id": bap_id,
+        "bap_uri": bap_uri,
+        "ttl": DEFAULT_TTL
+    }
+    if action in SCHEMA_CONTEXT_ACTIONS:
+        context["schema_context"] = SCHEMA_CONTEXT
+    return context
+
+
+_timestamp_cache = (None, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as "YYYY-MM-DDTHH:MM:SS.mmmZ". The formatted seconds are
+    reused until the clock moves on, so most calls only format milliseconds.
+    """
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}Z"
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize a payload to compact JSON bytes, using orjson when installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # Types orjson rejects (e.g. float subclasses) go through json below
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
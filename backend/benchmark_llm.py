@@ -0,0 +1,109 @@
+"""
+Offline benchmark for LLM-backed regional aggregation.
+
+Starts the local LLM stub (simulation/llm_stub.py) in-process, builds the
+9-city agent hierarchy and measures how long a full summary refresh takes
+under each synthesis strategy. No network access or ASI API key is needed.
+
+    python benchmark_llm.py --latency-ms 800 --rounds 3
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from statistics import mean
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn
+
+from simulation.llm_stub import StubConfig, create_app
+from simulation.data_generator import DataGenerator
+from llm_client import LLMClient
+
+CITIES = [
+    ("Cambridge", "South UK"), ("London", "South UK"), ("Bristol", "South UK"), ("Birmingham", "South UK"),
+    ("Manchester", "North UK"), ("Liverpool", "North UK"), ("Leeds", "North UK"),
+    ("Edinburgh", "North UK"), ("Glasgow", "North UK"),
+]
+
+
+def start_stub(config: StubConfig, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(create_app(config), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def build_regions(llm_client: LLMClient):
+    from agents.regional_agent import RegionalAgent
+    from agents.local_agent import LocalAgent
+
+    generator = DataGenerator()
+    regions = {}
+    for city, region_name in CITIES:
+        if region_name not in regions:
+            regions[region_name] = RegionalAgent(name=f"{region_name} Regional", region=region_name)
+            regions[region_name].llm_client = llm_client
+        agent = LocalAgent(name=city, region=region_name, generator=generator)
+        agent.llm_client = llm_client
+        agent.energy_data = generator.get_energy_data(datetime.now(), region_name)
+        agent.cost_score = agent.compute_cost_score(datetime.now())
+        regions[region_name].register_local_agent(agent)
+    return list(regions.values())
+
+
+def run_strategy(name: str, regions, rounds: int, batch: bool, concurrency: int):
+    timings = []
+    for _ in range(rounds):
+        for region in regions:
+            region.batch_synthesis = batch
+            region.llm_concurrency = concurrency
+            region.narrated_order = []  # Force narration every round
+            for agent in region.local_agents:
+                agent.summary_cache.clear()  # Force synthesis every round
+
+        started = time.perf_counter()
+        for region in regions:
+            region.refresh_summaries()
+        timings.append(time.perf_counter() - started)
+
+    print(f"{name:<28} mean {mean(timings):6.2f}s   min {min(timings):6.2f}s   max {max(timings):6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM synthesis strategies against the local stub")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed
+    )
+    start_stub(config, args.port)
+
+    llm_client = LLMClient(api_key="stub", mode="llm", base_url=f"http://127.0.0.1:{args.port}/v1")
+    regions = build_regions(llm_client)
+
+    print(f"\nLLM stub: {args.latency_ms:.0f}ms median latency, {args.error_rate:.0%} errors, "
+          f"{args.tokens_per_second:.0f} tok/s, {len(CITIES)} agents in {len(regions)} regions\n")
+    run_strategy("Sequential (1 at a time)", regions, args.rounds, batch=False, concurrency=1)
+    run_strategy("Concurrent fan-out", regions, args.rounds, batch=False, concurrency=8)
+    run_strategy("Batched (1 per region)", regions, args.rounds, batch=True, concurrency=8)
+
+
+if __name__ == "__main__":
+    main()
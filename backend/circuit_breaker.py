@@ -0,0 +1,87 @@
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for calls to a remote endpoint.
+
+    CLOSED:    calls go through; consecutive failures (or slow calls) are counted.
+    OPEN:      calls are rejected immediately until `reset_timeout_seconds` has passed.
+    HALF_OPEN: a single probe call is let through; success closes the breaker,
+               failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, slow_call_seconds: float = 10.0,
+                 reset_timeout_seconds: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures or slow calls before the breaker opens
+            slow_call_seconds: Calls slower than this count as failures
+            reset_timeout_seconds: How long the breaker stays open before allowing a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout_seconds = reset_timeout_seconds
+
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Returns True if a call may proceed. In HALF_OPEN only one probe is allowed at a time.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self, latency_seconds: float = 0.0):
+        """
+        Records a completed call. Calls slower than slow_call_seconds count as failures.
+        """
+        if latency_seconds > self.slow_call_seconds:
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Records a failed (or slow) call, opening the breaker if the threshold is reached."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    print(f"⚠️  Circuit breaker opened after {self._consecutive_failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional
+
+
+class DiscoveryIndex:
+    """
+    Lookup tables built from one Beckn discover response.
+
+    The catalog is walked once: locality -> location record and item id -> offer
+    price. Agents then look up their own slot in O(1) instead of re-scanning the
+    whole catalog. Records are shared between agents and must not be mutated.
+    """
+
+    def __init__(self, result: Dict):
+        """
+        Parse a discovery response.
+
+        Args:
+            result: Beckn discover response
+        """
+        self.locations: List[Dict] = []
+        self.by_locality: Dict[str, Dict] = {}
+        self.prices: Dict[str, float] = {}
+
+        try:
+            catalogs = result.get("message", {}).get("catalogs", [])
+            for catalog in catalogs:
+                self._index_items(catalog.get("beckn:items", []))
+                self._index_offers(catalog.get("beckn:offers", []))
+        except Exception as e:
+            print(f"Error indexing discovery result: {e}")
+
+    def _index_items(self, items: List[Dict]):
+        for item in items:
+            # Extract location from beckn:availableAt
+            available_at = item.get("beckn:availableAt", [])
+            if not available_at:
+                continue
+
+            address = available_at[0].get("address", {})
+
+            # Extract grid parameters
+            item_attrs = item.get("beckn:itemAttributes", {})
+            grid_params = item_attrs.get("beckn:gridParameters", {})
+
+            location_info = {
+                "item_id": item.get("beckn:id", ""),
+                "name": item.get("beckn:descriptor", {}).get("schema:name", ""),
+                "locality": address.get("addressLocality", "Unknown"),
+                "region": address.get("addressRegion", "Unknown"),
+                "country": address.get("addressCountry", "GB"),
+                "grid_area": grid_params.get("gridArea", ""),
+                "grid_zone": grid_params.get("gridZone", ""),
+                "renewable_mix": grid_params.get("renewableMix", 0),
+                "carbon_intensity": grid_params.get("carbonIntensity", 0),
+                "available_capacity": item_attrs.get("beckn:capacityParameters", {}).get("availableCapacity", 0)
+            }
+
+            self.locations.append(location_info)
+            # First item per locality wins, matching a linear scan
+            self.by_locality.setdefault(location_info["locality"], location_info)
+
+    def _index_offers(self, offers: List[Dict]):
+        for offer in offers:
+            price_obj = offer.get("beckn:price", {})
+            if not price_obj or "value" not in price_obj:
+                continue
+            try:
+                price = float(price_obj["value"])
+            except (TypeError, ValueError):
+                continue
+            for item_id in offer.get("beckn:items", []):
+                # First offer per item wins, matching a linear scan
+                self.prices.setdefault(item_id, price)
+
+    def location(self, locality: str) -> Optional[Dict]:
+        """Location record for a locality, or None if not in the catalog."""
+        return self.by_locality.get(locality)
+
+    def price(self, item_id: Optional[str]) -> Optional[float]:
+        """Offer price (GBP/kWh) for an item id, or None if no offer lists it."""
+        return self.prices.get(item_id) if item_id else None
@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from beckn_client import BecknClient, get_beckn_client
+from discovery_index import DiscoveryIndex
+
+DEFAULT_QUERY = "Grid flexibility windows"
+DEFAULT_TTL_SECONDS = 15.0
+DEFAULT_FAILURE_TTL_SECONDS = 3.0
+
+
+class DiscoveryService:
+    """
+    Shared front for Beckn discover calls.
+
+    Identical queries issued while a request is in flight wait for that request
+    instead of sending their own (single-flight), and the result is reused for
+    `ttl_seconds`, so one simulation step costs one discover round trip no matter
+    how many agents ask. Each result is parsed once into a DiscoveryIndex that
+    is shared with it. Callers must treat both as read-only.
+
+    When the BPP can't be reached the client answers with its mock fallback.
+    That is reused only for the short `failure_ttl_seconds`, so an outage costs
+    one slow discover every few seconds rather than one per agent, and it is
+    never announced to listeners as a new result.
+    """
+
+    def __init__(self, beckn_client: BecknClient, ttl_seconds: Optional[float] = None,
+                 failure_ttl_seconds: Optional[float] = None):
+        """
+        Initialize the discovery service.
+
+        Args:
+            beckn_client: Client used for the underlying discover requests
+            ttl_seconds: How long a result is reused (defaults to DISCOVERY_TTL_S env var or 15)
+            failure_ttl_seconds: How long the mock fallback is reused (defaults to DISCOVERY_FAILURE_TTL_S env var or 3)
+        """
+        self.beckn_client = beckn_client
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.environ.get("DISCOVERY_TTL_S", DEFAULT_TTL_SECONDS)
+        )
+        self.failure_ttl_seconds = failure_ttl_seconds if failure_ttl_seconds is not None else float(
+            os.environ.get("DISCOVERY_FAILURE_TTL_S", DEFAULT_FAILURE_TTL_SECONDS)
+        )
+        self._lock = threading.Lock()
+        self._results: Dict[str, Tuple[float, Dict, DiscoveryIndex]] = {}  # query -> (expires at, result, index)
+        self._in_flight: Dict[str, Future] = {}
+        self._listeners: List[Callable[[Dict, DiscoveryIndex], None]] = []
+
+        # Simple counters for observability
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.failures = 0  # Requests answered by the client's mock fallback
+
+    def discover(self, query: str = DEFAULT_QUERY) -> Dict:
+        """
+        Returns the discovery result for a query, from cache, from an identical
+        in-flight request, or from a new request.
+
+        Args:
+            query: Discover text search
+
+        Returns:
+            Beckn discover response
+        """
+        return self.discover_indexed(query)[0]
+
+    def discover_indexed(self, query: str = DEFAULT_QUERY) -> Tuple[Dict, DiscoveryIndex]:
+        """
+        Like discover(), but also returns the index built from the result.
+
+        Args:
+            query: Discover text search
+
+        Returns:
+            (Beckn discover response, DiscoveryIndex)
+        """
+        with self._lock:
+            cached = self._results.get(query)
+            if cached and time.monotonic() <= cached[0]:
+                self.cache_hits += 1
+                return cached[1], cached[2]
+
+            future = self._in_flight.get(query)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[query] = future
+                self.requests += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = self.beckn_client.discover(query=query)
+            index = DiscoveryIndex(result)
+        except Exception as e:
+            with self._lock:
+                del self._in_flight[query]
+            future.set_exception(e)
+            raise
+
+        # The client's mock fallback stands in for a failed request: share it with
+        # the waiters and cache it briefly, but don't announce it as a new result
+        fallback = BecknClient.is_fallback(result)
+        with self._lock:
+            if fallback:
+                self.failures += 1
+            ttl = self.failure_ttl_seconds if fallback else self.ttl_seconds
+            self._results[query] = (time.monotonic() + ttl, result, index)
+            del self._in_flight[query]
+        future.set_result((result, index))
+        if fallback:
+            return result, index
+
+        for listener in list(self._listeners):
+            try:
+                listener(result, index)
+            except Exception as e:
+                print(f"Discovery listener failed: {e}")
+        return result, index
+
+    def add_listener(self, listener: Callable[[Dict, DiscoveryIndex], None]):
+        """
+        Register a callback run with (result, index) each time a new discovery
+        result is fetched (not on cache hits). Listeners run on the fetching
+        thread and should hand slow work off.
+        """
+        self._listeners.append(listener)
+
+    def invalidate(self, query: Optional[str] = None):
+        """
+        Drop cached results so the next discover goes to the network.
+
+        Args:
+            query: Query to drop, or None to drop all
+        """
+        with self._lock:
+            if query is None:
+                self._results.clear()
+            else:
+                self._results.pop(query, None)
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "ttl_seconds": self.ttl_seconds,
+            "failure_ttl_seconds": self.failure_ttl_seconds,
+        }
+
+
+_services: "weakref.WeakKeyDictionary[BecknClient, DiscoveryService]" = weakref.WeakKeyDictionary()
+_services_lock = threading.Lock()
+
+
+def get_discovery_service(beckn_client: Optional[BecknClient] = None) -> DiscoveryService:
+    """
+    Returns the shared DiscoveryService for a Beckn client, creating it on first use.
+    Agents that share a client (see get_beckn_client) share its discovery results.
+
+    Args:
+        beckn_client: Client the service wraps (defaults to the shared client)
+
+    Returns:
+        Shared DiscoveryService instance
+    """
+    beckn_client = beckn_client or get_beckn_client()
+    with _services_lock:
+        service = _services.get(beckn_client)
+        if service is None:
+            service = DiscoveryService(beckn_client)
+            _services[beckn_client] = service
+        return service
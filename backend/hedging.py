@@ -0,0 +1,124 @@
+import math
+import os
+import threading
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from beckn_client import BecknClient, get_beckn_client
+
+DEFAULT_CUTOFF_SECONDS = 1.0
+DEFAULT_MIN_CUTOFF_SECONDS = 0.05
+DEFAULT_WINDOW = 200
+MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """
+    Rolling select/init latency per BPP, used to decide when a placement is
+    slow enough to hedge.
+
+    The cutoff for a BPP is the p95 of its last `window` negotiations, so about
+    one placement in twenty starts a backup. Until a BPP has MIN_SAMPLES
+    samples the fixed `default_cutoff` is used.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, default_cutoff: Optional[float] = None,
+                 min_cutoff: Optional[float] = None):
+        """
+        Initialize the latency tracker.
+
+        Args:
+            window: Samples kept per BPP
+            default_cutoff: Cutoff before enough samples exist (defaults to HEDGE_CUTOFF_S env var or 1.0)
+            min_cutoff: Lower bound on the cutoff (defaults to HEDGE_MIN_CUTOFF_S env var or 0.05)
+        """
+        self.window = window
+        self.default_cutoff = default_cutoff if default_cutoff is not None else float(
+            os.environ.get("HEDGE_CUTOFF_S", DEFAULT_CUTOFF_SECONDS)
+        )
+        self.min_cutoff = min_cutoff if min_cutoff is not None else float(
+            os.environ.get("HEDGE_MIN_CUTOFF_S", DEFAULT_MIN_CUTOFF_SECONDS)
+        )
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, bpp_id: str, seconds: float):
+        """Record how long one select/init negotiation with a BPP took."""
+        with self._lock:
+            samples = self._samples.get(bpp_id)
+            if samples is None:
+                samples = self._samples[bpp_id] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def p95(self, bpp_id: str) -> Optional[float]:
+        """95th percentile negotiation latency for a BPP, or None without enough samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(bpp_id, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+
+    def cutoff(self, bpp_id: str) -> float:
+        """Seconds to wait on a BPP before starting a hedged placement elsewhere."""
+        p95 = self.p95(bpp_id)
+        return max(self.min_cutoff, p95 if p95 is not None else self.default_cutoff)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            bpp_ids = list(self._samples)
+        return {bpp_id: {"p95": self.p95(bpp_id), "cutoff": self.cutoff(bpp_id)} for bpp_id in bpp_ids}
+
+
+class HedgeClaim:
+    """
+    Shared by the hedged placements of one job: the first agent whose order is
+    confirmed claims the job, later ones must release their orders.
+
+    Agents also report when their select/init is done and only Confirm is left,
+    so the caller can race just that phase against the latency cutoff.
+    """
+
+    def __init__(self, on_negotiated: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            on_negotiated: Called with the agent each time a placement finishes select/init
+        """
+        self._lock = threading.Lock()
+        self.winner: Optional[Any] = None
+        self.on_negotiated = on_negotiated
+
+    def negotiated(self, agent: Any):
+        """Report that `agent` has a negotiated order and only has to confirm it."""
+        if self.on_negotiated is not None:
+            self.on_negotiated(agent)
+
+    def __call__(self, agent: Any) -> bool:
+        """Claim the job for `agent`. Returns False if another agent already has it."""
+        with self._lock:
+            if self.winner is None:
+                self.winner = agent
+            return self.winner is agent
+
+
+_trackers: "weakref.WeakKeyDictionary[BecknClient, LatencyTracker]" = weakref.WeakKeyDictionary()
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(beckn_client: Optional[BecknClient] = None) -> LatencyTracker:
+    """
+    Returns the shared LatencyTracker for a Beckn client, creating it on first use.
+
+    Args:
+        beckn_client: Client whose BPPs are tracked (defaults to the shared client)
+
+    Returns:
+        Shared LatencyTracker instance
+    """
+    beckn_client = beckn_client or get_beckn_client()
+    with _trackers_lock:
+        tracker = _trackers.get(beckn_client)
+        if tracker is None:
+            tracker = LatencyTracker()
+            _trackers[beckn_client] = tracker
+        return tracker
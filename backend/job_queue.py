@@ -0,0 +1,130 @@
+import itertools
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class JobQueue:
+    """
+    Indexed binary min-heap of compute jobs.
+
+    Jobs are ordered by (-priority, must_start_by, arrival), so higher priority
+    first, then the earliest deadline, then first come first served. A position
+    index keyed by job_id gives O(log n) push, pop, removal and re-keying
+    without re-sorting the backlog.
+    """
+
+    def __init__(self, jobs: Optional[List[Any]] = None):
+        self._heap: List[Tuple[Tuple, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._counter = itertools.count()
+        for job in jobs or []:
+            self.push(job)
+
+    @staticmethod
+    def _key(job: Any, seq: int) -> Tuple:
+        return (-job.priority, job.must_start_by or datetime.max, seq)
+
+    def push(self, job: Any):
+        """
+        Add a job. A job already queued under the same job_id is replaced and
+        re-keyed, keeping its place among jobs of equal priority and deadline.
+        """
+        position = self._positions.get(job.job_id)
+        if position is not None:
+            seq = self._heap[position][0][2]
+            self._heap[position] = (self._key(job, seq), job)
+            self._restore(position)
+            return
+
+        self._heap.append((self._key(job, next(self._counter)), job))
+        self._positions[job.job_id] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Any:
+        """Remove and return the most urgent job. Raises IndexError if empty."""
+        if not self._heap:
+            raise IndexError("pop from an empty JobQueue")
+        return self._remove_at(0)
+
+    def pop_n(self, n: int) -> List[Any]:
+        """
+        Remove and return up to n of the most urgent jobs, most urgent first.
+        Costs O(n log len) and leaves the rest of the heap untouched.
+        """
+        return [self._remove_at(0) for _ in range(min(n, len(self._heap)))]
+
+    def peek(self) -> Optional[Any]:
+        """The most urgent job without removing it, or None if empty."""
+        return self._heap[0][1] if self._heap else None
+
+    def remove(self, job_id: str) -> Optional[Any]:
+        """Remove a queued job by id. Returns the job, or None if it isn't queued."""
+        position = self._positions.get(job_id)
+        if position is None:
+            return None
+        return self._remove_at(position)
+
+    def drain(self) -> List[Any]:
+        """Remove and return all jobs, most urgent first."""
+        jobs = [job for _, job in sorted(self._heap, key=lambda entry: entry[0])]
+        self._heap = []
+        self._positions = {}
+        return jobs
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._positions
+
+    def __iter__(self) -> Iterator[Any]:
+        """Queued jobs in heap (not priority) order."""
+        return (job for _, job in self._heap)
+
+    def _remove_at(self, position: int) -> Any:
+        heap = self._heap
+        _, job = heap[position]
+        del self._positions[job.job_id]
+        last = heap.pop()
+        if position < len(heap):
+            heap[position] = last
+            self._positions[last[1].job_id] = position
+            self._restore(position)
+        return job
+
+    def _restore(self, position: int):
+        if position > 0 and self._heap[position][0] < self._heap[(position - 1) // 2][0]:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def _sift_up(self, position: int):
+        heap = self._heap
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if not entry[0] < heap[parent][0]:
+                break
+            heap[position] = heap[parent]
+            self._positions[heap[position][1].job_id] = position
+            position = parent
+        heap[position] = entry
+        self._positions[entry[1].job_id] = position
+
+    def _sift_down(self, position: int):
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if not heap[child][0] < entry[0]:
+                break
+            heap[position] = heap[child]
+            self._positions[heap[position][1].job_id] = position
+            position = child
+        heap[position] = entry
+        self._positions[entry[1].job_id] = position
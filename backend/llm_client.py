@@ -1,7 +1,65 @@
 import os
-from typing import Optional, Dict, Any
+import asyncio
+import json
+import threading
+import time
+from typing import Optional, Dict, Any, Coroutine, List
+import httpx
 import openai
 
+from circuit_breaker import CircuitBreaker
+from llm_metrics import in_current_step, llm_metrics
+from template_summarizer import TemplateSummarizer
+
+
+DEFAULT_MODEL = "mistralai/mistral-nemo"
+DEFAULT_BASE_URL = "https://inference.asicloud.cudos.org/v1"
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_TIMEOUT_SECONDS = 15.0
+
+# Synthesis modes: LLM only, rule-based templates only, or LLM with template fallback
+SYNTHESIS_MODES = ("llm", "template", "hybrid")
+DEFAULT_SYNTHESIS_MODE = "hybrid"
+
+
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns a persistent event loop running on a daemon thread.
+    The async OpenAI client keeps pooled connections bound to the loop that
+    opened them, so all async LLM work is funnelled through this one loop.
+    """
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="llm-async-loop", daemon=True)
+            thread.start()
+            _async_loop = loop
+    return _async_loop
+
+
+def run_async(coro: Coroutine) -> Any:
+    """
+    Runs a coroutine on the shared LLM event loop and blocks until it finishes.
+    Safe to call from synchronous code, worker threads, or another event loop's
+    thread (which is blocked while waiting). Calling it from the shared loop's own
+    thread would deadlock, so that raises RuntimeError; await the coroutine instead.
+    """
+    loop = _get_async_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_async() called from the shared event loop; await the coroutine instead")
+    future = asyncio.run_coroutine_threadsafe(in_current_step(coro), loop)
+    return future.result()
+
 
 class LLMClient:
     """
@@ -9,28 +67,73 @@ class LLMClient:
     Uses OpenAI-compatible API for easy integration.
     """
     
-    def __init__(self, model: str = "mistralai/mistral-nemo", api_key: Optional[str] = None):
+    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None,
+                 max_connections: Optional[int] = None, timeout: Optional[float] = None,
+                 mode: Optional[str] = None, base_url: Optional[str] = None):
         """
         Initialize LLM client.
+        Agents should normally use get_llm_client() to share one pooled instance.
         
         Args:
             model: Model identifier (default: mistralai/mistral-nemo)
             api_key: API key for ASI Cloud (defaults to ASI_API_KEY env var)
+            max_connections: HTTP connection pool size (defaults to LLM_MAX_CONNECTIONS env var or 20)
+            timeout: Default per-call deadline in seconds (defaults to LLM_TIMEOUT_S env var or 15)
+            mode: "llm", "template" or "hybrid" (defaults to LLM_SYNTHESIS_MODE env var or hybrid).
+                Hybrid falls back to template summaries when the LLM is disabled, failing or the circuit is open.
+            base_url: OpenAI-compatible endpoint (defaults to ASI_BASE_URL env var or ASI Cloud);
+                point at simulation/llm_stub.py for offline benchmarking
         """
         self.model = model
         self.api_key = api_key or os.environ.get("ASI_API_KEY")
+        self.base_url = base_url or os.environ.get("ASI_BASE_URL", DEFAULT_BASE_URL)
+        self.max_connections = max_connections or int(
+            os.environ.get("LLM_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+        )
+        self.timeout = timeout or float(os.environ.get("LLM_TIMEOUT_S", DEFAULT_TIMEOUT_SECONDS))
+        self.mode = (mode or os.environ.get("LLM_SYNTHESIS_MODE", DEFAULT_SYNTHESIS_MODE)).lower()
+        if self.mode not in SYNTHESIS_MODES:
+            raise ValueError(f"Unknown LLM synthesis mode '{self.mode}', expected one of {SYNTHESIS_MODES}")
+        self.template = TemplateSummarizer()
+        
+        # Fail fast while the endpoint is degraded instead of paying full latency per agent
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(os.environ.get("LLM_BREAKER_FAILURES", 3)),
+            slow_call_seconds=float(os.environ.get("LLM_BREAKER_SLOW_S", self.timeout * 0.8)),
+            reset_timeout_seconds=float(os.environ.get("LLM_BREAKER_RESET_S", 30))
+        )
         
         if not self.api_key:
             print("⚠️  WARNING: ASI_API_KEY not set. LLM synthesis will be disabled.")
             self.client = None
+            self.async_client = None
         else:
-            print(f"✓ LLM Client initialized with API key (model: {self.model})")
+            print(
+                f"✓ LLM Client initialized with API key (model: {self.model}, "
+                f"endpoint: {self.base_url}, max connections: {self.max_connections})"
+            )
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+            # SDK retries are disabled so a call never exceeds its deadline
             self.client = openai.OpenAI(
                 api_key=self.api_key,
-                base_url="https://inference.asicloud.cudos.org/v1"
+                base_url=self.base_url,
+                timeout=self.timeout,
+                max_retries=0,
+                http_client=openai.DefaultHttpxClient(limits=limits)
+            )
+            self.async_client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self.timeout,
+                max_retries=0,
+                http_client=openai.DefaultAsyncHttpxClient(limits=limits)
             )
     
-    def synthesize(self, prompt: str, max_tokens: int = 500, temperature: float = 0.7) -> Optional[str]:
+    def synthesize(self, prompt: str, max_tokens: int = 500, temperature: float = 0.7,
+                   timeout: Optional[float] = None, call_site: str = "adhoc") -> Optional[str]:
         """
         Synthesize data using the LLM.
         
@@ -38,26 +141,109 @@ class LLMClient:
             prompt: The prompt to send to the LLM
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
+            timeout: Deadline for this call in seconds (defaults to the client timeout)
+            call_site: Label the call is recorded under in llm_metrics
             
         Returns:
-            Synthesized text or None if API call fails
+            Synthesized text or None if the API call fails or the circuit is open
         """
         if not self.client:
             return None
         
+        if not self.breaker.allow_request():
+            llm_metrics.record_call(call_site, 0.0, "circuit_open")
+            return None
+        
+        started = time.monotonic()
         try:
             resp = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                timeout=timeout or self.timeout
             )
             
+            latency = time.monotonic() - started
+            self.breaker.record_success(latency)
+            self._record_success(call_site, latency, resp)
             return resp.choices[0].message.content
             
         except Exception as e:
+            self.breaker.record_failure()
+            llm_metrics.record_call(call_site, time.monotonic() - started, self._failure_outcome(e))
             print(f"LLM synthesis error: {e}")
             return None
+
+    async def asynthesize(self, prompt: str, max_tokens: int = 500, temperature: float = 0.7,
+                          timeout: Optional[float] = None, call_site: str = "adhoc") -> Optional[str]:
+        """
+        Async variant of synthesize() using the async OpenAI client.
+        Must run on the shared LLM loop (see run_async).
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
+            timeout: Deadline for this call in seconds (defaults to the client timeout)
+            call_site: Label the call is recorded under in llm_metrics
+            
+        Returns:
+            Synthesized text or None if the API call fails or the circuit is open
+        """
+        if not self.async_client:
+            return None
+        
+        if not self.breaker.allow_request():
+            llm_metrics.record_call(call_site, 0.0, "circuit_open")
+            return None
+        
+        deadline = timeout or self.timeout
+        started = time.monotonic()
+        try:
+            # wait_for enforces the deadline end to end, not just per socket read
+            resp = await asyncio.wait_for(
+                self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout=deadline
+                ),
+                timeout=deadline
+            )
+            
+            latency = time.monotonic() - started
+            self.breaker.record_success(latency)
+            self._record_success(call_site, latency, resp)
+            return resp.choices[0].message.content
+            
+        except asyncio.CancelledError:
+            # Cancelled callers still count as a failed call, so a half-open probe
+            # doesn't leave the breaker stuck waiting for its result
+            self.breaker.record_failure()
+            llm_metrics.record_call(call_site, time.monotonic() - started, "error")
+            raise
+        except Exception as e:
+            self.breaker.record_failure()
+            llm_metrics.record_call(call_site, time.monotonic() - started, self._failure_outcome(e))
+            print(f"LLM synthesis error: {e!r}")
+            return None
+
+    @staticmethod
+    def _record_success(call_site: str, latency: float, resp: Any):
+        usage = getattr(resp, "usage", None)
+        llm_metrics.record_call(
+            call_site, latency, "success",
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0
+        )
+
+    @staticmethod
+    def _failure_outcome(error: Exception) -> str:
+        if isinstance(error, (asyncio.TimeoutError, openai.APITimeoutError)):
+            return "timeout"
+        return "error"
     
     def synthesize_agent_report(self, agent_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -69,6 +255,38 @@ class LLMClient:
         Returns:
             Natural language summary or None if synthesis fails
         """
+        if self.mode == "template":
+            return self.template.summarize_agent(agent_data)
+        
+        prompt = self._build_agent_report_prompt(agent_data)
+        summary = self.synthesize(prompt, max_tokens=200, temperature=0.5, call_site="local_summary")
+        if summary is None and self.mode == "hybrid":
+            return self.template.summarize_agent(agent_data)
+        return summary
+
+    async def asynthesize_agent_report(self, agent_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Async variant of synthesize_agent_report().
+        
+        Args:
+            agent_data: Dictionary containing agent state data
+            
+        Returns:
+            Natural language summary or None if synthesis fails
+        """
+        if self.mode == "template":
+            return self.template.summarize_agent(agent_data)
+        
+        prompt = self._build_agent_report_prompt(agent_data)
+        summary = await self.asynthesize(prompt, max_tokens=200, temperature=0.5, call_site="local_summary")
+        if summary is None and self.mode == "hybrid":
+            return self.template.summarize_agent(agent_data)
+        return summary
+
+    def _build_agent_report_prompt(self, agent_data: Dict[str, Any]) -> str:
+        """
+        Build the local agent summary prompt from agent state data.
+        """
         # Extract key metrics
         name = agent_data.get("name", "Unknown")
         region = agent_data.get("region", "Unknown")
@@ -105,7 +323,7 @@ Provide a 2-3 sentence summary highlighting:
 
 Keep it concise and actionable for the regional agent."""
 
-        return self.synthesize(prompt, max_tokens=200, temperature=0.5)
+        return prompt
 
     def synthesize_regional_ranking(self, regional_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -113,20 +331,44 @@ Keep it concise and actionable for the regional agent."""
         
         Args:
             regional_data: Dictionary containing regional aggregation data
+                ("region", "agent_summaries", optionally the numeric "ranking" to narrate,
+                and "agents" state for template mode)
             
         Returns:
             Natural language ranking and summary or None if synthesis fails
         """
         region_name = regional_data.get("region", "Unknown")
+        ranking = regional_data.get("ranking")
+        if self.mode == "template":
+            return self.template.rank_region(region_name, regional_data.get("agents", []), ranking)
         agent_summaries = regional_data.get("agent_summaries", [])
         
         # Format summaries for the prompt
         summaries_text = ""
         for summary in agent_summaries:
             summaries_text += f"\n- Agent {summary['agent_name']} ({summary['location']}): {summary['summary']}"
-            
-        # Build prompt
-        prompt = f"""You are a Regional Energy Coordinator for {region_name}.
+        
+        if ranking:
+            # The ranking is computed numerically; the LLM only explains it
+            prompt = f"""You are a Regional Energy Coordinator for {region_name}.
+The local agents have been ranked by cost score (lower is better), combining energy price,
+carbon intensity and forecast workload.
+
+Ranking:
+{self._format_ranking(ranking)}
+
+Local Agent Reports:
+{summaries_text}
+
+Based on these reports, please:
+1. Restate the ranking above as a numbered list, in the same order.
+2. Provide a brief justification for the top pick.
+3. Summarize the overall energy status of the region.
+
+Do not reorder the ranking."""
+        else:
+            # Build prompt
+            prompt = f"""You are a Regional Energy Coordinator for {region_name}.
 Your goal is to analyze reports from local agents and rank them based on the cheapest and cleanest energy available.
 
 Local Agent Reports:
@@ -139,4 +381,147 @@ Based on these reports, please:
 
 Format the output clearly with a numbered list for the ranking."""
 
-        return self.synthesize(prompt, max_tokens=400, temperature=0.5)
+        narrative = self.synthesize(prompt, max_tokens=400, temperature=0.5, call_site="regional_ranking")
+        if narrative is None and self.mode == "hybrid":
+            return self.template.rank_region(region_name, regional_data.get("agents", []), ranking)
+        return narrative
+
+    @staticmethod
+    def _format_ranking(ranking: List[Dict[str, Any]]) -> str:
+        """
+        Format a numeric ranking (RegionalAgent.compute_ranking output) as a numbered list.
+        """
+        lines = []
+        for position, option in enumerate(ranking, start=1):
+            score = option.get("cost_score")
+            score_text = f"{score:.1f}" if score is not None else "N/A"
+            lines.append(
+                f"{position}. {option.get('agent_name', 'Unknown')} (score {score_text}, "
+                f"£{option.get('energy_price', 'N/A')}/kWh, {option.get('carbon', 'N/A')} gCO2/kWh)"
+            )
+        return "\n".join(lines)
+
+    def synthesize_region_batch(self, region_name: str, agents_data: List[Dict[str, Any]],
+                                ranking: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Synthesize every local agent summary, and optionally the ranking narrative, in a single completion.
+        
+        Args:
+            region_name: Name of the region being synthesized
+            agents_data: List of agent state dictionaries (same shape as synthesize_agent_report input)
+            ranking: Numeric ranking to narrate (RegionalAgent.compute_ranking output), or None
+                to request summaries only
+            
+        Returns:
+            Dictionary with "summaries" (agent name -> summary) and "ranking" (text, None if not requested),
+            or None if synthesis or parsing fails
+        """
+        if not agents_data:
+            return None
+        
+        if self.mode == "template":
+            return self.template.summarize_region_batch(region_name, agents_data, ranking)
+        
+        agents_text = ""
+        for agent_data in agents_data:
+            location_data = agent_data.get("location_data", {})
+            energy_data = agent_data.get("energy_data", {})
+            agents_text += (
+                f"\n- Agent: {agent_data.get('name', 'Unknown')}"
+                f" | City: {location_data.get('locality', 'N/A')}"
+                f" | Active Tasks: {agent_data.get('active_tasks_count', 0)}"
+                f" | Available Capacity: {agent_data.get('available_capacity', 0)}"
+                f" | Grid Capacity: {location_data.get('available_capacity', 'N/A')} MW"
+                f" | Price: £{energy_data.get('price', 'N/A')}/kWh"
+                f" | Carbon Intensity: {energy_data.get('carbon_intensity', 'N/A')} gCO2/kWh"
+                f" | Renewable Mix: {energy_data.get('renewable_mix', location_data.get('renewable_mix', 'N/A'))}%"
+            )
+        
+        if ranking:
+            # The ranking is computed numerically; the LLM only explains it
+            ranking_task = f"""
+2. A narrative for the ranking below (by cost score, lower is better). Restate it as a numbered list
+   in the same order, with a brief justification for the top pick and a summary of the overall
+   energy status of the region. Do not reorder it.
+
+Ranking:
+{self._format_ranking(ranking)}
+"""
+            response_shape = '{"summaries": {"<agent name>": "<summary>"}, "ranking": "<ranking text>"}'
+        else:
+            ranking_task = ""
+            response_shape = '{"summaries": {"<agent name>": "<summary>"}}'
+        
+        # Build prompt
+        prompt = f"""You are a Regional Energy Coordinator for {region_name} in a Digital Energy Grid system.
+Below are the current metrics for each local agent in your region.
+
+Local Agent Metrics:
+{agents_text}
+
+Produce:
+1. For each agent, a 2-3 sentence summary covering its operational status (workload and capacity),
+   energy profile (carbon intensity and renewable mix), and any notable conditions or recommendations.
+{ranking_task}
+Respond with JSON only, in exactly this shape:
+{response_shape}"""
+
+        max_tokens = min(200 * len(agents_data) + (400 if ranking else 0), 4000)
+        response = self.synthesize(prompt, max_tokens=max_tokens, temperature=0.5, call_site="region_batch")
+        result = self._parse_region_batch(response) if response else None
+        if result is None and self.mode == "hybrid":
+            return self.template.summarize_region_batch(region_name, agents_data, ranking)
+        return result
+
+    @staticmethod
+    def _parse_region_batch(response: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the JSON body of a batched regional synthesis, tolerating code fences
+        or chatter around the object.
+        """
+        start = response.find("{")
+        end = response.rfind("}")
+        if start == -1 or end <= start:
+            print("LLM batch synthesis error: no JSON object in response")
+            return None
+        
+        try:
+            parsed = json.loads(response[start:end + 1])
+        except json.JSONDecodeError as e:
+            print(f"LLM batch synthesis error: {e}")
+            return None
+        
+        summaries = parsed.get("summaries")
+        if not isinstance(summaries, dict):
+            print("LLM batch synthesis error: missing summaries")
+            return None
+        
+        ranking = parsed.get("ranking")
+        return {
+            "summaries": {str(name): str(text) for name, text in summaries.items() if text},
+            "ranking": str(ranking) if ranking else None
+        }
+
+
+_shared_clients: Dict[str, LLMClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_llm_client(model: str = DEFAULT_MODEL) -> LLMClient:
+    """
+    Returns the process-wide LLMClient for a model, creating it on first use.
+    All agents share its pooled HTTP transport, so TLS connections are reused
+    across the hierarchy instead of each agent opening its own.
+    
+    Args:
+        model: Model identifier
+        
+    Returns:
+        Shared LLMClient instance
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(model)
+        if client is None:
+            client = LLMClient(model=model)
+            _shared_clients[model] = client
+        return client
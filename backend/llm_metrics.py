@@ -0,0 +1,242 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Coroutine, Dict, Iterator, List, Optional, Tuple
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram: a count per upper bound, plus sum, count and max.
+    """
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile: the upper bound of the bucket containing it, or the
+        largest observed value for the overflow bucket (so it stays JSON-safe).
+        """
+        if self.count == 0:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict:
+        labels = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "sum": round(self.total, 6),
+            "count": self.count,
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+
+class StepTimer:
+    """
+    LLM calls made on behalf of one simulation step, as (start, end) intervals.
+    The step's LLM time is the length of their union, so concurrent calls are
+    not double counted and the share of the step can't exceed 1.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._intervals: List[Tuple[float, float]] = []
+
+    def add_call(self, latency_seconds: float):
+        end = time.monotonic()
+        with self._lock:
+            self._intervals.append((end - latency_seconds, end))
+
+    def busy_seconds(self, since: float, until: float) -> float:
+        """Wall time between `since` and `until` during which at least one call was in flight."""
+        with self._lock:
+            intervals = sorted(self._intervals)
+        busy = 0.0
+        covered = since
+        for start, end in intervals:
+            start, end = max(start, covered), min(end, until)
+            if end > start:
+                busy += end - start
+                covered = end
+        return busy
+
+
+# Step whose LLM time the current thread or task counts toward (None outside steps)
+_current_step: ContextVar[Optional[StepTimer]] = ContextVar("llm_step", default=None)
+
+
+def in_current_step(coro: Coroutine) -> Coroutine:
+    """
+    Binds a coroutine about to run on another thread's event loop to the
+    caller's simulation step, so its LLM calls count toward that step.
+    """
+    step = _current_step.get()
+    if step is None:
+        return coro
+
+    async def bound():
+        _current_step.set(step)
+        return await coro
+    return bound()
+
+
+class LLMMetrics:
+    """
+    Process-wide counters and histograms for LLM calls.
+
+    Every call is recorded with its call site (e.g. local_summary, regional_ranking,
+    region_batch), wall latency, prompt/completion tokens from the response usage,
+    and outcome (success, error, timeout, circuit_open).
+    """
+
+    LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0]
+    TOKEN_BUCKETS = [16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._calls: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            self._latency: Dict[str, Histogram] = {}
+            self._completion_tokens: Dict[str, Histogram] = {}
+            self._prompt_tokens_total: Dict[str, int] = defaultdict(int)
+            self._completion_tokens_total: Dict[str, int] = defaultdict(int)
+            self._latency_seconds_total = 0.0
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._steps = 0
+            self._step_seconds_total = 0.0
+            self._step_llm_seconds_total = 0.0
+
+    def record_call(self, call_site: str, latency_seconds: float, outcome: str,
+                    prompt_tokens: int = 0, completion_tokens: int = 0):
+        """
+        Record one LLM call.
+
+        Args:
+            call_site: Which synthesis path made the call
+            latency_seconds: Wall time of the call
+            outcome: success, error, timeout or circuit_open
+            prompt_tokens: Prompt tokens from the response usage
+            completion_tokens: Completion tokens from the response usage
+        """
+        step = _current_step.get()
+        if step is not None and outcome != "circuit_open":
+            step.add_call(latency_seconds)
+
+        with self._lock:
+            self._calls[call_site][outcome] += 1
+            if outcome == "circuit_open":
+                return  # Rejected without calling the endpoint
+
+            if call_site not in self._latency:
+                self._latency[call_site] = Histogram(self.LATENCY_BUCKETS)
+                self._completion_tokens[call_site] = Histogram(self.TOKEN_BUCKETS)
+            self._latency[call_site].observe(latency_seconds)
+            self._latency_seconds_total += latency_seconds
+
+            if outcome == "success":
+                self._completion_tokens[call_site].observe(completion_tokens)
+                self._prompt_tokens_total[call_site] += prompt_tokens
+                self._completion_tokens_total[call_site] += completion_tokens
+
+    def record_cache(self, hit: bool):
+        """Record a summary cache lookup."""
+        with self._lock:
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+    @contextmanager
+    def step(self) -> Iterator[StepTimer]:
+        """
+        Times a simulation step. LLM calls made inside it (including coroutines
+        handed to run_async) count toward its LLM time; background calls don't.
+        """
+        timer = StepTimer()
+        token = _current_step.set(timer)
+        started = time.monotonic()
+        try:
+            yield timer
+        finally:
+            _current_step.reset(token)
+            finished = time.monotonic()
+            self.record_step(finished - started, timer.busy_seconds(started, finished))
+
+    def record_step(self, step_seconds: float, llm_seconds: float):
+        """Record a simulation step's duration and the LLM time spent on its behalf."""
+        with self._lock:
+            self._steps += 1
+            self._step_seconds_total += step_seconds
+            self._step_llm_seconds_total += llm_seconds
+
+    def snapshot(self) -> Dict:
+        """Returns all metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            call_sites = {}
+            for call_site, outcomes in self._calls.items():
+                latency = self._latency.get(call_site)
+                tokens = self._completion_tokens.get(call_site)
+                call_sites[call_site] = {
+                    "calls": dict(outcomes),
+                    "latency_seconds": latency.snapshot() if latency else None,
+                    "completion_tokens": tokens.snapshot() if tokens else None,
+                    "prompt_tokens_total": self._prompt_tokens_total[call_site],
+                    "completion_tokens_total": self._completion_tokens_total[call_site],
+                }
+
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "call_sites": call_sites,
+                "totals": {
+                    "calls": sum(sum(o.values()) for o in self._calls.values()),
+                    "latency_seconds": round(self._latency_seconds_total, 6),
+                    "prompt_tokens": sum(self._prompt_tokens_total.values()),
+                    "completion_tokens": sum(self._completion_tokens_total.values()),
+                },
+                "summary_cache": {
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                    "hit_rate": round(self._cache_hits / lookups, 4) if lookups else None,
+                },
+                "simulation_steps": {
+                    "count": self._steps,
+                    "step_seconds_total": round(self._step_seconds_total, 6),
+                    "llm_seconds_during_steps": round(self._step_llm_seconds_total, 6),
+                    "llm_share": round(self._step_llm_seconds_total / self._step_seconds_total, 4)
+                    if self._step_seconds_total else None,
+                },
+            }
+
+
+# Process-wide metrics shared by all LLM clients and summary caches
+llm_metrics = LLMMetrics()
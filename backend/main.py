@@ -11,11 +11,20 @@ import uvicorn
 import asyncio
 from datetime import datetime, timedelta
 import random
+import time
 
 from agents.global_agent import GlobalAgent
 from agents.regional_agent import RegionalAgent
 from agents.local_agent import LocalAgent
 from simulation.data_generator import DataGenerator
+from summary_refresher import SummaryRefresher
+from quote_prefetcher import QuotePrefetcher
+from discovery_service import get_discovery_service
+from beckn_client import get_beckn_client
+from hedging import get_latency_tracker
+from beckn_models import ComputeJob
+from llm_metrics import llm_metrics
+from beckn_callbacks import callback_registry
 
 app = FastAPI(title="Digital Energy Grid Agent System")
 
@@ -87,22 +96,55 @@ def setup_system():
 
 setup_system()
 
+# Background LLM synthesis so simulation ticks and API reads never wait on the LLM
+summary_refresher = SummaryRefresher(
+    global_agent.regional_agents,
+    interval_seconds=float(os.environ.get("LLM_REFRESH_INTERVAL_S", 5)),
+    max_staleness_seconds=float(os.environ.get("LLM_MAX_STALENESS_S", 60))
+)
+
+@app.on_event("startup")
+async def start_summary_refresher():
+    summary_refresher.start()
+
+@app.on_event("shutdown")
+async def stop_summary_refresher():
+    summary_refresher.stop(timeout=5)
+
+# Speculative select/init on the cheapest sites, so submitted jobs usually only need confirm.
+# Seeded with the shape of a job submitted with all defaults.
+quote_prefetcher = QuotePrefetcher(
+    global_agent.regional_agents,
+    seed_jobs=[ComputeJob(job_id="prefetch-default", num_computations=100.0, estimated_runtime_hrs=1.0, priority=1)]
+)
+get_discovery_service(get_beckn_client()).add_listener(quote_prefetcher.on_discovery)
+
+@app.on_event("startup")
+async def start_quote_prefetcher():
+    quote_prefetcher.start()
+
+@app.on_event("shutdown")
+async def stop_quote_prefetcher():
+    quote_prefetcher.stop(timeout=5)
+
 def run_simulation_step(sim_time):
     """
     Synchronous simulation step to be run in a thread.
     """
-    # 2. Update Agents (Energy Data, Capacity)
-    for region in global_agent.regional_agents:
-        region.update_state(sim_time)
-        
-    # 3. Generate New Tasks
-    # if random.random() < 0.5: # 50% chance of new tasks
-    #     new_tasks = data_generator.generate_tasks(num_tasks=random.randint(1, 5))
-    #     for task in new_tasks:
-    #         global_agent.add_task_to_queue(task)
+    # LLM time is attributed to this step only for calls made on its behalf
+    with llm_metrics.step():
+        # 2. Update Agents (Energy Data, Capacity)
+        for region in global_agent.regional_agents:
+            region.update_state(sim_time)
             
-    # 4. Global Optimization
-    global_agent.optimize_and_assign()
+        # 3. Generate New Tasks
+        # if random.random() < 0.5: # 50% chance of new tasks
+        #     new_tasks = data_generator.generate_tasks(num_tasks=random.randint(1, 5))
+        #     for task in new_tasks:
+        #         global_agent.add_task_to_queue(task)
+                
+        # 4. Global Optimization
+        global_agent.optimize_and_assign()
 
 async def safe_run_simulation_step(sim_time):
     """
@@ -161,6 +203,62 @@ async def get_simulation_time():
     """
     return {"simulation_time": simulation_time.isoformat()}
 
+@app.get("/metrics/llm")
+async def get_llm_metrics():
+    """
+    Returns LLM call latency/token histograms per call site, outcome counters,
+    summary cache hit rate and the share of simulation step time spent on LLM calls.
+    """
+    return llm_metrics.snapshot()
+
+@app.post("/bap/{callback}")
+async def receive_beckn_callback(callback: str, payload: dict):
+    """
+    BAP callback receiver (on_select, on_init, on_confirm, ...). The BPP's
+    response is matched to the pending request by transaction_id/message_id;
+    callbacks nobody is waiting for (unknown or past their ttl) are NACKed.
+    """
+    if not callback.startswith("on_"):
+        return {"message": {"ack": {"status": "NACK"}}, "error": {"code": "30000", "message": f"Unknown callback {callback}"}}
+    
+    payload.setdefault("context", {}).setdefault("action", callback)
+    if not callback_registry.resolve(payload):
+        return {"message": {"ack": {"status": "NACK"}}, "error": {"code": "30001", "message": "No pending request for this transaction"}}
+    return {"message": {"ack": {"status": "ACK"}}}
+
+@app.get("/bap/callbacks")
+async def get_callback_status():
+    """
+    Returns the number of requests awaiting callbacks and resolve/timeout counters.
+    """
+    return callback_registry.stats()
+
+@app.get("/beckn/latency")
+async def get_beckn_latency():
+    """
+    Returns per-BPP p95 select/init latency and hedge cutoffs, and hedged placement counters per region.
+    """
+    return {
+        "bpps": get_latency_tracker(get_beckn_client()).stats(),
+        "regions": {
+            region.region: {"hedges_started": region.hedges_started, "hedges_won": region.hedges_won}
+            for region in global_agent.regional_agents
+        }
+    }
+
+@app.get("/quotes/prefetch")
+async def get_quote_prefetch_status():
+    """
+    Returns quote prefetcher counters and per-agent quote cache stats.
+    """
+    return {
+        **quote_prefetcher.stats(),
+        "agents": {
+            agent.name: agent.quote_cache.stats()
+            for region in global_agent.regional_agents for agent in region.local_agents
+        }
+    }
+
 @app.get("/discovery/status")
 async def get_discovery_status():
     """
@@ -210,10 +308,10 @@ async def submit_job(job: dict):
     job["submitted_at"] = datetime.now()
     
     # Create ComputeJob and calculate deadline
-    from beckn_models import ComputeJob
     compute_job = ComputeJob(**job)
     compute_job.calculate_deadline()
     
+    quote_prefetcher.note_job(compute_job)
     global_agent.add_task_to_queue(compute_job)
     
     # Process jobs in background (fire-and-forget) to avoid blocking API
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional, Tuple
+
+from beckn_client import DEFAULT_TIMEOUT_SECONDS, BecknClient, get_beckn_client
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_WORKERS = 16
+
+
+class OrderStatusChecker:
+    """
+    Looks up Beckn order states for many orders at once.
+
+    Status calls for all requested orders are issued concurrently and collected
+    until a shared deadline, so checking N orders costs about one round trip
+    instead of N. Known states are reused for `ttl_seconds`, so repeated checks
+    (e.g. consecutive price spikes on the same site) don't re-poll them, and
+    are evicted once that has passed.
+    """
+
+    def __init__(self, beckn_client: BecknClient, ttl_seconds: Optional[float] = None,
+                 deadline_seconds: Optional[float] = None, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize the status checker.
+
+        Args:
+            beckn_client: Client used for the status requests
+            ttl_seconds: How long a known state is reused (defaults to ORDER_STATUS_TTL_S env var or 30)
+            deadline_seconds: Time allowed for one batch of checks (defaults to ORDER_STATUS_DEADLINE_S env var,
+                or the client's per-request timeout so a slow but responsive BPP still gets an answer in)
+            max_workers: Status requests in flight at once
+        """
+        self.beckn_client = beckn_client
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.environ.get("ORDER_STATUS_TTL_S", DEFAULT_TTL_SECONDS)
+        )
+        client_timeout = getattr(beckn_client, "timeout", None)
+        if not isinstance(client_timeout, (int, float)):
+            client_timeout = DEFAULT_TIMEOUT_SECONDS
+        self.deadline_seconds = deadline_seconds if deadline_seconds is not None else float(
+            os.environ.get("ORDER_STATUS_DEADLINE_S", client_timeout)
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="order-status")
+        self._lock = threading.Lock()
+        self._states: Dict[str, Tuple[float, str]] = {}
+
+        # Simple counters for observability
+        self.requests = 0
+        self.cache_hits = 0
+        self.timeouts = 0
+
+    def check(self, order_ids: Iterable[str], bpp_id: str, bpp_uri: str) -> Dict[str, Optional[str]]:
+        """
+        Returns the state of each order, polling only those without a fresh cached state.
+
+        Args:
+            order_ids: Beckn order ids to check
+            bpp_id: Provider platform ID
+            bpp_uri: Provider platform URI
+
+        Returns:
+            order id -> beckn:orderStatus, or None if the state could not be
+            fetched before the deadline
+        """
+        states: Dict[str, Optional[str]] = {}
+        to_poll = []
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            for order_id in dict.fromkeys(order_ids):
+                cached = self._states.get(order_id)
+                if cached and now - cached[0] <= self.ttl_seconds:
+                    self.cache_hits += 1
+                    states[order_id] = cached[1]
+                else:
+                    to_poll.append(order_id)
+            self.requests += len(to_poll)
+
+        futures = {self._executor.submit(self._poll, order_id, bpp_id, bpp_uri): order_id for order_id in to_poll}
+        done, not_done = wait(futures, timeout=self.deadline_seconds)
+
+        for future in not_done:
+            future.cancel()
+            states[futures[future]] = None
+        for future in done:
+            try:
+                states[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Status check for order {futures[future]} failed: {e}")
+                states[futures[future]] = None
+
+        with self._lock:
+            self.timeouts += len(not_done)
+            polled_at = time.monotonic()
+            for order_id in to_poll:
+                # UNKNOWN is the client's fallback when the BPP couldn't be reached
+                if states[order_id] not in (None, "UNKNOWN"):
+                    self._states[order_id] = (polled_at, states[order_id])
+        return states
+
+    def _poll(self, order_id: str, bpp_id: str, bpp_uri: str) -> Optional[str]:
+        status_res = self.beckn_client.status(str(uuid.uuid4()), bpp_id, bpp_uri, order_id)
+        return status_res.get('message', {}).get('order', {}).get('beckn:orderStatus')
+
+    def _evict_expired(self, now: float):
+        # Caller holds the lock. Orders that are never moved would otherwise stay forever.
+        expired = [order_id for order_id, (polled_at, _) in self._states.items() if now - polled_at > self.ttl_seconds]
+        for order_id in expired:
+            del self._states[order_id]
+
+    def forget(self, order_id: str):
+        """Drop an order's cached state, e.g. after it was updated or moved."""
+        with self._lock:
+            self._states.pop(order_id, None)
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "timeouts": self.timeouts,
+            "ttl_seconds": self.ttl_seconds,
+            "deadline_seconds": self.deadline_seconds,
+            "cached_states": len(self._states),
+        }
+
+
+_checkers: "weakref.WeakKeyDictionary[BecknClient, OrderStatusChecker]" = weakref.WeakKeyDictionary()
+_checkers_lock = threading.Lock()
+
+
+def get_order_status_checker(beckn_client: Optional[BecknClient] = None) -> OrderStatusChecker:
+    """
+    Returns the shared OrderStatusChecker for a Beckn client, creating it on first use.
+
+    Args:
+        beckn_client: Client the checker wraps (defaults to the shared client)
+
+    Returns:
+        Shared OrderStatusChecker instance
+    """
+    beckn_client = beckn_client or get_beckn_client()
+    with _checkers_lock:
+        checker = _checkers.get(beckn_client)
+        if checker is None:
+            checker = OrderStatusChecker(beckn_client)
+            _checkers[beckn_client] = checker
+        return checker
@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAX_COST_SCORE = 100.0  # LocalAgent.compute_cost_score() is bounded to 0-100
+MIN_SLACK_HOURS = 0.25
+
+
+def placement_costs(jobs: Sequence[Any], agents: Sequence[Tuple[Any, float]],
+                    now: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds the batch placement problem for solve_placement().
+
+    Placing job i on agent a costs cost_score(a) * runtime(i), so the cheapest
+    sites go to the longest jobs. Agents without a score or above their
+    region's cost threshold are not allowed (inf). Leaving a job in the queue
+    costs more than any allowed placement, scaled by priority and by how close
+    its must_start_by is, so jobs are only deferred when allowed capacity runs
+    out, and then the least urgent ones first.
+
+    Args:
+        jobs: ComputeJob objects to place
+        agents: (LocalAgent, cost threshold of its region) pairs
+        now: Reference time for deadline slack (defaults to datetime.now())
+
+    Returns:
+        (costs [jobs x agents], capacities [agents], defer_costs [jobs])
+    """
+    now = now or datetime.now()
+    runtimes = np.array([job.estimated_runtime_hrs for job in jobs], dtype=float)
+
+    scores = np.array([
+        agent.cost_score if getattr(agent, 'cost_score', None) is not None else np.inf
+        for agent, _ in agents
+    ], dtype=float)
+    thresholds = np.array([threshold for _, threshold in agents], dtype=float)
+    scores[scores > thresholds] = np.inf
+    capacities = np.array([max(0, agent.available_capacity) for agent, _ in agents], dtype=int)
+
+    costs = np.outer(runtimes, scores)
+    costs[:, np.isinf(scores)] = np.inf  # 0h jobs would otherwise give 0 * inf = nan
+
+    urgency = np.array([
+        job.priority * (1.0 + 1.0 / max((job.must_start_by - now).total_seconds() / 3600, MIN_SLACK_HOURS))
+        if job.must_start_by else job.priority
+        for job in jobs
+    ], dtype=float)
+    defer_costs = runtimes * MAX_COST_SCORE * (1.0 + urgency)
+    return costs, capacities, defer_costs
+
+
+def solve_placement(costs: np.ndarray, capacities: np.ndarray, defer_costs: np.ndarray) -> np.ndarray:
+    """
+    Minimum-cost assignment of jobs to capacity-limited agents, with the option
+    of deferring a job at defer_costs[i].
+
+    This is min-cost flow on a transportation network (jobs -> agents/defer ->
+    sink) solved by successive shortest paths. Jobs are added one at a time;
+    each is routed along the cheapest path, which may move already placed jobs
+    between agents to make room. Because agents are few, a path is found with
+    Bellman-Ford over the agent columns, where moving a job from column b to c
+    costs min over jobs j in b of costs[j, c] - costs[j, b]. Each step is
+    vectorized over jobs, so a solve is O(jobs^2 * agents) array work.
+
+    Args:
+        costs: [jobs x agents] placement costs, np.inf where not allowed
+        capacities: [agents] number of jobs each agent can take
+        defer_costs: [jobs] cost of leaving each job unplaced (finite)
+
+    Returns:
+        [jobs] agent index per job, or -1 for deferred jobs
+    """
+    n_jobs, n_agents = costs.shape
+    if n_jobs == 0:
+        return np.full(0, -1, dtype=int)
+
+    # The defer column is one more "agent" with room for every job
+    cost = np.hstack([costs, np.asarray(defer_costs, dtype=float)[:, None]])
+    defer = n_agents
+    n_cols = n_agents + 1
+    spare = np.append(np.asarray(capacities, dtype=int), n_jobs)
+    column = np.full(n_jobs, -1, dtype=int)
+
+    for i in range(n_jobs):
+        placed = np.flatnonzero(column >= 0)
+
+        # Cheapest single move out of each column into each other column
+        move_cost = np.full((n_cols, n_cols), np.inf)
+        move_job = np.full((n_cols, n_cols), -1, dtype=int)
+        if placed.size:
+            delta = cost[placed] - cost[placed, column[placed]][:, None]
+            for b in np.unique(column[placed]):
+                members = placed[column[placed] == b]
+                rows = delta[column[placed] == b]
+                best = rows.argmin(axis=0)
+                move_cost[b] = rows[best, np.arange(n_cols)]
+                move_job[b] = members[best]
+            np.fill_diagonal(move_cost, np.inf)
+
+        # Bellman-Ford over columns, starting from job i's own placement costs
+        dist = cost[i].copy()
+        pred = np.full(n_cols, -1, dtype=int)
+        for _ in range(n_cols):
+            through = dist[:, None] + move_cost
+            via = through.argmin(axis=0)
+            best = through[via, np.arange(n_cols)]
+            improved = best < dist - 1e-9
+            if not improved.any():
+                break
+            dist[improved] = best[improved]
+            pred[improved] = via[improved]
+
+        # End at the cheapest column with room; the defer column always has some
+        target = int(np.argmin(np.where(spare > 0, dist, np.inf)))
+        spare[target] -= 1
+
+        # Walk the path back, moving each displaced job one column along
+        col = target
+        while pred[col] >= 0:
+            prev = pred[col]
+            column[move_job[prev, col]] = col
+            col = prev
+        column[i] = col
+
+    column[column == defer] = -1
+    return column
@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 20.0
+
+
+@dataclass
+class Quote:
+    transaction_id: str  # Transaction the quote was negotiated in
+    order: Dict          # Initialized, not yet confirmed order (copy before confirming)
+    created_at: float
+
+
+class QuoteCache:
+    """
+    Short-lived cache of initialized, unconfirmed Beckn orders ("quotes").
+
+    Entries are keyed on (provider, item, job shape), where the shape is the
+    part of a job that goes into the quoted terms (runtime, priority and time
+    window). A placement with a fresh quote can go straight to confirm. Quotes
+    are single-use: get() removes the quote it returns, so each transaction is
+    confirmed at most once; `on_consumed`, if set, is called after each one is
+    taken so a prefetcher can negotiate its replacement. Quotes expire after
+    `ttl_seconds` and are dropped as soon as discovery reports a different
+    price or capacity for the listing behind them.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 64):
+        """
+        Initialize the quote cache.
+
+        Args:
+            ttl_seconds: How long a quote stays usable (defaults to QUOTE_TTL_S env var or 20; 0 disables)
+            max_entries: Maximum number of quotes kept before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.environ.get("QUOTE_TTL_S", DEFAULT_TTL_SECONDS)
+        )
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._quotes: "OrderedDict[Tuple, Quote]" = OrderedDict()
+        self._listings: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        self.on_consumed: Optional[Callable[[], None]] = None
+
+        # Simple counters for observability
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def job_shape(job: Any) -> Tuple:
+        """The job fields that determine the quoted terms."""
+        return (job.estimated_runtime_hrs, job.priority, job.start_time_earliest, job.deadline_latest)
+
+    def get(self, provider_id: str, item_id: str, job: Any) -> Optional[Quote]:
+        """
+        Takes a fresh quote for this provider, item and job shape, if any. The
+        quote is removed from the cache; the caller confirms it or drops it.
+        """
+        key = (provider_id, item_id, self.job_shape(job))
+        with self._lock:
+            quote = self._quotes.get(key)
+            if quote is not None and time.monotonic() - quote.created_at > self.ttl_seconds:
+                del self._quotes[key]
+                quote = None
+            if quote is None:
+                self.misses += 1
+                return None
+            del self._quotes[key]
+            self.hits += 1
+        if self.on_consumed is not None:
+            self.on_consumed()
+        return quote
+
+    def peek(self, provider_id: str, item_id: str, job: Any) -> Optional[Quote]:
+        """
+        Returns the quote stored for this provider, item and job shape, fresh or
+        not, without touching hit/miss counters or LRU order.
+        """
+        with self._lock:
+            return self._quotes.get((provider_id, item_id, self.job_shape(job)))
+
+    def put(self, provider_id: str, item_id: str, job: Any, transaction_id: str, order: Dict):
+        """
+        Store a negotiated (selected and initialized) order that has not been confirmed.
+
+        Args:
+            provider_id: Provider the order was negotiated with
+            item_id: Item ordered
+            job: Job the order was initialized for (only its shape is kept)
+            transaction_id: Beckn transaction of the select/init
+            order: Initialized order, to be sent to confirm
+        """
+        if self.ttl_seconds <= 0:
+            return
+        key = (provider_id, item_id, self.job_shape(job))
+        with self._lock:
+            self._quotes[key] = Quote(transaction_id, dict(order), time.monotonic())
+            self._quotes.move_to_end(key)
+            while len(self._quotes) > self.max_entries:
+                self._quotes.popitem(last=False)
+
+    def invalidate(self, provider_id: Optional[str] = None, item_id: Optional[str] = None):
+        """
+        Drop quotes for a provider and/or item (all quotes if neither is given).
+        """
+        with self._lock:
+            stale = [
+                key for key in self._quotes
+                if (provider_id is None or key[0] == provider_id) and (item_id is None or key[1] == item_id)
+            ]
+            for key in stale:
+                del self._quotes[key]
+            self.invalidations += len(stale)
+
+    def observe_listing(self, provider_id: str, item_id: str, price: Any, capacity: Any) -> bool:
+        """
+        Record the price and capacity discovery reports for a listing, dropping
+        its quotes if either changed since the last discovery.
+
+        Returns:
+            True if quotes were invalidated
+        """
+        listing = (provider_id, item_id)
+        with self._lock:
+            previous = self._listings.get(listing)
+            self._listings[listing] = (price, capacity)
+        if previous is None or previous == (price, capacity):
+            return False
+        self.invalidate(provider_id, item_id)
+        return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            size = len(self._quotes)
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from discovery_index import DiscoveryIndex
+from llm_client import run_async
+from quote_cache import QuoteCache
+
+DEFAULT_TOP_K = 2
+DEFAULT_MAX_SHAPES = 2
+
+
+class QuotePrefetcher:
+    """
+    Background worker that keeps quotes warm for the sites placements are
+    most likely to land on.
+
+    After every new discovery result (and at least every half quote TTL) it
+    negotiates Select -> Init, without Confirm, for the `top_k` cheapest local
+    agents of each region by cost score and each recently submitted job shape.
+    A job of a known shape placed on one of those agents then only needs
+    Confirm. Each quote serves a single confirm; taking one wakes the worker,
+    which negotiates the replacement. Quotes still fresh for more than half
+    their TTL are left alone.
+    """
+
+    def __init__(self, regional_agents: List, top_k: Optional[int] = None,
+                 max_shapes: int = DEFAULT_MAX_SHAPES, seed_jobs: Optional[List] = None):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            regional_agents: RegionalAgent instances whose local agents are prefetched
+            top_k: Agents prefetched per region (defaults to QUOTE_PREFETCH_TOP_K env var or 2; 0 disables)
+            max_shapes: Number of most recent job shapes kept warm
+            seed_jobs: Jobs whose shapes are warmed before any job is submitted
+        """
+        self.regional_agents = regional_agents
+        self.top_k = top_k if top_k is not None else int(
+            os.environ.get("QUOTE_PREFETCH_TOP_K", DEFAULT_TOP_K)
+        )
+        self.max_shapes = max_shapes
+        self._lock = threading.Lock()
+        self._shapes: "OrderedDict[Tuple, Any]" = OrderedDict()
+        for job in seed_jobs or []:
+            self.note_job(job)
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Simple counters for observability
+        self.passes = 0
+        self.prefetched = 0
+        self.failures = 0
+
+    def note_job(self, job: Any):
+        """
+        Record a submitted job's shape as one worth keeping quotes for. Jobs with
+        an explicit time window are skipped; their quotes are unlikely to be reused.
+        """
+        if job.start_time_earliest is not None or job.deadline_latest is not None:
+            return
+        shape = QuoteCache.job_shape(job)
+        with self._lock:
+            self._shapes[shape] = job
+            self._shapes.move_to_end(shape)
+            while len(self._shapes) > self.max_shapes:
+                self._shapes.popitem(last=False)
+
+    def on_discovery(self, result: Dict, index: DiscoveryIndex):
+        """
+        DiscoveryService listener. Records the new listings with every agent's
+        quote cache right away, so quotes prefetched from here on aren't dropped
+        when the agents see the same result, then wakes the worker.
+        """
+        for agent in self._local_agents():
+            agent.observe_listing(index)
+        self._wake_event.set()
+
+    def start(self):
+        """Start the background thread."""
+        if self.top_k <= 0 or (self._thread and self._thread.is_alive()):
+            return
+
+        self._stop_event.clear()
+        for agent in self._local_agents():
+            agent.quote_cache.on_consumed = self._wake_event.set
+        self._thread = threading.Thread(target=self._run, name="quote-prefetcher", daemon=True)
+        self._thread.start()
+        print(f"✓ Quote prefetcher started (top {self.top_k} agents per region)")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        for agent in self._local_agents():
+            if agent.quote_cache.on_consumed == self._wake_event.set:
+                agent.quote_cache.on_consumed = None
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def candidates(self) -> List:
+        """The top_k cheapest local agents with spare capacity in each region."""
+        agents = []
+        for region in self.regional_agents:
+            available = [agent for agent in region.local_agents if agent.available_capacity > 0]
+            available.sort(key=lambda agent: getattr(agent, 'cost_score', float('inf')))
+            agents.extend(available[:self.top_k])
+        return agents
+
+    def refresh_once(self) -> int:
+        """
+        Prefetch every (candidate agent, job shape) quote that is missing or past
+        half its TTL.
+
+        Returns:
+            Number of quotes negotiated
+        """
+        with self._lock:
+            jobs = list(self._shapes.values())
+
+        due = []
+        for agent in self.candidates():
+            cache = agent.quote_cache
+            if cache.ttl_seconds <= 0:
+                continue
+            for job in jobs:
+                quote = cache.peek(agent.name, f"slot_{agent.node.node_id}", job)
+                if quote is None or time.monotonic() - quote.created_at > cache.ttl_seconds / 2:
+                    due.append((agent, job))
+
+        self.passes += 1
+        if not due:
+            return 0
+
+        async def prefetch_all():
+            return await asyncio.gather(*(agent.prefetch_quote_async(job) for agent, job in due))
+
+        results = run_async(prefetch_all())
+        succeeded = sum(1 for ok in results if ok)
+        self.prefetched += succeeded
+        self.failures += len(results) - succeeded
+        return succeeded
+
+    def _local_agents(self) -> List:
+        return [agent for region in self.regional_agents for agent in region.local_agents]
+
+    def _refresh_interval(self) -> float:
+        ttls = [agent.quote_cache.ttl_seconds for agent in self._local_agents()]
+        return max(1.0, min(ttls, default=2.0) / 2)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            try:
+                self.refresh_once()
+            except Exception as e:
+                print(f"Quote prefetch pass failed: {e}")
+
+            self._wake_event.wait(self._refresh_interval())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            shapes = len(self._shapes)
+        return {
+            "top_k": self.top_k,
+            "shapes": shapes,
+            "passes": self.passes,
+            "prefetched": self.prefetched,
+            "failures": self.failures,
+        }
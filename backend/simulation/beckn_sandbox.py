@@ -0,0 +1,289 @@
+"""
+Local Beckn BPP stand-in for offline load testing.
+
+Serves POST /discover, /select, /init, /confirm, /status and /update with a
+generated compute-energy catalog (9 UK cities by default, up to tens of
+thousands of items) and configurable latency, error rate and slow-loris
+responses, so BecknClient and the agents can be load-tested reproducibly
+without the public sandbox.
+
+Run it, then point the agents at it:
+
+    python -m simulation.beckn_sandbox --port 8200 --items 10000 --latency-ms 40 --error-rate 0.01
+    export BECKN_BASE_URL=http://127.0.0.1:8200
+
+With --callbacks the sandbox ACKs select/init/confirm/status/update and posts
+the result to <bap_uri>/on_<action>, exercising BECKN_CALLBACK_MODE.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# The nine localities the public sandbox serves (see LocalAgent.LOCATION_ASSIGNMENTS)
+UK_CITIES = [
+    ("Cambridge", "East of England", "UK-EAST"),
+    ("London", "Greater London", "UK-SOUTH"),
+    ("Manchester", "North West England", "UK-NORTH"),
+    ("Birmingham", "West Midlands", "UK-MIDLANDS"),
+    ("Edinburgh", "Scotland", "UK-SCOTLAND"),
+    ("Bristol", "South West England", "UK-SOUTH"),
+    ("Liverpool", "North West England", "UK-NORTH"),
+    ("Glasgow", "Scotland", "UK-SCOTLAND"),
+    ("Leeds", "Yorkshire", "UK-NORTH"),
+]
+
+ACTIONS = ["discover", "select", "init", "confirm", "status", "update"]
+
+
+@dataclass
+class SandboxConfig:
+    num_items: int = 9                 # Catalog size; the first 9 items are the UK cities
+    latency_ms: float = 50.0           # Median response latency
+    latency_sigma: float = 0.3         # Log-normal spread of the latency
+    error_rate: float = 0.0            # Fraction of requests answered with 429/500/503
+    slow_loris_rate: float = 0.0       # Fraction of responses dripped out over slow_loris_seconds
+    slow_loris_seconds: float = 10.0   # Time a slow-loris response takes to finish
+    callbacks: bool = False            # ACK and deliver results to <bap_uri>/on_<action>
+    strict_items: bool = False         # Reject selects for items not in the catalog (agents order slot ids)
+    seed: Optional[int] = 42
+
+
+def generate_catalog(num_items: int = 9, seed: Optional[int] = 42) -> Dict:
+    """
+    Builds a discover response with num_items compute-energy slots and one offer
+    per item. Items past the ninth are numbered variants of the UK cities
+    ("Leeds-2", ...), so agents' own localities always resolve.
+
+    Args:
+        num_items: Number of catalog items
+        seed: RNG seed for grid parameters and prices
+
+    Returns:
+        Beckn discover response (context omitted)
+    """
+    rng = random.Random(seed)
+    items = []
+    offers = []
+    for i in range(num_items):
+        city, region, grid_zone = UK_CITIES[i % len(UK_CITIES)]
+        locality = city if i < len(UK_CITIES) else f"{city}-{i // len(UK_CITIES) + 1}"
+        item_id = f"item-{i:05d}"
+        items.append({
+            "@type": "beckn:Item",
+            "beckn:id": item_id,
+            "beckn:descriptor": {"schema:name": f"Compute-energy window {locality}"},
+            "beckn:availableAt": [{
+                "geo": {"type": "Point", "coordinates": [round(rng.uniform(-4.5, 0.5), 4), round(rng.uniform(50.5, 56.0), 4)]},
+                "address": {"addressLocality": locality, "addressRegion": region, "addressCountry": "GB"}
+            }],
+            "beckn:itemAttributes": {
+                "beckn:gridParameters": {
+                    "gridArea": region,
+                    "gridZone": grid_zone,
+                    "renewableMix": rng.randint(20, 95),
+                    "carbonIntensity": rng.randint(40, 300)
+                },
+                "beckn:capacityParameters": {"availableCapacity": rng.randint(1, 50)}
+            }
+        })
+        offers.append({
+            "@type": "beckn:Offer",
+            "beckn:id": f"offer-for-{item_id}",
+            "beckn:items": [item_id],
+            "beckn:provider": "sandbox-bpp",
+            "beckn:price": {"currency": "GBP", "value": round(rng.uniform(0.08, 0.35), 4)}
+        })
+
+    return {
+        "message": {
+            "catalogs": [{
+                "@type": "beckn:Catalog",
+                "beckn:descriptor": {"schema:name": "Local Beckn sandbox"},
+                "beckn:items": items,
+                "beckn:offers": offers
+            }]
+        }
+    }
+
+
+class BecknSandbox:
+    """
+    Order state, fault injection and latency for the sandbox server.
+    Uses a seeded RNG so runs with the same config and request order are reproducible.
+    """
+
+    def __init__(self, config: SandboxConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.catalog = generate_catalog(config.num_items, config.seed)
+        self.items = {item["beckn:id"] for item in self.catalog["message"]["catalogs"][0]["beckn:items"]}
+        self.orders: Dict[str, Dict] = {}
+        self.requests = {action: 0 for action in ACTIONS}
+        self.errors = 0
+        self.slow_responses = 0
+
+    def sample_latency(self) -> float:
+        """Seconds before responding, drawn from a log-normal around latency_ms."""
+        median = self.config.latency_ms / 1000.0
+        return median * math.exp(self.rng.gauss(0.0, self.config.latency_sigma))
+
+    def should_fail(self) -> bool:
+        return self.rng.random() < self.config.error_rate
+
+    def should_drip(self) -> bool:
+        return self.rng.random() < self.config.slow_loris_rate
+
+    @staticmethod
+    def _nack(code: str, message: str) -> Dict:
+        return {"message": {"ack": {"status": "NACK"}}, "error": {"code": code, "message": message}}
+
+    def handle(self, action: str, body: Dict) -> Dict:
+        """
+        Applies an action to the order book and returns its result payload
+        (the body an on_<action> callback would carry).
+        """
+        message = body.get("message", {})
+        if action == "discover":
+            return self.catalog
+
+        order = dict(message.get("order", {}))
+        if action == "select" and self.config.strict_items:
+            for order_item in order.get("beckn:orderItems", []):
+                offered = order_item.get("beckn:acceptedOffer", {}).get("beckn:items", [])
+                if not offered or offered[0] not in self.items:
+                    return self._nack("30004", f"Item {offered[0] if offered else None} not found")
+        if action == "select":
+            order["beckn:orderStatus"] = "CREATED"
+        elif action == "init":
+            order["beckn:orderStatus"] = "INITIALIZED"
+        elif action == "confirm":
+            order["beckn:id"] = order.get("beckn:id") or f"order-{uuid.UUID(int=self.rng.getrandbits(128))}"
+            order["beckn:orderStatus"] = "CONFIRMED"
+            self.orders[order["beckn:id"]] = order
+        elif action in ("status", "update"):
+            stored = self.orders.get(order.get("beckn:id"))
+            if stored is None:
+                return self._nack("30005", f"Order {order.get('beckn:id')} not found")
+            if action == "update":
+                stored.update({k: v for k, v in order.items() if k != "beckn:id"})
+                stored["beckn:updatedAt"] = datetime.utcnow().isoformat() + "Z"
+            order = stored
+        return {"message": {"order": order}}
+
+
+def _drip(body: bytes, seconds: float, chunks: int = 20):
+    """Yields the body a few bytes at a time, spread over `seconds`."""
+    size = max(1, math.ceil(len(body) / chunks))
+
+    async def stream():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+            await asyncio.sleep(seconds / chunks)
+    return stream()
+
+
+def create_app(config: Optional[SandboxConfig] = None) -> FastAPI:
+    """
+    Builds the sandbox FastAPI app.
+
+    Args:
+        config: Catalog size, latency and fault settings (defaults to SandboxConfig())
+    """
+    sandbox = BecknSandbox(config or SandboxConfig())
+    app = FastAPI(title="Beckn Sandbox")
+    app.state.sandbox = sandbox
+    background: List[asyncio.Task] = []
+
+    async def deliver(context: Dict, result: Dict):
+        # Post the result back to the BAP as on_<action>, like a real BPP
+        await asyncio.sleep(sandbox.sample_latency())
+        payload = {"context": {**context, "action": f"on_{context['action']}"}, **result}
+        try:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                await client.post(f"{context['bap_uri'].rstrip('/')}/on_{context['action']}", json=payload)
+        except httpx.HTTPError as e:
+            print(f"[Sandbox] Callback to {context.get('bap_uri')} failed: {e!r}")
+
+    @app.post("/{action}")
+    async def beckn_action(action: str, request: Request):
+        if action not in ACTIONS:
+            return JSONResponse(status_code=404, content=BecknSandbox._nack("30000", f"Unknown action {action}"))
+        body = await request.json()
+        sandbox.requests[action] += 1
+
+        await asyncio.sleep(sandbox.sample_latency())
+        if sandbox.should_fail():
+            sandbox.errors += 1
+            status = sandbox.rng.choice([429, 500, 503])
+            return JSONResponse(status_code=status, content=BecknSandbox._nack(str(status), "Injected sandbox failure"))
+
+        result = sandbox.handle(action, body)
+        context = {**body.get("context", {}), "action": action}
+        if sandbox.config.callbacks and action != "discover" and "error" not in result:
+            background.append(asyncio.create_task(deliver(context, result)))
+            background[:] = [task for task in background if not task.done()]
+            content = {"message": {"ack": {"status": "ACK"}}}
+        else:
+            content = {"context": context, **result}
+
+        if sandbox.should_drip():
+            sandbox.slow_responses += 1
+            body_bytes = json.dumps(content).encode()
+            return StreamingResponse(_drip(body_bytes, sandbox.config.slow_loris_seconds), media_type="application/json")
+        return content
+
+    @app.get("/stats")
+    async def stats():
+        return {
+            "requests": sandbox.requests,
+            "errors": sandbox.errors,
+            "slow_responses": sandbox.slow_responses,
+            "orders": len(sandbox.orders),
+            "catalog_items": len(sandbox.items)
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Beckn BPP sandbox")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--items", type=int, default=SandboxConfig.num_items)
+    parser.add_argument("--latency-ms", type=float, default=SandboxConfig.latency_ms)
+    parser.add_argument("--latency-sigma", type=float, default=SandboxConfig.latency_sigma)
+    parser.add_argument("--error-rate", type=float, default=SandboxConfig.error_rate)
+    parser.add_argument("--slow-loris-rate", type=float, default=SandboxConfig.slow_loris_rate)
+    parser.add_argument("--slow-loris-seconds", type=float, default=SandboxConfig.slow_loris_seconds)
+    parser.add_argument("--callbacks", action="store_true")
+    parser.add_argument("--strict-items", action="store_true")
+    parser.add_argument("--seed", type=int, default=SandboxConfig.seed)
+    args = parser.parse_args()
+
+    import uvicorn
+    config = SandboxConfig(
+        num_items=args.items,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        slow_loris_rate=args.slow_loris_rate,
+        slow_loris_seconds=args.slow_loris_seconds,
+        callbacks=args.callbacks,
+        strict_items=args.strict_items,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Local OpenAI-compatible LLM stand-in for offline benchmarking.
+
+Serves POST /v1/chat/completions with a configurable latency distribution,
+error rate and token throughput, so aggregation and scheduling throughput can
+be measured reproducibly without network access or an ASI API key.
+
+Run it, then point LLMClient at it:
+
+    python -m simulation.llm_stub --port 8100 --latency-ms 800 --error-rate 0.02
+    export ASI_API_KEY=stub
+    export ASI_BASE_URL=http://127.0.0.1:8100/v1
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 800.0          # Median time to first token
+    latency_sigma: float = 0.4         # Log-normal spread of the time to first token
+    error_rate: float = 0.0            # Fraction of requests answered with an error
+    tokens_per_second: float = 60.0    # Completion throughput after the first token
+    completion_ratio: float = 0.6      # Fraction of max_tokens generated per completion
+    seed: Optional[int] = 42
+
+
+class LLMStub:
+    """
+    Generates latency, errors and completions for the stub server.
+    Uses a seeded RNG so runs with the same config and request order are reproducible.
+    """
+
+    AGENT_PATTERN = re.compile(r"- Agent: ([^|\n]+?) \|")
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.requests = 0
+        self.errors = 0
+
+    def sample_latency(self) -> float:
+        """Seconds to first token, drawn from a log-normal around latency_ms."""
+        median = self.config.latency_ms / 1000.0
+        return median * math.exp(self.rng.gauss(0.0, self.config.latency_sigma))
+
+    def should_fail(self) -> bool:
+        return self.rng.random() < self.config.error_rate
+
+    def completion_text(self, prompt: str, completion_tokens: int) -> str:
+        """
+        Returns filler text of roughly completion_tokens tokens, or a JSON body
+        when the prompt asks for a batched regional synthesis.
+        """
+        if "Respond with JSON only" in prompt:
+            agents = [name.strip() for name in self.AGENT_PATTERN.findall(prompt)]
+            body = {"summaries": {name: f"{name} is operating normally with stable grid conditions." for name in agents}}
+            if '"ranking"' in prompt:
+                body["ranking"] = "\n".join(f"{i}. {name}" for i, name in enumerate(agents, start=1))
+            return json.dumps(body)
+
+        words = ["grid", "capacity", "carbon", "renewable", "price", "stable", "workload", "region"]
+        # ~0.75 words per token
+        word_count = max(1, int(completion_tokens * 0.75))
+        return " ".join(self.rng.choice(words) for _ in range(word_count)).capitalize() + "."
+
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Rough token estimate (~4 characters per token)."""
+        return max(1, len(text) // 4)
+
+
+def create_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """
+    Builds the stub FastAPI app.
+
+    Args:
+        config: Latency/error/throughput settings (defaults to StubConfig())
+    """
+    stub = LLMStub(config or StubConfig())
+    app = FastAPI(title="LLM Stub")
+    app.state.stub = stub
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stub.requests += 1
+
+        messages: List[Dict] = body.get("messages", [])
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        max_tokens = int(body.get("max_tokens") or 256)
+
+        latency = stub.sample_latency()
+        if stub.should_fail():
+            stub.errors += 1
+            await asyncio.sleep(latency)
+            status = stub.rng.choice([429, 500, 503])
+            return JSONResponse(
+                status_code=status,
+                content={"error": {"message": "Injected stub failure", "type": "server_error", "code": status}}
+            )
+
+        target_tokens = max(1, int(max_tokens * stub.config.completion_ratio))
+        text = stub.completion_text(prompt, target_tokens)
+        completion_tokens = stub.count_tokens(text)
+        prompt_tokens = stub.count_tokens(prompt)
+
+        await asyncio.sleep(latency + completion_tokens / stub.config.tokens_per_second)
+
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "local"}]}
+
+    @app.get("/stats")
+    async def stats():
+        return {"requests": stub.requests, "errors": stub.errors}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=StubConfig.latency_ms)
+    parser.add_argument("--latency-sigma", type=float, default=StubConfig.latency_sigma)
+    parser.add_argument("--error-rate", type=float, default=StubConfig.error_rate)
+    parser.add_argument("--tokens-per-second", type=float, default=StubConfig.tokens_per_second)
+    parser.add_argument("--seed", type=int, default=StubConfig.seed)
+    args = parser.parse_args()
+
+    import uvicorn
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from llm_metrics import llm_metrics
+
+
+class SummaryCache:
+    """
+    Content-addressed cache for LLM-synthesized agent summaries.
+
+    Entries are keyed on a hash of the quantized agent state, so small
+    fluctuations (e.g. price noise below the quantization step) reuse the
+    same summary. Entries expire after `ttl_seconds` and the least recently
+    used entry is evicted once `max_entries` is reached.
+    """
+
+    # Quantization steps for the fields that make up the state key
+    PRICE_STEP = 0.005          # GBP/kWh
+    CARBON_STEP = 5.0           # gCO2/kWh
+    RENEWABLE_STEP = 5.0        # percent
+    CAPACITY_STEP = 1.0         # slots / MW
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 256):
+        """
+        Initialize the summary cache.
+
+        Args:
+            ttl_seconds: Time after which a cached summary is considered expired
+            max_entries: Maximum number of summaries kept before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Simple counters for observability
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _quantize(value: Any, step: float) -> Optional[float]:
+        """Round a numeric value to the nearest multiple of step."""
+        try:
+            return round(round(float(value) / step) * step, 6)
+        except (TypeError, ValueError):
+            return None
+
+    def state_key(self, agent_data: Dict[str, Any]) -> str:
+        """
+        Build a content hash from the quantized agent state.
+
+        Args:
+            agent_data: Agent state in the same shape passed to
+                LLMClient.synthesize_agent_report
+
+        Returns:
+            Hex digest identifying the quantized state
+        """
+        energy_data = agent_data.get("energy_data") or {}
+        location_data = agent_data.get("location_data") or {}
+
+        state = {
+            "name": agent_data.get("name"),
+            "price": self._quantize(energy_data.get("price"), self.PRICE_STEP),
+            "carbon": self._quantize(energy_data.get("carbon_intensity"), self.CARBON_STEP),
+            "renewable": self._quantize(
+                energy_data.get("renewable_mix", location_data.get("renewable_mix")),
+                self.RENEWABLE_STEP
+            ),
+            "active_tasks": agent_data.get("active_tasks_count", 0),
+            "capacity": self._quantize(agent_data.get("available_capacity"), self.CAPACITY_STEP),
+            "grid_capacity": self._quantize(location_data.get("available_capacity"), self.CAPACITY_STEP),
+        }
+
+        encoded = json.dumps(state, sort_keys=True).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()
+
+    def get(self, key: str, record: bool = True) -> Optional[str]:
+        """
+        Return the cached summary for a state key, or None if missing/expired.
+
+        Args:
+            key: State key from state_key()
+            record: Count the lookup as a hit/miss; pass False for probes that
+                don't decide whether to call the LLM
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if record:
+            self.record_lookup(entry is not None)
+        return entry[1] if entry is not None else None
+
+    def record_lookup(self, hit: bool):
+        """Count a lookup made on the caller's behalf (e.g. a batched synthesis)."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        llm_metrics.record_cache(hit)
+
+    def put(self, key: str, summary: str):
+        """
+        Store a summary for a state key, evicting the least recently used entry if full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), summary)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached summaries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import List, Optional
+
+
+class SummaryRefresher:
+    """
+    Background worker that refreshes local summaries and regional rankings
+    off the simulation thread.
+
+    Every `interval_seconds` it refreshes each region whose summaries are
+    older than `max_staleness_seconds` or whose agent state has changed.
+    While running, regions skip inline LLM synthesis in aggregate_data(), so
+    reports always return the latest completed summary without blocking.
+    """
+
+    def __init__(self, regional_agents: List, interval_seconds: float = 5.0, max_staleness_seconds: float = 60.0):
+        """
+        Initialize the refresher.
+
+        Args:
+            regional_agents: RegionalAgent instances to refresh
+            interval_seconds: How often to check regions for a refresh
+            max_staleness_seconds: Maximum age of a region's summaries before a forced refresh
+        """
+        self.regional_agents = regional_agents
+        self.interval_seconds = interval_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background thread and take over synthesis from the regions."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        for region in self.regional_agents:
+            region.background_synthesis = True
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="summary-refresher", daemon=True)
+        self._thread.start()
+        print(
+            f"✓ Summary refresher started (interval: {self.interval_seconds}s, "
+            f"max staleness: {self.max_staleness_seconds}s)"
+        )
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background thread and hand synthesis back to the regions."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+        for region in self.regional_agents:
+            region.background_synthesis = False
+
+    def refresh_once(self):
+        """Run a single refresh pass over all regions that need it."""
+        for region in self.regional_agents:
+            if self._stop_event.is_set():
+                return
+            try:
+                if region.needs_summary_refresh(self.max_staleness_seconds):
+                    region.refresh_summaries()
+            except Exception as e:
+                print(f"Summary refresh failed for {region.region}: {e}")
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self.refresh_once()
+            elapsed = time.monotonic() - started
+
+            if elapsed > self.max_staleness_seconds:
+                print(
+                    f"⚠️  Summary refresh pass took {elapsed:.1f}s, "
+                    f"exceeding the {self.max_staleness_seconds}s staleness budget"
+                )
+
+            self._stop_event.wait(max(0.0, self.interval_seconds - elapsed))
@@ -0,0 +1,180 @@
+from typing import Any, Dict, List, Optional
+
+
+class TemplateSummary(str):
+    """
+    Text produced by the TemplateSummarizer rather than the LLM.
+    Callers use the type to avoid caching it in place of an LLM summary.
+    """
+
+
+class TemplateSummarizer:
+    """
+    Deterministic, rule-based stand-in for LLM synthesis.
+
+    Builds the same kind of 2-3 sentence agent summary and regional ranking
+    from the numeric fields LLMClient formats into its prompts, at zero latency.
+    """
+
+    PRICE_SPIKE_THRESHOLD = 0.30   # GBP/kWh, matches LocalAgent.check_for_price_spike
+    HIGH_PRICE = 0.15              # GBP/kWh
+    LOW_CARBON = 100.0             # gCO2/kWh
+    HIGH_CARBON = 200.0            # gCO2/kWh
+    HIGH_RENEWABLE = 60.0          # percent
+
+    @staticmethod
+    def _number(value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _energy_metrics(self, agent_data: Dict[str, Any]):
+        location_data = agent_data.get("location_data") or {}
+        energy_data = agent_data.get("energy_data") or {}
+        price = self._number(energy_data.get("price"))
+        carbon = self._number(energy_data.get("carbon_intensity", location_data.get("carbon_intensity")))
+        renewable = self._number(energy_data.get("renewable_mix", location_data.get("renewable_mix")))
+        return price, carbon, renewable
+
+    def summarize_agent(self, agent_data: Dict[str, Any]) -> TemplateSummary:
+        """
+        Summarize a local agent's state.
+
+        Args:
+            agent_data: Dictionary containing agent state data (same shape as
+                LLMClient.synthesize_agent_report input)
+
+        Returns:
+            2-3 sentence summary
+        """
+        name = agent_data.get("name", "Unknown")
+        location_data = agent_data.get("location_data") or {}
+        city = location_data.get("locality") or name
+        active_tasks = agent_data.get("active_tasks_count", 0)
+        available = agent_data.get("available_capacity", 0)
+        grid_capacity = self._number(location_data.get("available_capacity"))
+        price, carbon, renewable = self._energy_metrics(agent_data)
+
+        task_word = "task" if active_tasks == 1 else "tasks"
+        label = name if city == name else f"{name} ({city})"
+        status = f"{label} is running {active_tasks} active {task_word}"
+        if available:
+            status += " and is accepting new work"
+        else:
+            status += " and has no spare capacity"
+        if grid_capacity:
+            status += f" ({grid_capacity:.0f} MW grid capacity)"
+        status += "."
+
+        energy_parts = []
+        if price is not None:
+            energy_parts.append(f"energy costs £{price:.3f}/kWh")
+        if carbon is not None:
+            energy_parts.append(f"carbon intensity is {carbon:.0f} gCO2/kWh")
+        if renewable is not None:
+            energy_parts.append(f"the renewable mix is {renewable:.0f}%")
+        energy = ""
+        if energy_parts:
+            if len(energy_parts) > 1:
+                text = ", ".join(energy_parts[:-1]) + " and " + energy_parts[-1]
+            else:
+                text = energy_parts[0]
+            energy = " " + text[0].upper() + text[1:] + "."
+
+        return TemplateSummary(status + energy + " " + self._recommendation(price, carbon, renewable, available))
+
+    def _recommendation(self, price: Optional[float], carbon: Optional[float],
+                        renewable: Optional[float], available: Any) -> str:
+        if price is not None and price > self.PRICE_SPIKE_THRESHOLD:
+            return "Prices are spiking; shift flexible workloads elsewhere."
+        if not available:
+            return "Route new jobs to other sites until capacity frees up."
+        if carbon is not None and carbon < self.LOW_CARBON and (renewable or 0) >= self.HIGH_RENEWABLE:
+            return "Clean supply makes this a strong site for flexible workloads."
+        if carbon is not None and carbon > self.HIGH_CARBON:
+            return "High carbon intensity; defer non-urgent workloads if possible."
+        if price is not None and price > self.HIGH_PRICE:
+            return "Energy is expensive; prefer cheaper sites for batch work."
+        return "Conditions are normal for scheduling compute."
+
+    def rank_agents(self, agents_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order agents best to worst on normalized price plus normalized carbon intensity.
+        """
+        metrics = [(agent_data, *self._energy_metrics(agent_data)) for agent_data in agents_data]
+        max_price = max((m[1] for m in metrics if m[1]), default=1.0)
+        max_carbon = max((m[2] for m in metrics if m[2]), default=1.0)
+
+        def score(entry):
+            _, price, carbon, _ = entry
+            price_part = (price if price is not None else max_price) / max_price
+            carbon_part = (carbon if carbon is not None else max_carbon) / max_carbon
+            return price_part + carbon_part
+
+        return [entry[0] for entry in sorted(metrics, key=score)]
+
+    def rank_region(self, region_name: str, agents_data: List[Dict[str, Any]],
+                    ranking: Optional[List[Dict[str, Any]]] = None) -> TemplateSummary:
+        """
+        Build a numbered ranking with a justification for the top pick and a regional status line.
+
+        Args:
+            region_name: Name of the region
+            agents_data: Agent state dictionaries for the region
+            ranking: Authoritative numeric ranking (agent_name order) to narrate; if omitted
+                agents are ranked with rank_agents()
+
+        Returns:
+            Ranking text
+        """
+        if not agents_data:
+            return TemplateSummary(f"No local agents are reporting in {region_name}.")
+
+        ranked = []
+        if ranking:
+            by_name = {agent_data.get("name"): agent_data for agent_data in agents_data}
+            ranked = [by_name[opt["agent_name"]] for opt in ranking if opt.get("agent_name") in by_name]
+        if not ranked:
+            # No ranking, or a stale one naming none of the current agents
+            ranking = None
+            ranked = self.rank_agents(agents_data)
+        lines = []
+        for position, agent_data in enumerate(ranked, start=1):
+            price, carbon, renewable = self._energy_metrics(agent_data)
+            details = []
+            if price is not None:
+                details.append(f"£{price:.3f}/kWh")
+            if carbon is not None:
+                details.append(f"{carbon:.0f} gCO2/kWh")
+            if renewable is not None:
+                details.append(f"{renewable:.0f}% renewable")
+            lines.append(f"{position}. {agent_data.get('name', 'Unknown')} ({', '.join(details) or 'no data'})")
+
+        top = ranked[0]
+        lines.append("")
+        if ranking:
+            lines.append(f"Top pick: {top.get('name', 'Unknown')} has the lowest cost score in the region.")
+        else:
+            lines.append(f"Top pick: {top.get('name', 'Unknown')} offers the best combination of cost and carbon intensity.")
+
+        carbons = [self._energy_metrics(a)[1] for a in agents_data]
+        carbons = [c for c in carbons if c is not None]
+        if carbons:
+            average_carbon = sum(carbons) / len(carbons)
+            lines.append(f"{region_name} averages {average_carbon:.0f} gCO2/kWh across {len(agents_data)} sites.")
+
+        return TemplateSummary("\n".join(lines))
+
+    def summarize_region_batch(self, region_name: str, agents_data: List[Dict[str, Any]],
+                               ranking: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Template equivalent of LLMClient.synthesize_region_batch.
+        """
+        return {
+            "summaries": {
+                agent_data.get("name", "Unknown"): self.summarize_agent(agent_data)
+                for agent_data in agents_data
+            },
+            "ranking": self.rank_region(region_name, agents_data, ranking) if ranking else None
+        }
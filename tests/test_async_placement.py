@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import MagicMock
+import asyncio
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+import httpx
+from agents.global_agent import GlobalAgent
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_client import BecknClient
+from beckn_models import ComputeJob
+from llm_client import run_async
+
+BECKN_LATENCY = 0.05
+
+class FakeAsyncBeckn:
+    """Async Beckn lifecycle stand-in that tracks how many calls are in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, response):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(BECKN_LATENCY)
+        self.in_flight -= 1
+        return response
+
+    async def aselect(self, *args, **kwargs):
+        return await self._call({"message": {"order": {}}})
+
+    async def ainit(self, *args, **kwargs):
+        return await self._call({"message": {"order": {}}})
+
+    async def aconfirm(self, *args, **kwargs):
+        return await self._call({"message": {"order": {"beckn:orderStatus": "CONFIRMED", "beckn:id": "order_1"}}})
+
+class TestAsyncPlacement(unittest.TestCase):
+    def setUp(self):
+        self.beckn = FakeAsyncBeckn()
+        self.global_agent = GlobalAgent()
+        region = RegionalAgent("Regional_South", "UK-South")
+        region.get_report = MagicMock(return_value={"average_score": 40.0})
+        generator = DataGenerator()
+        for i in range(2):
+            agent = LocalAgent(f"Agent_{i}", "UK-South", generator)
+            agent.cost_score = 40.0 + i
+            agent.total_capacity = 5
+            agent.available_capacity = 5
+            agent.beckn_client = self.beckn
+            region.register_local_agent(agent)
+        self.region = region
+        self.global_agent.register_regional_agent(region)
+
+    def jobs(self, count):
+        return [
+            ComputeJob(job_id=f"job_{i}", priority=1, estimated_runtime_hrs=1.0, num_computations=100)
+            for i in range(count)
+        ]
+
+    def test_lifecycles_run_concurrently(self):
+        start = time.monotonic()
+        outcomes = run_async(self.global_agent._place_jobs_async(self.jobs(10)))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(outcomes, ["assigned"] * 10)
+        self.assertGreater(self.beckn.max_in_flight, 1)
+        # 10 serial lifecycles would take 30 round trips
+        self.assertLess(elapsed, BECKN_LATENCY * 10)
+
+    def test_capacity_is_reserved_before_awaiting(self):
+        outcomes = run_async(self.global_agent._place_jobs_async(self.jobs(14)))
+
+        self.assertEqual(outcomes.count("assigned"), 10)
+        self.assertEqual(outcomes.count("requeue"), 4)
+        for agent in self.region.local_agents:
+            self.assertEqual(len(agent.current_jobs), 5)
+            self.assertEqual(agent.available_capacity, 0)
+            self.assertEqual(agent.reserved_capacity, 0)
+
+    def test_placement_concurrency_limit(self):
+        self.global_agent.placement_concurrency = 1
+        run_async(self.global_agent._place_jobs_async(self.jobs(3)))
+        self.assertEqual(self.beckn.max_in_flight, 1)
+
+    def test_reassignment_keeps_reservations(self):
+        source, target = self.region.local_agents
+        for job in self.jobs(2):
+            source.current_jobs[job.job_id] = job
+        source.reserved_capacity = 1  # An async placement still in flight
+        source.trigger_workload_shift = MagicMock(return_value=True)
+        target.assign_job = MagicMock(return_value=True)
+
+        self.region.reassign_jobs_from_agent(source)
+
+        self.assertEqual(source.current_jobs, {})
+        self.assertEqual(source.available_capacity, source.total_capacity - 1)
+
+    def test_run_async_refuses_the_shared_loop(self):
+        async def nested():
+            return run_async(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            run_async(nested())
+
+class TestAsyncBecknClient(unittest.TestCase):
+    def test_per_bpp_concurrency_limit(self):
+        client = BecknClient(base_url="http://bap.test/api", max_per_bpp=2)
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(BECKN_LATENCY)
+            in_flight["now"] -= 1
+            return httpx.Response(200, json={"message": {"order": {"beckn:orderStatus": "QUOTED"}}})
+
+        async def run():
+            client._get_async_session()
+            client._async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            return await asyncio.gather(*(
+                client.aselect(f"txn_{i}", "bpp-1", "http://bpp-1", "item", "provider") for i in range(6)
+            ))
+
+        responses = asyncio.run(run())
+        self.assertEqual(len(responses), 6)
+        self.assertEqual(responses[0]["message"]["order"]["beckn:orderStatus"], "QUOTED")
+        self.assertEqual(in_flight["max"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
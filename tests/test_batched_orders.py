@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.global_agent import GlobalAgent
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_client import BecknClient
+from beckn_models import ComputeJob
+
+def make_jobs(count):
+    return [
+        ComputeJob(job_id=f"job_{i}", priority=1 + i % 3, estimated_runtime_hrs=1.0, num_computations=100)
+        for i in range(count)
+    ]
+
+def offline_client():
+    # _post returning None makes every action fall back to its mock response
+    client = BecknClient(base_url="http://beckn.invalid")
+    client._post = MagicMock(return_value=None)
+    return client
+
+class TestBatchedOrders(unittest.TestCase):
+    def setUp(self):
+        self.generator = DataGenerator()
+        self.client = offline_client()
+
+    def make_agent(self, name, capacity=5, score=40.0):
+        agent = LocalAgent(name, "UK-South", self.generator)
+        agent.cost_score = score
+        agent.total_capacity = capacity
+        agent.available_capacity = capacity
+        agent.beckn_client = self.client
+        return agent
+
+    def test_one_order_for_several_jobs(self):
+        agent = self.make_agent("Agent_0")
+        jobs = make_jobs(3)
+        jobs[1].priority = 5
+
+        confirmed = agent.assign_jobs_batch(jobs)
+
+        self.assertEqual(confirmed, jobs)
+        # One select, one init and one confirm for the whole batch
+        actions = [call.args[0] for call in self.client._post.call_args_list]
+        self.assertEqual(actions, ["select", "init", "confirm"])
+
+        init_order = self.client._post.call_args_list[1].args[1]["message"]["order"]
+        items = init_order["beckn:orderItems"]
+        self.assertEqual([item["beckn:lineId"] for item in items], [f"line-job_{i}" for i in range(3)])
+        for item in items:
+            location = item["beckn:fulfillment"]["beckn:deliveryAttributes"]["beckn:location"]
+            self.assertEqual(location["address"]["addressLocality"], agent.assigned_location)
+        # The order is as urgent as its most urgent job
+        self.assertEqual(init_order["beckn:orderAttributes"]["beckn:priority"], "high")
+
+        order_ids = {agent.active_external_orders[job.job_id] for job in jobs}
+        self.assertEqual(len(order_ids), 1)
+        self.assertEqual(set(agent.current_jobs), {job.job_id for job in jobs})
+        self.assertEqual(agent.available_capacity, 2)
+
+    def test_confirmation_split_by_line(self):
+        agent = self.make_agent("Agent_0")
+        jobs = make_jobs(3)
+        partial = {
+            "message": {
+                "order": {
+                    "beckn:id": "order_42",
+                    "beckn:orderStatus": "CONFIRMED",
+                    "beckn:orderItems": [{"beckn:lineId": "line-job_1"}],
+                }
+            }
+        }
+        self.client._post = MagicMock(side_effect=[None, None, partial])
+
+        confirmed = agent.assign_jobs_batch(jobs)
+
+        self.assertEqual([job.job_id for job in confirmed], ["job_1"])
+        self.assertEqual(agent.active_external_orders, {"job_1": "order_42"})
+        self.assertEqual(list(agent.current_jobs), ["job_1"])
+
+    def test_batch_capped_at_capacity(self):
+        agent = self.make_agent("Agent_0", capacity=2)
+
+        confirmed = agent.assign_jobs_batch(make_jobs(3))
+
+        self.assertEqual([job.job_id for job in confirmed], ["job_0", "job_1"])
+        self.assertEqual(agent.available_capacity, 0)
+
+    def test_global_batch_mode_groups_by_agent(self):
+        global_agent = GlobalAgent()
+        global_agent.batch_orders = True
+        region = RegionalAgent("Regional_South", "UK-South")
+        region.get_report = MagicMock(return_value={"average_score": 40.0})
+        best = self.make_agent("Agent_0", capacity=2, score=40.0)
+        fallback = self.make_agent("Agent_1", capacity=2, score=45.0)
+        region.register_local_agent(best)
+        region.register_local_agent(fallback)
+        global_agent.register_regional_agent(region)
+        jobs = make_jobs(3)
+
+        outcomes = global_agent._place_jobs_batched(jobs)
+
+        self.assertEqual(outcomes, ["assigned"] * 3)
+        self.assertEqual(set(best.current_jobs), {"job_0", "job_1"})
+        self.assertEqual(set(fallback.current_jobs), {"job_2"})
+        # Two orders of three round trips each
+        self.assertEqual(self.client._post.call_count, 6)
+
+    def test_region_defers_over_threshold(self):
+        region = RegionalAgent("Regional_South", "UK-South")
+        region.register_local_agent(self.make_agent("Agent_0", score=90.0))
+        jobs = make_jobs(2)
+
+        self.assertEqual(region.assign_jobs_batch(jobs), [False, False])
+        self.assertEqual(region.deferred_jobs, jobs)
+        self.client._post.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import MagicMock
+import asyncio
+import threading
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from beckn_callbacks import CallbackRegistry, parse_ttl
+from beckn_client import BecknClient
+from llm_client import run_async
+
+ACK = {"message": {"ack": {"status": "ACK"}}}
+
+def on_action(context, order_id="order-1"):
+    return {
+        "context": {**context, "action": f"on_{context['action']}"},
+        "message": {"order": {"beckn:id": order_id, "beckn:orderStatus": "CONFIRMED"}},
+    }
+
+class TestParseTtl(unittest.TestCase):
+    def test_iso_durations(self):
+        self.assertEqual(parse_ttl("PT30S"), 30.0)
+        self.assertEqual(parse_ttl("PT1M30S"), 90.0)
+        self.assertEqual(parse_ttl("P1DT1H"), 90000.0)
+        self.assertEqual(parse_ttl("PT0.5S"), 0.5)
+
+    def test_missing_or_malformed_uses_default(self):
+        self.assertEqual(parse_ttl(None), 30.0)
+        self.assertEqual(parse_ttl("30 seconds", default=5.0), 5.0)
+        self.assertEqual(parse_ttl("PT", default=5.0), 5.0)
+
+class TestCallbackRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CallbackRegistry()
+        self.context = {"transaction_id": "txn-1", "message_id": "msg-1", "action": "select"}
+
+    def test_resolve_by_message_id(self):
+        future = self.registry.expect(self.context)
+        callback = on_action(self.context)
+
+        self.assertTrue(self.registry.resolve(callback))
+        self.assertIs(future.result(timeout=0), callback)
+        self.assertEqual(self.registry.stats()["pending"], 0)
+
+    def test_falls_back_to_transaction_and_action(self):
+        future = self.registry.expect(self.context)
+        callback = on_action({**self.context, "message_id": "bpp-minted"})
+
+        self.assertTrue(self.registry.resolve(callback))
+        self.assertIs(future.result(timeout=0), callback)
+
+    def test_unknown_or_wrong_action_is_unmatched(self):
+        self.registry.expect(self.context)
+
+        self.assertFalse(self.registry.resolve(on_action({**self.context, "action": "init"})))
+        self.assertFalse(self.registry.resolve(on_action({**self.context, "transaction_id": "other"})))
+        self.assertEqual(self.registry.stats()["unmatched"], 2)
+        self.assertEqual(self.registry.stats()["pending"], 1)
+
+class TestCallbackMode(unittest.TestCase):
+    def setUp(self):
+        self.client = BecknClient(base_url="http://bap.test/api")
+        self.client.callback_mode = True
+        self.client.callbacks = CallbackRegistry()
+
+    def answer_later(self, delay=0.02):
+        # Stand-in for the BPP posting to /bap/on_*
+        def answer():
+            for transaction_id, message_id in self.client.callbacks.pending():
+                context = {"transaction_id": transaction_id, "message_id": message_id, "action": "select"}
+                self.client.callbacks.resolve(on_action(context, order_id=transaction_id))
+        timer = threading.Timer(delay, answer)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_ack_then_callback(self):
+        self.client._post = MagicMock(return_value=ACK)
+        self.answer_later()
+
+        result = self.client.select("txn-1", "bpp", "http://bpp", "item-1", "provider-1")
+
+        self.assertEqual(result["message"]["order"]["beckn:id"], "txn-1")
+        self.assertEqual(self.client.callbacks.stats()["resolved"], 1)
+
+    def test_inline_result_skips_waiting(self):
+        inline = {"message": {"order": {"beckn:id": "inline"}}}
+        self.client._post = MagicMock(return_value=inline)
+
+        self.assertIs(self.client.select("txn-1", "bpp", "http://bpp", "item-1", "provider-1"), inline)
+        self.assertEqual(self.client.callbacks.stats()["pending"], 0)
+
+    def test_times_out_after_ttl(self):
+        self.client._post = MagicMock(return_value=ACK)
+        payload = {"context": {"transaction_id": "txn-1", "message_id": "msg-1", "action": "select", "ttl": "PT0.05S"}}
+
+        self.assertIsNone(self.client._request("select", payload))
+        self.assertEqual(self.client.callbacks.stats(), {"pending": 0, "resolved": 0, "timed_out": 1, "unmatched": 0})
+
+    def test_many_async_transactions_in_flight(self):
+        async def ack(*args, **kwargs):
+            return ACK
+        self.client._apost = ack
+        self.answer_later(delay=0.1)
+
+        async def place(count):
+            return await asyncio.gather(*(
+                self.client.aselect(f"txn-{i}", "bpp", "http://bpp", "item-1", "provider-1") for i in range(count)
+            ))
+        results = run_async(place(500))
+
+        self.assertEqual([r["message"]["order"]["beckn:id"] for r in results], [f"txn-{i}" for i in range(500)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+import requests
+from beckn_client import BecknClient, get_beckn_client
+
+def http_response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body or {}
+    response.text = str(body)
+    return response
+
+class TestBecknClientSession(unittest.TestCase):
+    def setUp(self):
+        self.client = BecknClient(base_url="http://bap.test/api", pool_size=4)
+        self.client.session.post = MagicMock()
+        sleep_patch = patch('beckn_client.time.sleep')
+        self.sleep = sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+
+    def test_pooled_adapter(self):
+        adapter = self.client.session.get_adapter("http://bap.test/api/select")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertIs(get_beckn_client(), get_beckn_client())
+
+    def test_transient_errors_are_retried_with_backoff(self):
+        ok = {"message": {"order": {"beckn:id": "order-1"}}}
+        self.client.session.post.side_effect = [
+            requests.ConnectionError("reset"), http_response(503), http_response(200, ok)
+        ]
+        result = self.client.status("txn", "bpp", "http://bpp", "order-1")
+        self.assertEqual(result, ok)
+        self.assertEqual(self.client.session.post.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+        # Every attempt sends the same serialized request
+        sent = [call.kwargs["data"] for call in self.client.session.post.call_args_list]
+        self.assertEqual(len(set(sent)), 1)
+        self.assertIsInstance(sent[0], bytes)
+
+    def test_error_body_retry_resends_the_request(self):
+        error_body = {"error": {"code": "50001"}}
+        self.client.session.post.side_effect = [http_response(200, error_body)] * 3
+        # Make a rejected 200 retryable to exercise the retry path
+        with patch('beckn_client.RETRYABLE_STATUS_CODES', {200}):
+            self.client.select("txn", "bpp", "http://bpp", "item-1", "provider-1")
+        self.assertEqual(self.client.session.post.call_count, 3)
+        sent = [call.kwargs["data"] for call in self.client.session.post.call_args_list]
+        self.assertEqual(sent[0], sent[-1])
+
+    def test_confirm_is_not_retried(self):
+        self.client.session.post.return_value = http_response(503)
+        result = self.client.confirm("txn", "bpp", "http://bpp", {"beckn:id": "order-1"})
+        self.assertEqual(self.client.session.post.call_count, 1)
+        self.assertEqual(result["message"]["order"]["beckn:orderStatus"], "CONFIRMED")
+
+    def test_client_errors_fall_back_without_retry(self):
+        self.client.session.post.return_value = http_response(400, {"error": "bad request"})
+        result = self.client.discover()
+        self.assertEqual(self.client.session.post.call_count, 1)
+        self.assertEqual(result["message"]["catalog"]["beckn:descriptor"]["name"], "Mock Catalog")
+
+    def test_error_body_is_rejected_for_lifecycle_actions(self):
+        self.client.session.post.return_value = http_response(200, {"error": {"code": "30004"}})
+        result = self.client.select("txn", "bpp", "http://bpp", "item-1", "provider-1")
+        self.assertEqual(result["message"]["order"]["beckn:orderStatus"], "QUOTE_REQUESTED")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import MagicMock
+import json
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+import beckn_payloads
+from beckn_payloads import ORDER_ATTRIBUTES, dumps, utc_timestamp
+from beckn_client import BecknClient
+from beckn_models import ComputeJob
+
+class TestBecknPayloads(unittest.TestCase):
+    def setUp(self):
+        self.client = BecknClient(base_url="http://bap.test/api")
+        self.job = ComputeJob(job_id="job_1", priority=4, estimated_runtime_hrs=2.0, num_computations=100)
+
+    def test_dumps_matches_stdlib_json(self):
+        payload = self.client._init_payload("txn", "bpp", "http://bpp", {"beckn:id": "o"}, self.job)
+        self.assertEqual(json.loads(dumps(payload)), json.loads(json.dumps(payload)))
+
+    def test_dumps_without_orjson(self):
+        original = beckn_payloads.orjson
+        beckn_payloads.orjson = None
+        try:
+            self.assertEqual(dumps({"a": [1, "é"]}), '{"a":[1,"é"]}'.encode("utf-8"))
+        finally:
+            beckn_payloads.orjson = original
+
+    def test_timestamps(self):
+        self.assertRegex(utc_timestamp(), r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$")
+
+    def test_templates_are_not_mutated_by_requests(self):
+        first = self.client._create_context("init", transaction_id="t1", bpp_id="bpp-1")
+        second = self.client._create_context("init", transaction_id="t2")
+
+        self.assertEqual(first["transaction_id"], "t1")
+        self.assertNotIn("bpp_id", second)
+        self.assertEqual(second["schema_context"], first["schema_context"])
+        self.assertNotIn("schema_context", self.client._create_context("select"))
+
+        # Localizing one order's fulfillment must not leak into the next
+        fulfillment = self.client.compute_fulfillment(self.job)
+        fulfillment["beckn:deliveryAttributes"]["beckn:location"]["address"]["addressLocality"] = "Leeds"
+        fresh = self.client.compute_fulfillment(self.job)
+        self.assertEqual(fresh["beckn:deliveryAttributes"]["beckn:location"]["address"]["addressLocality"], "Unknown")
+        self.assertEqual(ORDER_ATTRIBUTES["high"]["beckn:priority"], "high")
+
+    def test_body_is_serialized_once(self):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"message": {"order": {"beckn:id": "o"}}}
+        self.client.session.post = MagicMock(return_value=response)
+
+        self.client.select("txn", "bpp", "http://bpp", "item", "provider")
+
+        kwargs = self.client.session.post.call_args.kwargs
+        self.assertIsInstance(kwargs["data"], bytes)
+        body = json.loads(kwargs["data"])
+        self.assertEqual(body["context"]["action"], "select")
+        self.assertEqual(body["message"]["order"]["beckn:orderItems"][0]["beckn:acceptedOffer"]["beckn:items"], ["item"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from fastapi.testclient import TestClient
+from simulation.beckn_sandbox import SandboxConfig, create_app, generate_catalog
+from beckn_client import BecknClient
+from discovery_index import DiscoveryIndex
+
+def sandbox_client(config):
+    # Route the client's pooled session through the in-process sandbox app
+    app = create_app(config)
+    client = BecknClient(base_url="http://testserver")
+    client.session = TestClient(app)
+    return client, app.state.sandbox
+
+class TestBecknSandbox(unittest.TestCase):
+    def test_catalog_scales_and_keeps_agent_localities(self):
+        index = DiscoveryIndex(generate_catalog(10000))
+
+        self.assertEqual(len(index.locations), 10000)
+        self.assertEqual(len(index.prices), 10000)
+        self.assertEqual(index.location("Leeds")["item_id"], "item-00008")
+        self.assertIsNotNone(index.location("Leeds-2"))
+
+    def test_catalog_is_reproducible(self):
+        self.assertEqual(generate_catalog(50, seed=7), generate_catalog(50, seed=7))
+        self.assertNotEqual(generate_catalog(50, seed=7), generate_catalog(50, seed=8))
+
+    def test_order_lifecycle(self):
+        client, sandbox = sandbox_client(SandboxConfig(latency_ms=1))
+
+        catalog = client.discover()
+        self.assertEqual(len(catalog["message"]["catalogs"][0]["beckn:items"]), 9)
+
+        select_res = client.select("txn-1", "bpp", "http://bpp", "item-00000", "sandbox-bpp")
+        self.assertEqual(select_res["message"]["order"]["beckn:orderStatus"], "CREATED")
+        init_res = client.init("txn-1", "bpp", "http://bpp", select_res["message"]["order"])
+        confirm_res = client.confirm("txn-1", "bpp", "http://bpp", init_res["message"]["order"])
+        order_id = confirm_res["message"]["order"]["beckn:id"]
+
+        status_res = client.status("txn-1", "bpp", "http://bpp", order_id)
+        self.assertEqual(status_res["message"]["order"]["beckn:orderStatus"], "CONFIRMED")
+        self.assertEqual(sandbox.requests["confirm"], 1)
+        self.assertIn(order_id, sandbox.orders)
+
+    def test_strict_items_rejects_unknown_item(self):
+        client, _ = sandbox_client(SandboxConfig(latency_ms=1, strict_items=True))
+
+        response = client._post("select", client._select_payload("txn-1", "bpp", "http://bpp", "missing", "sandbox-bpp"))
+        self.assertIsNone(response)
+
+    @patch('beckn_client.time.sleep')
+    def test_error_injection_exercises_retries(self, sleep):
+        client, sandbox = sandbox_client(SandboxConfig(latency_ms=1, error_rate=1.0))
+
+        client.select("txn-1", "bpp", "http://bpp", "item-00000", "sandbox-bpp")
+
+        # select is retried twice before falling back
+        self.assertEqual(sandbox.requests["select"], 3)
+        self.assertEqual(sandbox.errors, 3)
+
+    def test_slow_loris_drips_the_response(self):
+        client, sandbox = sandbox_client(SandboxConfig(latency_ms=1, slow_loris_rate=1.0, slow_loris_seconds=0.2))
+
+        start = time.monotonic()
+        response = client.status("txn-1", "bpp", "http://bpp", "missing")
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertEqual(sandbox.slow_responses, 1)
+        self.assertEqual(response["error"]["code"], "30005")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from circuit_breaker import CircuitBreaker
+from llm_client import LLMClient
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        for _ in range(2):
+            breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_seconds=1.0)
+        breaker.record_success(latency_seconds=5.0)
+        breaker.record_success(latency_seconds=5.0)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+        with patch('circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        with patch('circuit_breaker.time.monotonic', return_value=120.0):
+            self.assertFalse(breaker.allow_request())
+        with patch('circuit_breaker.time.monotonic', return_value=131.0):
+            self.assertTrue(breaker.allow_request())   # the probe
+            self.assertFalse(breaker.allow_request())  # only one probe at a time
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+            breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with patch('circuit_breaker.time.monotonic', return_value=162.0):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_success(latency_seconds=0.1)
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+class TestLLMClientBreaker(unittest.TestCase):
+    def test_open_breaker_skips_endpoint(self):
+        client = LLMClient(api_key="test-key")
+        client.client = MagicMock()
+        client.client.chat.completions.create.side_effect = TimeoutError("deadline exceeded")
+
+        for _ in range(client.breaker.failure_threshold):
+            self.assertIsNone(client.synthesize("prompt"))
+        self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+
+        calls = client.client.chat.completions.create.call_count
+        self.assertIsNone(client.synthesize("prompt"))
+        self.assertEqual(client.client.chat.completions.create.call_count, calls)
+
+    def test_deadline_passed_to_endpoint(self):
+        client = LLMClient(api_key="test-key", timeout=2.5)
+        client.client = MagicMock()
+        client.synthesize("prompt")
+        self.assertEqual(client.client.chat.completions.create.call_args[1]['timeout'], 2.5)
+
+    def test_cancelled_probe_releases_breaker(self):
+        client = LLMClient(api_key="test-key")
+        client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0)
+        client.async_client = MagicMock()
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+        client.async_client.chat.completions.create = AsyncMock(side_effect=hang)
+        client.breaker.record_failure()
+
+        async def cancelled_probe():
+            task = asyncio.ensure_future(client.asynthesize("prompt"))
+            await asyncio.sleep(0.01)
+            self.assertEqual(client.breaker.state, CircuitBreaker.HALF_OPEN)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancelled_probe())
+        self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+        # Not stuck behind the cancelled probe: the next probe is allowed
+        self.assertTrue(client.breaker.allow_request())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from discovery_index import DiscoveryIndex
+from discovery_service import get_discovery_service
+from agents.local_agent import LocalAgent
+from simulation.data_generator import DataGenerator
+
+def catalog_item(item_id, locality, carbon=120, renewable=60, capacity=150):
+    return {
+        "beckn:id": item_id,
+        "beckn:descriptor": {"schema:name": f"{locality} slot"},
+        "beckn:availableAt": [{"address": {"addressLocality": locality, "addressRegion": "UK"}}],
+        "beckn:itemAttributes": {
+            "beckn:gridParameters": {"carbonIntensity": carbon, "renewableMix": renewable},
+            "beckn:capacityParameters": {"availableCapacity": capacity}
+        }
+    }
+
+DISCOVERY = {
+    "message": {
+        "catalogs": [{
+            "beckn:items": [catalog_item("item-london", "London"), catalog_item("item-bristol", "Bristol", carbon=80)],
+            "beckn:offers": [
+                {"beckn:items": ["item-london"], "beckn:price": {"value": "0.14"}},
+                {"beckn:items": ["item-bristol"], "beckn:price": {"value": "0.09"}},
+                {"beckn:items": ["item-bristol"], "beckn:price": {"value": "0.50"}}
+            ]
+        }]
+    }
+}
+
+class TestDiscoveryIndex(unittest.TestCase):
+    def test_lookups(self):
+        index = DiscoveryIndex(DISCOVERY)
+        self.assertEqual(len(index.locations), 2)
+        self.assertEqual(index.location("Bristol")["carbon_intensity"], 80)
+        self.assertEqual(index.location("Bristol")["available_capacity"], 150)
+        self.assertIsNone(index.location("Leeds"))
+        self.assertEqual(index.price("item-bristol"), 0.09)  # First offer wins
+        self.assertIsNone(index.price("item-unknown"))
+        self.assertIsNone(index.price(None))
+
+    def test_malformed_result_gives_empty_index(self):
+        index = DiscoveryIndex({"message": {"catalogs": [{"beckn:items": [{"beckn:availableAt": []}]}]}})
+        self.assertEqual(index.locations, [])
+        self.assertEqual(DiscoveryIndex({"error": "down"}).prices, {})
+
+    def test_agents_use_shared_index_without_mutating_it(self):
+        beckn_client = MagicMock()
+        beckn_client.discover.return_value = DISCOVERY
+        generator = DataGenerator()
+        london = LocalAgent("London", "UK-South", generator)
+        bristol = LocalAgent("Bristol", "UK-South", generator)
+        for agent in (london, bristol):
+            agent.beckn_client = beckn_client
+            agent.discover_energy_slots()
+
+        self.assertEqual(london.location_data["price"], 0.14)
+        self.assertEqual(bristol.location_data["price"], 0.09)
+        self.assertEqual(bristol.location_data["price_source"], "beckn_api")
+        _, index = get_discovery_service(beckn_client).discover_indexed()
+        self.assertNotIn("price", index.location("Bristol"))
+
+if __name__ == '__main__':
+    unittest.main()
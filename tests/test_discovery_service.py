@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import threading
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from discovery_service import DiscoveryService, get_discovery_service
+from beckn_client import BecknClient
+from agents.local_agent import LocalAgent
+from simulation.data_generator import DataGenerator
+
+CATALOG = {"message": {"catalogs": []}}
+
+class TestDiscoveryService(unittest.TestCase):
+    def setUp(self):
+        self.beckn_client = MagicMock()
+
+        def slow_discover(query):
+            time.sleep(0.1)
+            return CATALOG
+
+        self.beckn_client.discover.side_effect = slow_discover
+        self.service = DiscoveryService(self.beckn_client, ttl_seconds=10)
+
+    def test_concurrent_identical_queries_coalesce(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.service.discover())) for _ in range(9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.beckn_client.discover.call_count, 1)
+        self.assertEqual(len(results), 9)
+        self.assertTrue(all(result is CATALOG for result in results))
+        self.assertEqual(self.service.requests + self.service.coalesced + self.service.cache_hits, 9)
+
+    def test_result_reused_until_ttl_expires(self):
+        with patch('discovery_service.time.monotonic', return_value=100.0):
+            self.service.discover()
+        with patch('discovery_service.time.monotonic', return_value=109.0):
+            self.service.discover()
+        self.assertEqual(self.beckn_client.discover.call_count, 1)
+
+        with patch('discovery_service.time.monotonic', return_value=111.0):
+            self.service.discover()
+        self.assertEqual(self.beckn_client.discover.call_count, 2)
+
+    def test_failures_are_not_cached(self):
+        self.beckn_client.discover.side_effect = [ConnectionError("down"), CATALOG]
+        with self.assertRaises(ConnectionError):
+            self.service.discover()
+        self.assertIs(self.service.discover(), CATALOG)
+
+    def test_mock_fallback_is_briefly_cached_and_not_announced(self):
+        client = BecknClient(base_url="http://beckn.invalid")
+        client._post = MagicMock(return_value=None)
+        service = DiscoveryService(client, ttl_seconds=10, failure_ttl_seconds=0.05)
+        listener = MagicMock()
+        service.add_listener(listener)
+
+        # Reused within the short failure TTL...
+        self.assertTrue(BecknClient.is_fallback(service.discover()))
+        service.discover()
+        self.assertEqual(client._post.call_count, 1)
+
+        # ...then retried, well before the normal TTL
+        time.sleep(0.1)
+        service.discover()
+        self.assertEqual(client._post.call_count, 2)
+        self.assertEqual(service.failures, 2)
+        listener.assert_not_called()
+
+    def test_agents_sharing_a_client_share_discovery(self):
+        generator = DataGenerator()
+        agents = [LocalAgent(name, "UK-South", generator) for name in ("London", "Bristol", "Cambridge")]
+        for agent in agents:
+            agent.beckn_client = self.beckn_client
+            agent.discover_energy_slots()
+
+        self.assertIs(get_discovery_service(self.beckn_client), get_discovery_service(self.beckn_client))
+        self.assertEqual(self.beckn_client.discover.call_count, 1)
+        self.assertTrue(all(agent.discovery_count == 1 for agent in agents))
+
+    def test_listeners_run_on_new_results_only(self):
+        listener = MagicMock()
+        self.service.add_listener(listener)
+
+        self.service.discover()
+        self.service.discover()
+
+        listener.assert_called_once()
+        result, index = listener.call_args.args
+        self.assertIs(result, CATALOG)
+        self.assertEqual(index.locations, [])
+
+if __name__ == '__main__':
+    unittest.main()
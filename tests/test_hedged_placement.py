@@ -0,0 +1,159 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_models import ComputeJob
+from hedging import MIN_SAMPLES, HedgeClaim, LatencyTracker, get_latency_tracker
+
+SLOW = 0.3
+
+def make_job(job_id):
+    return ComputeJob(job_id=job_id, priority=1, estimated_runtime_hrs=1.0, num_computations=100)
+
+def beckn_client(latency, order_id, confirm_latency=0.0):
+    """Beckn client stand-in whose select takes `latency` seconds and confirm `confirm_latency` (sync and async)."""
+    client = MagicMock()
+    order = {"message": {"order": {}}}
+    confirmed = {"message": {"order": {"beckn:orderStatus": "CONFIRMED", "beckn:id": order_id}}}
+
+    def select(*args, **kwargs):
+        time.sleep(latency)
+        return order
+
+    async def aselect(*args, **kwargs):
+        await asyncio.sleep(latency)
+        return order
+
+    def confirm(*args, **kwargs):
+        time.sleep(confirm_latency)
+        return confirmed
+
+    async def aconfirm(*args, **kwargs):
+        await asyncio.sleep(confirm_latency)
+        return confirmed
+
+    client.select.side_effect = select
+    client.init.return_value = order
+    client.confirm.side_effect = confirm
+    client.aselect = AsyncMock(side_effect=aselect)
+    client.ainit = AsyncMock(return_value=order)
+    client.aconfirm = AsyncMock(side_effect=aconfirm)
+    client.update.return_value = {"message": {"order": {}}}
+    client.aupdate = AsyncMock(return_value={"message": {"order": {}}})
+    return client
+
+class TestLatencyTracker(unittest.TestCase):
+    def test_cutoff_follows_p95(self):
+        tracker = LatencyTracker(default_cutoff=1.0, min_cutoff=0.01)
+        self.assertEqual(tracker.cutoff("bpp"), 1.0)
+
+        for i in range(100):
+            tracker.record("bpp", (i + 1) / 100)
+        self.assertEqual(tracker.p95("bpp"), 0.95)
+        self.assertEqual(tracker.cutoff("bpp"), 0.95)
+
+        # Too few samples for a p95 yet
+        for _ in range(MIN_SAMPLES - 1):
+            tracker.record("fast", 0.001)
+        self.assertIsNone(tracker.p95("fast"))
+        tracker.record("fast", 0.001)
+        self.assertEqual(tracker.cutoff("fast"), 0.01)
+
+    def test_first_claim_wins(self):
+        claim = HedgeClaim()
+        first, second = object(), object()
+        self.assertTrue(claim(first))
+        self.assertFalse(claim(second))
+        self.assertTrue(claim(first))
+        self.assertIs(claim.winner, first)
+
+class TestHedgedPlacement(unittest.TestCase):
+    def setUp(self):
+        generator = DataGenerator()
+        self.region = RegionalAgent("North UK Regional", "North UK")
+        self.region.hedge_placements = True
+        self.agents = []
+        for name, score, latency in (("Leeds", 10.0, SLOW), ("Manchester", 20.0, 0.0)):
+            agent = LocalAgent(name, "North UK", generator)
+            agent.total_capacity = 10
+            agent.available_capacity = 10
+            agent.cost_score = score
+            agent.beckn_client = beckn_client(latency, f"order-{name}")
+            get_latency_tracker(agent.beckn_client).default_cutoff = 0.05
+            self.region.register_local_agent(agent)
+            self.agents.append(agent)
+        self.slow, self.fast = self.agents
+
+    def assert_hedge_won(self, job, elapsed, cancel="update"):
+        self.assertLess(elapsed, SLOW)
+        self.assertIn(job.job_id, self.fast.current_jobs)
+        self.assertEqual(self.region.hedges_started, 1)
+        self.assertEqual(self.region.hedges_won, 1)
+
+        # The slow site confirms later, loses the claim and cancels its order
+        time.sleep(SLOW + 0.1)
+        self.assertNotIn(job.job_id, self.slow.current_jobs)
+        self.assertNotIn(job.job_id, self.slow.active_external_orders)
+        update = getattr(self.slow.beckn_client, cancel).call_args.kwargs
+        self.assertEqual(update["order_id"], "order-Leeds")
+        self.assertEqual(update["order_status"], "CANCELLED")
+        self.assertEqual(job.status, "RUNNING")
+
+    def test_slow_site_is_hedged(self):
+        job = make_job("job_1")
+        start = time.monotonic()
+        self.assertTrue(self.region.assign_job(job))
+        self.assert_hedge_won(job, time.monotonic() - start)
+
+    def test_slow_site_is_hedged_async(self):
+        job = make_job("job_1")
+
+        async def place():
+            start = time.monotonic()
+            self.assertTrue(await self.region.assign_job_async(job))
+            elapsed = time.monotonic() - start
+            # Let the losing placement finish on this loop
+            await asyncio.sleep(SLOW + 0.1)
+            return elapsed
+
+        # The loser's cancel goes through the async transport, not the blocking one
+        self.assert_hedge_won(job, asyncio.run(place()), cancel="aupdate")
+        self.slow.beckn_client.update.assert_not_called()
+
+    def test_fast_site_is_not_hedged(self):
+        self.slow.beckn_client = beckn_client(0.0, "order-Leeds")
+        job = make_job("job_1")
+
+        self.assertTrue(self.region.assign_job(job))
+        self.assertIn(job.job_id, self.slow.current_jobs)
+        self.assertEqual(self.region.hedges_started, 0)
+        self.fast.beckn_client.select.assert_not_called()
+
+    def test_slow_confirm_is_not_hedged(self):
+        # Fast select/init but slow confirm: the cutoff only covers select/init
+        self.slow.beckn_client = beckn_client(0.0, "order-Leeds", confirm_latency=SLOW)
+        tracker = get_latency_tracker(self.slow.beckn_client)
+        for _ in range(MIN_SAMPLES):
+            tracker.record("Leeds", 0.001)
+        job, async_job = make_job("job_1"), make_job("job_2")
+
+        self.assertTrue(self.region.assign_job(job))
+        self.assertTrue(asyncio.run(self.region.assign_job_async(async_job)))
+
+        self.assertIn(job.job_id, self.slow.current_jobs)
+        self.assertIn(async_job.job_id, self.slow.current_jobs)
+        self.assertEqual(self.region.hedges_started, 0)
+        self.fast.beckn_client.select.assert_not_called()
+        self.fast.beckn_client.aselect.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
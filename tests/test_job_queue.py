@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+from types import SimpleNamespace
+import random
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from job_queue import JobQueue
+from beckn_models import ComputeJob
+from agents.global_agent import GlobalAgent
+
+NOW = datetime(2025, 1, 1, 12, 0)
+
+def make_job(job_id, priority=1, deadline_hrs=None):
+    job = ComputeJob(job_id=job_id, priority=priority, estimated_runtime_hrs=1.0, num_computations=100)
+    if deadline_hrs is not None:
+        job.must_start_by = NOW + timedelta(hours=deadline_hrs)
+    return job
+
+def reference_order(jobs):
+    # The ordering GlobalAgent used to get from list.sort()
+    return sorted(jobs, key=lambda j: (-j.priority, j.must_start_by if j.must_start_by else datetime.max))
+
+class TestJobQueue(unittest.TestCase):
+    def test_priority_then_deadline_then_arrival(self):
+        jobs = [
+            make_job("low", priority=1, deadline_hrs=1),
+            make_job("high_late", priority=5, deadline_hrs=8),
+            make_job("no_deadline", priority=5),
+            make_job("high_soon", priority=5, deadline_hrs=2),
+            make_job("high_late_2", priority=5, deadline_hrs=8),
+        ]
+        queue = JobQueue(jobs)
+
+        self.assertEqual(queue.peek().job_id, "high_soon")
+        self.assertEqual(
+            [queue.pop().job_id for _ in range(len(queue))],
+            ["high_soon", "high_late", "high_late_2", "no_deadline", "low"]
+        )
+        with self.assertRaises(IndexError):
+            queue.pop()
+
+    def test_matches_sorted_list(self):
+        rng = random.Random(7)
+        jobs = [
+            make_job(f"job_{i}", priority=rng.randint(1, 5), deadline_hrs=rng.choice([None, 1, 2, 4, 24]))
+            for i in range(2000)
+        ]
+        queue = JobQueue(jobs)
+
+        removed = set()
+        for job in rng.sample(jobs, 500):
+            self.assertIs(queue.remove(job.job_id), job)
+            removed.add(job.job_id)
+        self.assertIsNone(queue.remove(next(iter(removed))))
+
+        expected = [job for job in reference_order(jobs) if job.job_id not in removed]
+        self.assertEqual([queue.pop().job_id for _ in range(len(queue))], [job.job_id for job in expected])
+
+    def test_push_rekeys_queued_job(self):
+        first, second = make_job("a"), make_job("b")
+        queue = JobQueue([first, second])
+
+        second.priority = 5
+        queue.push(second)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual([job.job_id for job in queue.drain()], ["b", "a"])
+        self.assertEqual(len(queue), 0)
+        self.assertNotIn("a", queue)
+
+    def test_pop_n_takes_most_urgent_and_leaves_the_rest(self):
+        queue = JobQueue([make_job("low", 1), make_job("high", 5), make_job("mid", 3), make_job("top", 5, 1)])
+
+        self.assertEqual([job.job_id for job in queue.pop_n(2)], ["top", "high"])
+        self.assertEqual(len(queue), 2)
+        self.assertNotIn("top", queue)
+        self.assertEqual([job.job_id for job in queue.pop_n(10)], ["mid", "low"])
+        self.assertEqual(queue.pop_n(1), [])
+
+    def test_large_backlog(self):
+        rng = random.Random(1)
+        queue = JobQueue()
+        for i in range(100_000):
+            # Only the queue's key fields; building 100k pydantic jobs would dominate the test
+            queue.push(SimpleNamespace(
+                job_id=f"job_{i}", priority=rng.randint(1, 5), must_start_by=NOW + timedelta(hours=rng.randint(1, 48))
+            ))
+        for i in range(0, 100_000, 10):
+            queue.remove(f"job_{i}")
+
+        jobs = queue.drain()
+        self.assertEqual(len(jobs), 90_000)
+        self.assertEqual(jobs, reference_order(jobs))
+
+class TestGlobalAgentQueue(unittest.TestCase):
+    def test_unplaced_jobs_are_requeued_in_order(self):
+        agent = GlobalAgent()
+        for job in [make_job("low", 1, 2), make_job("high", 5, 4), make_job("mid", 3, 1)]:
+            agent.add_task_to_queue(job)
+        agent.async_placement = False
+        agent.solver_placement = False
+        agent._place_job = lambda job: "requeue"
+        agent.regional_agents = []
+
+        with patch("agents.global_agent.get_discovery_service"):
+            agent.optimize_and_assign()
+
+        self.assertEqual([job.job_id for job in agent.task_queue.drain()], ["high", "mid", "low"])
+
+if __name__ == '__main__':
+    unittest.main()
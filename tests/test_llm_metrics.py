@@ -0,0 +1,100 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from llm_metrics import Histogram, llm_metrics
+from llm_client import LLMClient, run_async
+from summary_cache import SummaryCache
+
+def completion(content="Stable grid.", prompt_tokens=120, completion_tokens=30):
+    resp = MagicMock()
+    resp.choices[0].message.content = content
+    resp.usage.prompt_tokens = prompt_tokens
+    resp.usage.completion_tokens = completion_tokens
+    return resp
+
+class TestLLMMetrics(unittest.TestCase):
+    def setUp(self):
+        llm_metrics.reset()
+        self.client = LLMClient(api_key="test-key", mode="llm")
+        self.client.client = MagicMock()
+
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = Histogram([0.1, 1.0])
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["buckets"], {"0.1": 1, "1.0": 2, "+Inf": 1})
+        self.assertEqual(snapshot["p50"], 1.0)
+        # The overflow bucket reports the largest value seen, never a non-finite float
+        self.assertEqual(snapshot["p95"], 5.0)
+        json.dumps(snapshot, allow_nan=False)
+
+    def test_success_records_tokens_by_call_site(self):
+        self.client.client.chat.completions.create.return_value = completion()
+        self.client.synthesize_agent_report({"name": "Bristol"})
+        self.client.synthesize_agent_report({"name": "Leeds"})
+
+        site = llm_metrics.snapshot()["call_sites"]["local_summary"]
+        self.assertEqual(site["calls"], {"success": 2})
+        self.assertEqual(site["prompt_tokens_total"], 240)
+        self.assertEqual(site["completion_tokens_total"], 60)
+        self.assertEqual(site["latency_seconds"]["count"], 2)
+
+    def test_failures_and_open_circuit_are_counted(self):
+        self.client.client.chat.completions.create.side_effect = ConnectionError("endpoint down")
+        for _ in range(self.client.breaker.failure_threshold + 1):
+            self.client.synthesize_regional_ranking({"region": "South UK", "agent_summaries": []})
+
+        calls = llm_metrics.snapshot()["call_sites"]["regional_ranking"]["calls"]
+        self.assertEqual(calls["error"], self.client.breaker.failure_threshold)
+        self.assertEqual(calls["circuit_open"], 1)
+
+    def test_summary_cache_hit_rate(self):
+        cache = SummaryCache()
+        key = cache.state_key({"name": "Bristol"})
+        cache.get(key)
+        cache.put(key, "Stable grid.")
+        cache.get(key)
+        cache.get(key)
+        cache.get(key, record=False)
+
+        stats = llm_metrics.snapshot()["summary_cache"]
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.6667)
+
+    def test_step_counts_only_its_own_llm_time(self):
+        async def slow_completion(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return completion()
+        self.client.async_client = MagicMock()
+        self.client.async_client.chat.completions.create = AsyncMock(side_effect=slow_completion)
+
+        async def two_concurrent_calls():
+            await asyncio.gather(self.client.asynthesize("a"), self.client.asynthesize("b"))
+
+        with llm_metrics.step():
+            # A background call (e.g. the summary refresher) outside the step
+            background = threading.Thread(target=lambda: llm_metrics.record_call("refresh", 5.0, "success"))
+            background.start()
+            background.join()
+            run_async(two_concurrent_calls())
+            time.sleep(0.1)
+
+        steps = llm_metrics.snapshot()["simulation_steps"]
+        self.assertEqual(steps["count"], 1)
+        # The two overlapping calls count once; the background call not at all
+        self.assertGreaterEqual(steps["llm_seconds_during_steps"], 0.09)
+        self.assertLess(steps["llm_seconds_during_steps"], 0.15)
+        self.assertLess(steps["llm_share"], 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import json
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from fastapi.testclient import TestClient
+from simulation.llm_stub import StubConfig, create_app
+from llm_client import LLMClient
+
+class TestLLMStub(unittest.TestCase):
+    def completion(self, config, prompt="Summarize the grid.", max_tokens=50):
+        client = TestClient(create_app(config))
+        return client.post("/v1/chat/completions", json={
+            "model": "stub",
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens
+        })
+
+    def test_openai_shaped_response_with_usage(self):
+        response = self.completion(StubConfig(latency_ms=1, tokens_per_second=1e6))
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["object"], "chat.completion")
+        self.assertTrue(body["choices"][0]["message"]["content"])
+        self.assertGreater(body["usage"]["completion_tokens"], 0)
+
+    def test_error_injection(self):
+        response = self.completion(StubConfig(latency_ms=1, error_rate=1.0))
+        self.assertIn(response.status_code, (429, 500, 503))
+
+    def test_batch_prompt_returns_parseable_json(self):
+        prompt = ("- Agent: Leeds | City: Leeds\n- Agent: York | City: York\n"
+                  "Respond with JSON only, in exactly this shape:\n"
+                  '{"summaries": {"<agent name>": "<summary>"}, "ranking": "<ranking text>"}')
+        response = self.completion(StubConfig(latency_ms=1, tokens_per_second=1e6), prompt=prompt)
+        parsed = LLMClient._parse_region_batch(response.json()["choices"][0]["message"]["content"])
+        self.assertEqual(set(parsed["summaries"]), {"Leeds", "York"})
+        self.assertTrue(parsed["ranking"].startswith("1. Leeds"))
+
+    def test_seeded_latency_is_reproducible(self):
+        first = create_app(StubConfig(seed=7)).state.stub
+        second = create_app(StubConfig(seed=7)).state.stub
+        self.assertEqual([first.sample_latency() for _ in range(5)], [second.sample_latency() for _ in range(5)])
+
+if __name__ == '__main__':
+    unittest.main()
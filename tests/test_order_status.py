@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock
+import threading
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from beckn_client import BecknClient
+from order_status import OrderStatusChecker, get_order_status_checker
+
+class SlowStatusClient:
+    """Beckn status stand-in with a fixed round trip that tracks concurrency."""
+
+    def __init__(self, latency=0.05, state="CONFIRMED"):
+        self.latency = latency
+        self.state = state
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def status(self, transaction_id, bpp_id, bpp_uri, order_id):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return {"message": {"order": {"beckn:id": order_id, "beckn:orderStatus": self.state}}}
+
+class TestOrderStatusChecker(unittest.TestCase):
+    def test_orders_are_checked_concurrently(self):
+        client = SlowStatusClient()
+        checker = OrderStatusChecker(client, deadline_seconds=5.0)
+
+        start = time.monotonic()
+        states = checker.check([f"order-{i}" for i in range(16)], "bpp", "http://bpp")
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(set(states.values()), {"CONFIRMED"})
+        self.assertGreater(client.max_in_flight, 1)
+        # 16 serial round trips would take 0.8s
+        self.assertLess(elapsed, client.latency * 8)
+
+    def test_known_states_are_not_repolled(self):
+        client = SlowStatusClient(latency=0)
+        checker = OrderStatusChecker(client, ttl_seconds=60.0)
+
+        checker.check(["order-1", "order-2"], "bpp", "http://bpp")
+        states = checker.check(["order-1", "order-2", "order-3"], "bpp", "http://bpp")
+
+        self.assertEqual(len(states), 3)
+        self.assertEqual(client.calls, 3)
+        self.assertEqual(checker.cache_hits, 2)
+
+        checker.forget("order-1")
+        checker.check(["order-1"], "bpp", "http://bpp")
+        self.assertEqual(client.calls, 4)
+
+    def test_deadline_reports_unknown(self):
+        client = SlowStatusClient(latency=0.5)
+        checker = OrderStatusChecker(client, deadline_seconds=0.05)
+
+        start = time.monotonic()
+        states = checker.check(["order-1"], "bpp", "http://bpp")
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(states, {"order-1": None})
+        self.assertEqual(checker.timeouts, 1)
+
+    def test_unreachable_bpp_is_not_cached(self):
+        client = SlowStatusClient(latency=0, state="UNKNOWN")
+        checker = OrderStatusChecker(client)
+
+        checker.check(["order-1"], "bpp", "http://bpp")
+        checker.check(["order-1"], "bpp", "http://bpp")
+
+        self.assertEqual(client.calls, 2)
+
+    def test_default_deadline_covers_the_client_timeout(self):
+        client = SlowStatusClient(latency=0)
+        client.timeout = 7.5
+        self.assertEqual(OrderStatusChecker(client).deadline_seconds, 7.5)
+        self.assertEqual(OrderStatusChecker(BecknClient(base_url="http://beckn.invalid", timeout=4.0)).deadline_seconds, 4.0)
+
+    def test_expired_states_are_evicted(self):
+        client = SlowStatusClient(latency=0)
+        checker = OrderStatusChecker(client, ttl_seconds=0.05)
+
+        checker.check(["order-1", "order-2"], "bpp", "http://bpp")
+        self.assertEqual(checker.stats()["cached_states"], 2)
+        time.sleep(0.1)
+        checker.check(["order-3"], "bpp", "http://bpp")
+        self.assertEqual(checker.stats()["cached_states"], 1)
+
+    def test_shared_per_client(self):
+        client = MagicMock()
+        self.assertIs(get_order_status_checker(client), get_order_status_checker(client))
+        self.assertIsNot(get_order_status_checker(client), get_order_status_checker(MagicMock()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import asyncio
+import itertools
+from datetime import datetime, timedelta
+import sys
+import os
+
+import numpy as np
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from placement_solver import placement_costs, solve_placement
+from agents.global_agent import GlobalAgent
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_models import ComputeJob
+
+NOW = datetime(2025, 1, 1, 12, 0)
+
+def make_job(job_id, runtime=1.0, priority=1, deadline_hrs=None):
+    job = ComputeJob(job_id=job_id, priority=priority, estimated_runtime_hrs=runtime, num_computations=100)
+    if deadline_hrs is not None:
+        job.must_start_by = NOW + timedelta(hours=deadline_hrs)
+    return job
+
+def total_cost(costs, defer_costs, assignment):
+    return sum(defer_costs[i] if site < 0 else costs[i, site] for i, site in enumerate(assignment))
+
+def brute_force(costs, capacities, defer_costs):
+    n_jobs, n_agents = costs.shape
+    best = np.inf
+    for combo in itertools.product(range(-1, n_agents), repeat=n_jobs):
+        used = np.bincount([site for site in combo if site >= 0], minlength=n_agents)
+        if (used <= capacities).all():
+            best = min(best, total_cost(costs, defer_costs, combo))
+    return best
+
+class FakeAsyncBeckn:
+    async def aselect(self, *args, **kwargs):
+        return {"message": {"order": {}}}
+
+    async def ainit(self, *args, **kwargs):
+        return {"message": {"order": {}}}
+
+    async def aconfirm(self, *args, **kwargs):
+        await asyncio.sleep(0)
+        return {"message": {"order": {"beckn:orderStatus": "CONFIRMED", "beckn:id": "order_1"}}}
+
+class TestPlacementSolver(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            n_jobs, n_agents = rng.integers(1, 7), rng.integers(1, 4)
+            costs = rng.integers(0, 50, (n_jobs, n_agents)).astype(float)
+            costs[rng.random((n_jobs, n_agents)) < 0.2] = np.inf
+            capacities = rng.integers(0, 3, n_agents)
+            defer_costs = rng.integers(10, 80, n_jobs).astype(float)
+
+            assignment = solve_placement(costs, capacities, defer_costs)
+
+            used = np.bincount(assignment[assignment >= 0], minlength=n_agents)
+            self.assertTrue((used <= capacities).all())
+            self.assertTrue(np.isfinite(total_cost(costs, defer_costs, assignment)))
+            self.assertAlmostEqual(total_cost(costs, defer_costs, assignment), brute_force(costs, capacities, defer_costs))
+
+    def test_cheapest_sites_go_to_longest_jobs(self):
+        # Queue order puts the short job first; greedy would give it the cheap site
+        cheap, pricey = MagicMock(cost_score=10.0, available_capacity=1), MagicMock(cost_score=60.0, available_capacity=5)
+        jobs = [make_job("short", runtime=1.0, priority=5), make_job("long", runtime=8.0, priority=5)]
+        costs, capacities, defer_costs = placement_costs(jobs, [(cheap, 70.0), (pricey, 70.0)], now=NOW)
+
+        assignment = solve_placement(costs, capacities, defer_costs)
+
+        self.assertEqual(list(assignment), [1, 0])
+        greedy = 10.0 * 1.0 + 60.0 * 8.0
+        self.assertEqual(total_cost(costs, defer_costs, assignment), 10.0 * 8.0 + 60.0 * 1.0)
+        self.assertLess(total_cost(costs, defer_costs, assignment), greedy)
+
+    def test_threshold_and_urgency_decide_deferral(self):
+        site = MagicMock(cost_score=40.0, available_capacity=1)
+        too_expensive = MagicMock(cost_score=90.0, available_capacity=10)
+        unscored = MagicMock(cost_score=None, available_capacity=10)
+        jobs = [
+            make_job("relaxed", priority=1, deadline_hrs=24),
+            make_job("urgent", priority=1, deadline_hrs=0.5),
+            make_job("important", priority=2, deadline_hrs=24),
+        ]
+        costs, capacities, defer_costs = placement_costs(
+            jobs, [(site, 70.0), (too_expensive, 70.0), (unscored, 70.0)], now=NOW
+        )
+
+        self.assertTrue(np.isinf(costs[:, 1:]).all())
+        self.assertEqual(list(solve_placement(costs, capacities, defer_costs)), [-1, 0, -1])
+
+class TestSolvedPlacement(unittest.TestCase):
+    def setUp(self):
+        self.global_agent = GlobalAgent()
+        generator = DataGenerator()
+        self.agents = {}
+        for region_name, sites in (("North", [("Leeds", 50.0), ("Glasgow", 20.0)]), ("South", [("Bristol", 30.0), ("Oxford", 95.0)])):
+            region = RegionalAgent(f"{region_name} Regional", region_name)
+            for name, score in sites:
+                agent = LocalAgent(name, region_name, generator)
+                agent.cost_score = score
+                agent.total_capacity = 2
+                agent.available_capacity = 2
+                agent.beckn_client = FakeAsyncBeckn()
+                region.register_local_agent(agent)
+                self.agents[name] = agent
+            self.global_agent.register_regional_agent(region)
+
+    def test_backlog_fills_cheapest_sites_first(self):
+        agents = self.agents
+        jobs = [make_job(f"job_{i}", runtime=float(i + 1)) for i in range(8)]
+        outcomes = self.global_agent._place_jobs_solved(jobs)
+
+        self.assertEqual(outcomes.count("assigned"), 6)
+        self.assertEqual(outcomes.count("requeue"), 2)
+        self.assertEqual(sorted(agents["Glasgow"].current_jobs), ["job_6", "job_7"])
+        self.assertEqual(sorted(agents["Bristol"].current_jobs), ["job_4", "job_5"])
+        self.assertEqual(sorted(agents["Leeds"].current_jobs), ["job_2", "job_3"])
+        self.assertEqual(agents["Oxford"].current_jobs, {})
+
+    def run_cycle(self):
+        with patch("agents.global_agent.get_discovery_service"), \
+                patch.object(RegionalAgent, "process_discovery_result"), patch.object(RegionalAgent, "aggregate_data"):
+            self.global_agent.optimize_and_assign()
+
+    def test_only_most_urgent_jobs_up_to_free_slots_leave_the_queue(self):
+        for name in ("Leeds", "Bristol", "Oxford"):
+            self.agents[name].available_capacity = 0
+        for i in range(5):
+            self.global_agent.add_task_to_queue(make_job(f"job_{i}", priority=5 - i))
+
+        with patch("agents.global_agent.solve_placement", wraps=solve_placement) as solver:
+            self.run_cycle()
+
+        self.assertEqual(solver.call_args.args[0].shape, (2, 4))
+        self.assertEqual(sorted(self.agents["Glasgow"].current_jobs), ["job_0", "job_1"])
+        # The rest stay queued, and were never looked at
+        self.assertEqual([job.job_id for job in self.global_agent.task_queue.drain()], ["job_2", "job_3", "job_4"])
+        processed = [log["message"] for log in self.global_agent.logs if log["message"].startswith("Processing job")]
+        self.assertEqual(len(processed), 2)
+
+    def test_batch_is_capped(self):
+        self.global_agent.solver_max_batch = 1
+        for i in range(3):
+            self.global_agent.add_task_to_queue(make_job(f"job_{i}", priority=5 - i))
+
+        with patch("agents.global_agent.solve_placement", wraps=solve_placement) as solver:
+            self.run_cycle()
+
+        self.assertEqual(solver.call_args.args[0].shape, (1, 4))
+        self.assertEqual(len(self.global_agent.task_queue), 2)
+
+    def test_single_job_uses_the_regional_path(self):
+        # The solver's choice goes through the region, which hedges and falls back as usual
+        self.global_agent.add_task_to_queue(make_job("job_0"))
+        north = self.global_agent.regional_agents[0]
+        with patch.object(RegionalAgent, "assign_job_async", autospec=True,
+                          side_effect=RegionalAgent.assign_job_async) as assign:
+            self.run_cycle()
+
+        assign.assert_called_once()
+        self.assertIs(assign.call_args.args[0], north)
+        self.assertIs(assign.call_args.kwargs["preferred"], self.agents["Glasgow"])
+        self.assertIn("job_0", self.agents["Glasgow"].current_jobs)
+
+if __name__ == '__main__':
+    unittest.main()
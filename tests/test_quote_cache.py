@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.local_agent import LocalAgent
+from simulation.data_generator import DataGenerator
+from beckn_client import BecknClient
+from beckn_models import ComputeJob
+from quote_cache import QuoteCache
+
+def make_job(job_id, runtime=1.0, priority=1):
+    return ComputeJob(job_id=job_id, priority=priority, estimated_runtime_hrs=runtime, num_computations=100)
+
+class TestQuoteCache(unittest.TestCase):
+    def setUp(self):
+        self.agent = LocalAgent("Leeds", "UK-North", DataGenerator())
+        self.agent.total_capacity = 10
+        self.agent.available_capacity = 10
+        # Real payload builders, no network: _post returning None falls back to mock responses
+        self.client = BecknClient(base_url="http://beckn.invalid")
+        self.client._post = MagicMock(return_value=None)
+        self.agent.beckn_client = self.client
+
+    def actions(self):
+        return [call.args[0] for call in self.client._post.call_args_list]
+
+    def negotiate(self, job):
+        """Caches a selected and initialized, unconfirmed quote for the agent's slot."""
+        item_id = f"slot_{self.agent.node.node_id}"
+        select_res = self.client.select("txn_quote", "Leeds", "https://Leeds/bpp", item_id, "Leeds")
+        init_res = self.client.init("txn_quote", "Leeds", "https://Leeds/bpp",
+                                    select_res["message"]["order"], job=job)
+        self.agent.quote_cache.put("Leeds", item_id, job, "txn_quote", init_res["message"]["order"])
+        self.client._post.reset_mock()
+
+    def test_negotiated_quote_only_confirms_once(self):
+        self.negotiate(make_job("job_0"))
+        self.assertTrue(self.agent.assign_job(make_job("job_1")))
+        self.assertEqual(self.actions(), ["confirm"])
+        self.assertEqual(self.client._post.call_args_list[0].args[1]["context"]["transaction_id"], "txn_quote")
+
+        # The quote carries the job's own, localized fulfillment
+        confirmed = self.client._post.call_args_list[0].args[1]["message"]["order"]
+        delivery = confirmed["beckn:fulfillment"]["beckn:deliveryAttributes"]
+        self.assertEqual(delivery["beckn:workloadMetadata"]["workloadId"], "job_1")
+        self.assertEqual(delivery["beckn:location"]["address"]["addressLocality"], "Leeds")
+
+        # Used up: the next job negotiates its own transaction
+        self.assertTrue(self.agent.assign_job(make_job("job_2")))
+        self.assertEqual(self.actions(), ["confirm", "select", "init", "confirm"])
+        self.assertNotEqual(self.client._post.call_args_list[-1].args[1]["context"]["transaction_id"], "txn_quote")
+
+    def test_confirmed_orders_are_not_cached(self):
+        self.agent.assign_job(make_job("job_1"))
+        self.agent.assign_job(make_job("job_2"))
+
+        self.assertEqual(self.actions(), ["select", "init", "confirm"] * 2)
+        self.assertEqual(self.agent.quote_cache.stats()["size"], 0)
+
+    def test_different_job_shape_needs_new_quote(self):
+        self.negotiate(make_job("job_0", runtime=1.0))
+        self.agent.assign_job(make_job("job_2", runtime=4.0))
+
+        self.assertEqual(self.actions(), ["select", "init", "confirm"])
+        self.assertEqual(self.agent.quote_cache.stats()["size"], 1)
+
+    def test_discovery_change_invalidates_quotes(self):
+        cache = self.agent.quote_cache
+        item_id = f"slot_{self.agent.node.node_id}"
+        cache.observe_listing("Leeds", item_id, 0.12, 20)
+        self.negotiate(make_job("job_0"))
+
+        self.assertFalse(cache.observe_listing("Leeds", item_id, 0.12, 20))
+        self.assertIsNotNone(cache.peek("Leeds", item_id, make_job("job_2")))
+        self.assertTrue(cache.observe_listing("Leeds", item_id, 0.19, 20))
+        self.assertIsNone(cache.peek("Leeds", item_id, make_job("job_2")))
+
+        self.agent.assign_job(make_job("job_2"))
+        self.assertEqual(self.actions().count("select"), 1)
+
+    def test_rejected_quote_falls_back_to_full_lifecycle(self):
+        self.negotiate(make_job("job_0"))
+        rejected = {"message": {"order": {"beckn:orderStatus": "CANCELLED"}}}
+        self.client._post = MagicMock(side_effect=[rejected, None, None, None])
+
+        self.assertTrue(self.agent.assign_job(make_job("job_2")))
+        self.assertEqual(self.actions(), ["confirm", "select", "init", "confirm"])
+
+    def test_quotes_expire(self):
+        cache = QuoteCache(ttl_seconds=0.0)
+        job = make_job("job_1")
+        cache.put("Leeds", "slot", job, "txn", {"beckn:id": "order"})
+        self.assertIsNone(cache.get("Leeds", "slot", job))
+
+        cache = QuoteCache(ttl_seconds=60.0)
+        cache.put("Leeds", "slot", job, "txn", {"beckn:id": "order"})
+        self.assertEqual(cache.get("Leeds", "slot", make_job("job_2")).transaction_id, "txn")
+        self.assertIsNone(cache.get("Leeds", "slot", make_job("job_3")))
+        self.assertEqual(cache.stats()["hits"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_client import BecknClient
+from beckn_models import ComputeJob
+from quote_prefetcher import QuotePrefetcher
+
+def make_job(job_id, runtime=1.0, priority=1):
+    return ComputeJob(job_id=job_id, priority=priority, estimated_runtime_hrs=runtime, num_computations=100)
+
+class TestQuotePrefetcher(unittest.TestCase):
+    def setUp(self):
+        # Real payload builders, no network: _post/_apost returning None fall back to mock responses
+        self.client = BecknClient(base_url="http://beckn.invalid")
+        self.client._post = MagicMock(return_value=None)
+        self.client._apost = AsyncMock(return_value=None)
+
+        generator = DataGenerator()
+        self.region = RegionalAgent(name="North UK Regional", region="North UK")
+        for name, score in (("Leeds", 30.0), ("Manchester", 10.0), ("Glasgow", 20.0)):
+            agent = LocalAgent(name, "North UK", generator)
+            agent.total_capacity = 10
+            agent.available_capacity = 10
+            agent.cost_score = score
+            agent.beckn_client = self.client
+            self.region.register_local_agent(agent)
+        self.agents = {agent.name: agent for agent in self.region.local_agents}
+        self.prefetcher = QuotePrefetcher([self.region], top_k=1, seed_jobs=[make_job("seed")])
+
+    def actions(self):
+        return [call.args[0] for call in self.client._post.call_args_list + self.client._apost.call_args_list]
+
+    def test_cheapest_agents_with_capacity_are_candidates(self):
+        self.assertEqual([agent.name for agent in self.prefetcher.candidates()], ["Manchester"])
+
+        self.agents["Manchester"].available_capacity = 0
+        self.assertEqual([agent.name for agent in self.prefetcher.candidates()], ["Glasgow"])
+
+    def test_prefetched_quote_leaves_only_confirm(self):
+        self.assertEqual(self.prefetcher.refresh_once(), 1)
+        self.assertEqual(self.actions(), ["select", "init"])
+
+        # Still fresh: the next pass negotiates nothing
+        self.assertEqual(self.prefetcher.refresh_once(), 0)
+
+        self.client._post.reset_mock()
+        self.client._apost.reset_mock()
+        self.assertTrue(self.agents["Manchester"].assign_job(make_job("job_1")))
+        self.assertEqual(self.actions(), ["confirm"])
+
+    def test_prefetched_quote_serves_one_confirm_and_is_refilled(self):
+        self.prefetcher._run = MagicMock()  # Drive passes by hand
+        self.prefetcher.start()
+        self.prefetcher.refresh_once()
+        self.prefetcher._wake_event.clear()
+        agent = self.agents["Manchester"]
+
+        self.client._apost.reset_mock()
+        self.assertTrue(agent.assign_job(make_job("job_1")))
+        self.assertTrue(agent.assign_job(make_job("job_2")))
+        self.assertEqual(self.actions(), ["confirm", "select", "init", "confirm"])
+
+        # Taking the quote woke the worker, whose next pass negotiates a new one
+        self.assertTrue(self.prefetcher._wake_event.is_set())
+        self.assertEqual(self.prefetcher.refresh_once(), 1)
+        self.client._post.reset_mock()
+        self.client._apost.reset_mock()
+        self.assertTrue(agent.assign_job(make_job("job_3")))
+        self.assertEqual(self.actions(), ["confirm"])
+
+        self.prefetcher.stop()
+        self.assertIsNone(agent.quote_cache.on_consumed)
+
+    def test_recent_job_shapes_are_kept(self):
+        self.prefetcher.note_job(make_job("job_1", runtime=4.0))
+        self.prefetcher.note_job(make_job("job_2", runtime=2.0, priority=5))
+        windowed = make_job("job_3")
+        windowed.start_time_earliest = datetime.now()
+        self.prefetcher.note_job(windowed)
+
+        self.assertEqual(self.prefetcher.stats()["shapes"], 2)
+        self.prefetcher.refresh_once()
+        self.assertEqual(self.actions().count("select"), 2)
+        cache = self.agents["Manchester"].quote_cache
+        item_id = f"slot_{self.agents['Manchester'].node.node_id}"
+        self.assertIsNotNone(cache.peek("Manchester", item_id, make_job("x", runtime=4.0)))
+        self.assertIsNone(cache.peek("Manchester", item_id, make_job("x")))
+
+    def test_discovery_updates_listings_and_wakes_worker(self):
+        self.prefetcher.refresh_once()
+        agent = self.agents["Manchester"]
+        item_id = f"slot_{agent.node.node_id}"
+
+        index = MagicMock()
+        index.location.return_value = {"item_id": "item", "available_capacity": 20}
+        index.price.return_value = 0.12
+        self.prefetcher.on_discovery({}, index)
+        self.assertIsNotNone(agent.quote_cache.peek("Manchester", item_id, make_job("x")))
+        self.assertTrue(self.prefetcher._wake_event.is_set())
+
+        # A price move drops the quote and the next pass negotiates it again
+        index.price.return_value = 0.19
+        self.prefetcher.on_discovery({}, index)
+        self.assertIsNone(agent.quote_cache.peek("Manchester", item_id, make_job("x")))
+        self.assertEqual(self.prefetcher.refresh_once(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import MagicMock
+import asyncio
+import time
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.local_agent import LocalAgent
+from agents.regional_agent import RegionalAgent
+from simulation.data_generator import DataGenerator
+from beckn_models import ComputeJob
+from llm_client import LLMClient
+from summary_refresher import SummaryRefresher
+
+LLM_LATENCY = 0.2
+
+class TestRegionalSynthesis(unittest.TestCase):
+    def setUp(self):
+        self.generator = DataGenerator()
+        self.regional_agent = RegionalAgent("Regional_South", "UK-South")
+        self.regional_agent.llm_client = MagicMock()
+        self.regional_agent.llm_client.synthesize_regional_ranking.return_value = "1. Agent_0"
+        self.regional_agent.batch_synthesis = False
+
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def slow_summary(agent_data):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(LLM_LATENCY)
+            self.in_flight -= 1
+            return f"{agent_data['name']} summary"
+
+        for i in range(6):
+            agent = LocalAgent(f"Agent_{i}", "UK-South", self.generator)
+            agent.energy_data = {'price': 0.1, 'carbon_intensity': 100, 'renewable_mix': 50}
+            agent.cost_score = 40.0 + i
+            agent.llm_client = MagicMock()
+            agent.llm_client.asynthesize_agent_report.side_effect = slow_summary
+            self.regional_agent.register_local_agent(agent)
+
+    def test_summaries_run_concurrently(self):
+        start = time.monotonic()
+        self.regional_agent.aggregate_data()
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, LLM_LATENCY * 3)
+        self.assertEqual(len(self.regional_agent.aggregated_data["agent_summaries"]), 6)
+        for agent in self.regional_agent.local_agents:
+            agent.llm_client.synthesize_agent_report.assert_not_called()
+
+    def test_concurrency_is_bounded(self):
+        self.regional_agent.llm_concurrency = 2
+        self.regional_agent.aggregate_data()
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_assign_job_skips_llm(self):
+        for agent in self.regional_agent.local_agents:
+            agent.total_capacity = 10
+            agent.available_capacity = 10
+            agent.beckn_client = MagicMock()
+            agent.beckn_client.select.return_value = {"message": {"order": {}}}
+            agent.beckn_client.init.return_value = {"message": {"order": {}}}
+            agent.beckn_client.confirm.return_value = {"message": {"order": {"beckn:orderStatus": "CONFIRMED", "beckn:id": "order_1"}}}
+
+        job = ComputeJob(job_id="job_fast_path", priority=1, estimated_runtime_hrs=1.0, num_computations=100)
+        self.assertTrue(self.regional_agent.assign_job(job))
+        self.assertIn("job_fast_path", self.regional_agent.local_agents[0].current_jobs)
+        for agent in self.regional_agent.local_agents:
+            agent.llm_client.synthesize_agent_report.assert_not_called()
+            agent.llm_client.asynthesize_agent_report.assert_not_called()
+
+    def test_batch_synthesis_uses_one_completion(self):
+        self.regional_agent.batch_synthesis = True
+        self.regional_agent.llm_client.synthesize_region_batch.return_value = {
+            "summaries": {f"Agent_{i}": f"Agent_{i} batched summary" for i in range(6)},
+            "ranking": "1. Agent_0"
+        }
+
+        self.regional_agent.aggregate_data()
+        self.regional_agent.aggregate_data()
+
+        self.regional_agent.llm_client.synthesize_region_batch.assert_called_once()
+        self.regional_agent.llm_client.synthesize_regional_ranking.assert_not_called()
+        for agent in self.regional_agent.local_agents:
+            agent.llm_client.asynthesize_agent_report.assert_not_called()
+            agent.llm_client.synthesize_agent_report.assert_not_called()
+        data = self.regional_agent.aggregated_data
+        self.assertEqual(data["regional_ranking"], "1. Agent_0")
+        self.assertEqual(data["agent_summaries"][0]["summary"], "Agent_0 batched summary")
+
+    def test_background_refresher_keeps_llm_off_aggregation(self):
+        refresher = SummaryRefresher([self.regional_agent], max_staleness_seconds=60)
+        self.regional_agent.background_synthesis = True
+
+        self.regional_agent.aggregate_data()
+        for agent in self.regional_agent.local_agents:
+            agent.llm_client.asynthesize_agent_report.assert_not_called()
+        self.assertEqual(self.regional_agent.aggregated_data["agent_summaries"], [])
+
+        refresher.refresh_once()
+        data = self.regional_agent.aggregated_data
+        self.assertEqual(len(data["agent_summaries"]), 6)
+        self.assertEqual(data["regional_ranking"], "1. Agent_0")
+
+        # Unchanged state within the staleness budget is not refreshed again
+        self.assertFalse(self.regional_agent.needs_summary_refresh(60))
+        refresher.refresh_once()
+        self.regional_agent.llm_client.synthesize_regional_ranking.assert_called_once()
+
+        self.regional_agent.aggregate_data()
+        self.assertEqual(self.regional_agent.aggregated_data["local_agents"][0]["synthesized_summary"], "Agent_0 summary")
+
+    def test_ranking_narrated_only_when_order_changes(self):
+        self.regional_agent.aggregate_data()
+        narrate = self.regional_agent.llm_client.synthesize_regional_ranking
+        self.assertEqual(narrate.call_count, 1)
+        self.assertEqual(self.regional_agent.aggregated_data["ranking"][0], "Agent_0")
+
+        # Scores move but the order is unchanged: no new narration
+        for agent in self.regional_agent.local_agents:
+            agent.cost_score += 1.0
+        self.regional_agent.aggregate_data()
+        self.assertEqual(narrate.call_count, 1)
+
+        # Order changes: narrate again, with the numeric ranking in the request
+        self.regional_agent.local_agents[5].cost_score = 10.0
+        self.regional_agent.aggregate_data()
+        self.assertEqual(narrate.call_count, 2)
+        self.assertEqual(self.regional_agent.aggregated_data["ranking"][0], "Agent_5")
+        self.assertEqual(narrate.call_args[0][0]["ranking"][0]["agent_name"], "Agent_5")
+
+    def test_parse_region_batch(self):
+        response = 'Here you go:\n```json\n{"summaries": {"Agent_0": "Idle."}, "ranking": "1. Agent_0"}\n```'
+        parsed = LLMClient._parse_region_batch(response)
+        self.assertEqual(parsed, {"summaries": {"Agent_0": "Idle."}, "ranking": "1. Agent_0"})
+        self.assertIsNone(LLMClient._parse_region_batch("no json here"))
+
+if __name__ == '__main__':
+    unittest.main()
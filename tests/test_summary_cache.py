@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import datetime
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from agents.local_agent import LocalAgent
+from simulation.data_generator import DataGenerator
+from summary_cache import SummaryCache
+
+class TestSummaryCache(unittest.TestCase):
+    def setUp(self):
+        self.agent = LocalAgent("Agent_A", "UK-South", DataGenerator())
+        self.agent.llm_client = MagicMock()
+        self.agent.llm_client.synthesize_agent_report.return_value = "Agent_A is idle."
+        self.agent.energy_data = {'price': 0.101, 'carbon_intensity': 120, 'renewable_mix': 50}
+
+    def test_unchanged_state_hits_cache(self):
+        self.assertEqual(self.agent.synthesize_report(), "Agent_A is idle.")
+        self.assertEqual(self.agent.synthesize_report(), "Agent_A is idle.")
+        self.assertEqual(self.agent.llm_client.synthesize_agent_report.call_count, 1)
+        self.assertEqual(self.agent.summary_cache.hits, 1)
+
+    def test_noise_below_quantization_step_hits_cache(self):
+        self.agent.synthesize_report()
+        self.agent.energy_data['price'] = 0.1012
+        self.agent.synthesize_report()
+        self.assertEqual(self.agent.llm_client.synthesize_agent_report.call_count, 1)
+
+    def test_state_change_misses_cache(self):
+        self.agent.synthesize_report()
+        self.agent.energy_data['price'] = 0.20
+        self.agent.synthesize_report()
+        self.assertEqual(self.agent.llm_client.synthesize_agent_report.call_count, 2)
+
+    def test_ttl_expiry(self):
+        cache = SummaryCache(ttl_seconds=10)
+        with patch('summary_cache.time.monotonic', return_value=100.0):
+            cache.put("k", "summary")
+        with patch('summary_cache.time.monotonic', return_value=105.0):
+            self.assertEqual(cache.get("k"), "summary")
+        with patch('summary_cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_lru_eviction(self):
+        cache = SummaryCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # 'b' is now least recently used
+        cache.put("c", "3")
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()
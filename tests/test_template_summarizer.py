@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../backend')))
+
+from llm_client import LLMClient
+from template_summarizer import TemplateSummarizer, TemplateSummary
+
+def agent_state(name, price, carbon, renewable, active_tasks=0, available=1):
+    return {
+        "name": name,
+        "region": "South UK",
+        "location_data": {"locality": name, "available_capacity": 150},
+        "energy_data": {"price": price, "carbon_intensity": carbon, "renewable_mix": renewable},
+        "active_tasks_count": active_tasks,
+        "available_capacity": available
+    }
+
+class TestTemplateSummarizer(unittest.TestCase):
+    def setUp(self):
+        self.summarizer = TemplateSummarizer()
+        self.agents = [
+            agent_state("London", 0.15, 250, 30, active_tasks=3),
+            agent_state("Bristol", 0.09, 80, 70),
+            agent_state("Cambridge", 0.11, 150, 45),
+        ]
+
+    def test_agent_summary(self):
+        summary = self.summarizer.summarize_agent(self.agents[1])
+        self.assertIsInstance(summary, TemplateSummary)
+        self.assertIn("Bristol", summary)
+        self.assertIn("£0.090/kWh", summary)
+        self.assertIn("80 gCO2/kWh", summary)
+        self.assertIn("strong site", summary)
+
+    def test_price_spike_recommendation(self):
+        summary = self.summarizer.summarize_agent(agent_state("Leeds", 0.45, 120, 50))
+        self.assertIn("spiking", summary)
+
+    def test_ranking_prefers_cheap_clean_sites(self):
+        ranked = [a["name"] for a in self.summarizer.rank_agents(self.agents)]
+        self.assertEqual(ranked, ["Bristol", "Cambridge", "London"])
+        ranking = self.summarizer.rank_region("South UK", self.agents)
+        self.assertTrue(ranking.startswith("1. Bristol"))
+        self.assertIn("Top pick: Bristol", ranking)
+
+    def test_ranking_follows_numeric_order(self):
+        numeric = [{"agent_name": "London", "cost_score": 20.0}, {"agent_name": "Bristol", "cost_score": 30.0},
+                   {"agent_name": "Cambridge", "cost_score": 40.0}]
+        ranking = self.summarizer.rank_region("South UK", self.agents, numeric)
+        self.assertTrue(ranking.startswith("1. London"))
+        self.assertIn("Top pick: London has the lowest cost score", ranking)
+
+    def test_stale_ranking_falls_back_to_own_order(self):
+        stale = [{"agent_name": "Leeds", "cost_score": 20.0}]
+        ranking = self.summarizer.rank_region("South UK", self.agents, stale)
+        self.assertTrue(ranking.startswith("1. Bristol"))
+        self.assertIn("Top pick: Bristol offers", ranking)
+
+class TestSynthesisModes(unittest.TestCase):
+    def test_template_mode_never_calls_llm(self):
+        client = LLMClient(api_key="test-key", mode="template")
+        client.client = MagicMock()
+        result = client.synthesize_region_batch(
+            "South UK", [agent_state("Bristol", 0.09, 80, 70)],
+            ranking=[{"agent_name": "Bristol", "cost_score": 30.0}]
+        )
+        self.assertIn("Bristol", result["summaries"])
+        self.assertTrue(result["ranking"].startswith("1. Bristol"))
+        client.client.chat.completions.create.assert_not_called()
+
+    def test_hybrid_falls_back_when_llm_unavailable(self):
+        client = LLMClient(api_key="test-key", mode="hybrid")
+        client.client = MagicMock()
+        client.client.chat.completions.create.side_effect = ConnectionError("endpoint down")
+        summary = client.synthesize_agent_report(agent_state("Bristol", 0.09, 80, 70))
+        self.assertIsInstance(summary, TemplateSummary)
+
+    def test_llm_mode_returns_none_when_llm_unavailable(self):
+        client = LLMClient(api_key="test-key", mode="llm")
+        client.client = None
+        self.assertIsNone(client.synthesize_agent_report(agent_state("Bristol", 0.09, 80, 70)))
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            LLMClient(api_key="test-key", mode="fast")
+
+if __name__ == '__main__':
+    unittest.main()